@@ -1,17 +1,35 @@
-from typing import Tuple, Dict
-from graph import Graph
+from typing import Tuple, Dict, List, Optional
+from collections import deque
+from graph import Graph, Sources, source_offsets
 
-def bellman_ford_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class NegativeCycleError(ValueError):
+    """
+    Raised when a graph contains a negative-weight cycle. The cycle attribute holds the vertices of one such cycle in edge order,
+    i.e., cycle[i] -> cycle[i + 1] is an edge and so is cycle[-1] -> cycle[0].
+    """
+    def __init__(self, cycle: Optional[List[str]] = None):
+        super().__init__('Graph contains a negative-weight cycle')
+        self.cycle = cycle
+
+def bellman_ford_sssp(graph: Graph, source: Sources) -> Tuple[Dict[str, float], Dict[str, str]]:
     """
     Bellman-Ford algorithm for single-source shortest paths. This algorithm can detect negative-weight cycles.
 
     Parameters:
         graph (Graph): The graph to traverse.
-        source (str): The source vertex.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to their starting distance) to search from all of them at once.
 
     Returns:
         Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
 
+    Raises:
+        NegativeCycleError: If a negative-weight cycle is reachable from the source. The error carries the cycle.
+
     Time complexity: O(VE) where V is the number of vertices and E is the number of edges.
     Space complexity: O(V) where V is the number of vertices.
 
@@ -26,20 +44,300 @@ def bellman_ford_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict
     dist = {v: float('inf') for v in graph.vertices()}
     pred = {v: None for v in graph.vertices()}
 
-    # Set the source distance to 0
-    dist[source] = 0
+    # Set the source distances to their offsets (0 for a single source)
+    dist.update(source_offsets(source))
+
+    # Build the edge list once instead of once per round
+    edges = graph.edges()
 
     # Relax the edges repeatedly (V - 1 times). At every iteration, the shortest path with at most i edges is found.
     # i cannot be greater than V - 1 because the shortest path cannot have a cycle (unless it is negative-weight).
-    for _ in range(len(graph.vertices()) - 1):
-        for u, v, w in graph.edges():
+    for _ in range(len(dist) - 1):
+        updated = False
+        for u, v, w in edges:
             if dist[u] + w < dist[v]:
                 dist[v] = dist[u] + w
                 pred[v] = u
+                updated = True
+
+        # If a round makes no update, no later round will either
+        if not updated:
+            return dist, pred
 
     # Check for negative-weight cycles
-    for u, v, w in graph.edges():
+    for u, v, w in edges:
         if dist[u] + w < dist[v]:
-            raise ValueError('Graph contains a negative-weight cycle')
+            pred[v] = u
+            raise NegativeCycleError(get_predecessor_cycle(pred, v, len(dist)))
+
+    return dist, pred
+
+def edge_arrays(graph: Graph) -> Tuple[List[str], List[int], List[int], List[float]]:
+    """
+    Flatten the edges of a graph into three parallel arrays of source indices, destination indices and weights.
+
+    Parameters:
+        graph (Graph): The graph.
+
+    Returns:
+        Tuple[List[str], List[int], List[int], List[float]]: The vertices (defining the indices), and the src, dst and weight arrays.
+            Undirected edges appear once in each direction.
+
+    Time complexity: O(V + E) on top of graph.edges().
+    """
+    vertices = graph.vertices()
+    index = {v: i for i, v in enumerate(vertices)}
+    src, dst, weight = [], [], []
+
+    for u, v, w in graph.edges():
+        src.append(index[u])
+        dst.append(index[v])
+        weight.append(w)
+        if graph.undirected:
+            src.append(index[v])
+            dst.append(index[u])
+            weight.append(w)
+
+    return vertices, src, dst, weight
+
+def bellman_ford_edge_array_sssp(graph: Graph, source: Sources) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Bellman-Ford algorithm for single-source shortest paths over NumPy edge arrays. Every round relaxes all edges at once: the candidate
+    distances dist[src] + w are computed for the whole array from the previous round's distances and scatter-min'ed into dist with
+    np.minimum.at. The algorithm stops as soon as a round has no improving edge. Integer weights are relaxed in integer arithmetic, so
+    the distances keep the type of the weights.
+
+    If NumPy is not installed, the same arcs are relaxed one at a time by a Python loop.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to their starting distance) to search from all of them at once.
+
+    Returns:
+        Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
+
+    Raises:
+        NegativeCycleError: If a negative-weight cycle is reachable from the source. The error carries the cycle.
+
+    Time complexity: O(VE) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+
+    >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', 1), ('B', 'C', -2), ('C', 'D', 3)])
+    >>> dist, pred = bellman_ford_edge_array_sssp(graph, 'A')
+    >>> dist['D']
+    2
+    >>> pred['D']
+    'C'
+    """
+    vertices, src, dst, weight = edge_arrays(graph)
+    index = {v: i for i, v in enumerate(vertices)}
+    start = {index[vertex]: offset for vertex, offset in source_offsets(source).items()}
+
+    relax = _relax_edge_arrays_numpy if np is not None else _relax_edge_arrays
+    dist, pred, last_improved = relax(len(vertices), src, dst, weight, start)
+    named_pred = {vertices[v]: vertices[p] if p is not None else None for v, p in enumerate(pred)}
+
+    # A V-th round that still improved a distance means there is a negative-weight cycle
+    if last_improved is not None:
+        raise NegativeCycleError(get_predecessor_cycle(named_pred, vertices[last_improved], len(vertices)))
+
+    return dict(zip(vertices, dist)), named_pred
+
+def _relax_edge_arrays(n: int, src: List[int], dst: List[int], weight: List[float], start: Dict[int, float]) -> Tuple[List[float], List[Optional[int]], Optional[int]]:
+    """
+    Relax the arcs of the edge arrays in V rounds of a Python loop. Returns the distances, the predecessors, and a vertex improved in the
+    V-th round (None if the search settled before it).
+    """
+    dist = [float('inf')] * n
+    pred = [None] * n
+    for v, offset in start.items():
+        dist[v] = offset
+
+    arcs = list(zip(src, dst, weight))
+    improved = None
+    for _ in range(n):
+        improved = None
+        for u, v, w in arcs:
+            if dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                pred[v] = u
+                improved = v
+        if improved is None:
+            break
+
+    return dist, pred, improved
+
+def _relax_edge_arrays_numpy(n: int, src: List[int], dst: List[int], weight: List[float], start: Dict[int, float]) -> Tuple[List[float], List[Optional[int]], Optional[int]]:
+    """
+    Relax the arcs of the edge arrays in V vectorised rounds. Returns the distances, the predecessors, and a vertex improved in the
+    V-th round (None if the search settled before it).
+    """
+    # Integer weights use an int64 array with a large sentinel for unreached vertices, so the distances stay exact integers
+    integral = all(isinstance(x, int) for x in weight) and all(isinstance(x, int) for x in start.values())
+    unreached = np.iinfo(np.int64).max // 2 if integral else np.inf
+    dtype = np.int64 if integral else float
+
+    src = np.array(src, dtype=np.intp)
+    dst = np.array(dst, dtype=np.intp)
+    weight = np.array(weight, dtype=dtype)
+    dist = np.full(n, unreached, dtype=dtype)
+    pred = np.full(n, -1, dtype=np.intp)
+    for v, offset in start.items():
+        dist[v] = offset
+
+    # After round i, dist holds the shortest distances over paths with at most i edges, so V - 1 rounds suffice without negative cycles
+    improving = np.zeros(0, dtype=np.intp)
+    for _ in range(n):
+        source_dist = dist[src]
+        candidates = source_dist + weight
+        improving = np.flatnonzero((source_dist < unreached) & (candidates < dist[dst]))
+        if improving.size == 0:
+            break
+
+        # Scatter-min the improving candidates into their destinations, then take the predecessor from an edge that achieved the minimum
+        updated = dist.copy()
+        np.minimum.at(updated, dst[improving], candidates[improving])
+        winners = improving[candidates[improving] == updated[dst[improving]]]
+        pred[dst[winners]] = src[winners]
+        dist = updated
+
+    distances = [d if d < unreached else float('inf') for d in dist.tolist()]
+    predecessors = [p if p >= 0 else None for p in pred.tolist()]
+    return distances, predecessors, int(dst[improving[-1]]) if improving.size else None
+
+def spfa_sssp(graph: Graph, source: Sources) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Queue-based Bellman-Ford (shortest path faster algorithm) for single-source shortest paths. Only vertices whose distance changed are
+    kept in a FIFO queue and have their outgoing edges relaxed, so the algorithm stops as soon as no distance changes.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to their starting distance) to search from all of them at once.
+
+    Returns:
+        Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
+
+    Raises:
+        NegativeCycleError: If a negative-weight cycle is reachable from the source. The error carries the cycle.
+
+    Time complexity: O(VE) in the worst case, but typically close to O(E) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V) where V is the number of vertices.
+
+    >>> graph = Graph(['A', 'B', 'C'], [('A', 'B', 1), ('B', 'C', -2), ('C', 'A', -1)])
+    >>> try:
+    ...     spfa_sssp(graph, 'A')
+    ... except NegativeCycleError as error:
+    ...     sorted(error.cycle)
+    ['A', 'B', 'C']
+    """
+    # Initialize distance and predecessor dictionaries
+    dist = {v: float('inf') for v in graph.vertices()}
+    pred = {v: None for v in graph.vertices()}
+
+    # Set the source distances to their offsets (0 for a single source)
+    offsets = source_offsets(source)
+    dist.update(offsets)
+
+    spfa_relax(graph, dist, pred, list(offsets))
+    return dist, pred
+
+def find_negative_cycle(graph: Graph) -> Optional[List[str]]:
+    """
+    Find a negative-weight cycle anywhere in the graph (not only one reachable from a given source).
+
+    Parameters:
+        graph (Graph): The graph to search.
+
+    Returns:
+        Optional[List[str]]: The vertices of a negative-weight cycle in edge order, or None if there is no negative-weight cycle.
+
+    Time complexity: O(VE) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V) where V is the number of vertices.
+
+    >>> find_negative_cycle(Graph(['A', 'B'], [('A', 'B', 1), ('B', 'A', -2)]))
+    ['A', 'B']
+    >>> find_negative_cycle(Graph(['A', 'B'], [('A', 'B', 1), ('B', 'A', 2)])) is None
+    True
+    """
+    # Searching from every vertex at once is equivalent to a virtual source with a zero-weight edge to every vertex
+    try:
+        spfa_sssp(graph, graph.vertices())
+    except NegativeCycleError as error:
+        return error.cycle
+
+    return None
+
+def spfa_relax(graph: Graph, dist: Dict[str, float], pred: Dict[str, Optional[str]], changed: List[str]) -> None:
+    """
+    Relax edges out of a FIFO queue of vertices whose distance changed until no distance changes anymore. Updates dist and pred in place.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        dist (Dict[str, float]): The current distance estimates.
+        pred (Dict[str, Optional[str]]): The current predecessors.
+        changed (List[str]): The vertices whose outgoing edges must be relaxed first.
+
+    Raises:
+        NegativeCycleError: If relaxing never settles because of a negative-weight cycle. The error carries the cycle.
+
+    Time complexity: O(VE) where V is the number of vertices and E is the number of edges.
+    """
+    n = len(dist)
+
+    # hops[v] is the number of edges on the current path to v. A shortest path has at most V - 1 edges, so reaching V edges means a cycle.
+    hops = {v: 0 for v in changed}
+    queue = deque(changed)
+    in_queue = set(changed)
+
+    while queue:
+        u = queue.popleft()
+        in_queue.discard(u)
+
+        for v, w in graph.neighbors(u):
+            if dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                pred[v] = u
+                hops[v] = hops[u] + 1
+
+                if hops[v] >= n:
+                    # The predecessor pointers may have moved since the hop counts were recorded, so confirm the cycle by walking them
+                    cycle = get_predecessor_cycle(pred, v, n)
+                    if cycle is not None:
+                        raise NegativeCycleError(cycle)
+
+                if v not in in_queue:
+                    queue.append(v)
+                    in_queue.add(v)
+
+def get_predecessor_cycle(pred: Dict[str, Optional[str]], vertex: str, num_vertices: int) -> Optional[List[str]]:
+    """
+    Find the cycle in the predecessor graph that is reached by following predecessors from a vertex. During Bellman-Ford, any cycle
+    formed by the predecessor pointers is a negative-weight cycle.
+
+    Parameters:
+        pred (Dict[str, Optional[str]]): The predecessor of each vertex.
+        vertex (str): The vertex to start walking from.
+        num_vertices (int): The number of vertices in the graph.
+
+    Returns:
+        Optional[List[str]]: The vertices of the cycle in edge order, or None if the walk reaches a vertex without a predecessor.
+
+    Time complexity: O(V) where V is the number of vertices.
+    """
+    # After V steps the walk must be inside the cycle (if there is one)
+    for _ in range(num_vertices):
+        if pred[vertex] is None:
+            return None
+        vertex = pred[vertex]
+
+    cycle = [vertex]
+    current = pred[vertex]
+    while current != vertex:
+        if current is None:
+            return None
+        cycle.append(current)
+        current = pred[current]
 
-    return dist, pred
\ No newline at end of file
+    # The walk went backwards along the edges
+    cycle.reverse()
+    return cycle
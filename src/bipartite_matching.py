@@ -0,0 +1,155 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
+from graph import Graph
+from breadth_first_search import get_bipartition
+
+def hopcroft_karp_arrays(num_right: int, adjacency: List[List[int]]) -> Tuple[List[int], List[int]]:
+    """
+    Find a maximum matching in a bipartite graph given as adjacency lists from the left vertices 0..L-1 to the right vertices 0..R-1,
+    using the Hopcroft-Karp algorithm. Every phase finds the length of the shortest augmenting paths with a breadth-first search from
+    all free left vertices at once, then augments along a maximal set of vertex-disjoint shortest paths with an iterative depth-first
+    search that keeps a current-edge pointer per vertex.
+
+    Parameters:
+        num_right (int): The number of right vertices.
+        adjacency (List[List[int]]): The right neighbors of every left vertex.
+
+    Returns:
+        Tuple[List[int], List[int]]: The partner of every left vertex and of every right vertex (-1 if unmatched).
+
+    Time complexity: O(E * sqrt(V)) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V) where V is the number of vertices.
+
+    >>> hopcroft_karp_arrays(2, [[0, 1], [0]])
+    ([1, 0], [1, 0])
+    """
+    num_left = len(adjacency)
+    match_left = [-1] * num_left
+    match_right = [-1] * num_right
+
+    while True:
+        # Layer the left vertices by their alternating distance from the free left vertices
+        dist = [-1] * num_left
+        queue = deque()
+        for u in range(num_left):
+            if match_left[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+
+        # The layer of the first left vertex next to a free right vertex: shortest augmenting paths end there, so the search stops too
+        limit = -1
+        while queue:
+            u = queue.popleft()
+            if limit != -1 and dist[u] > limit:
+                break
+            for v in adjacency[u]:
+                w = match_right[v]
+                if w == -1:
+                    if limit == -1:
+                        limit = dist[u]
+                elif dist[w] == -1:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+
+        if limit == -1:
+            break
+
+        # Augment along shortest paths. stack holds the left vertices of the current path, and each one's current edge leads to the next.
+        current = [0] * num_left
+        for root in range(num_left):
+            if match_left[root] != -1:
+                continue
+
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                if current[u] == len(adjacency[u]):
+                    # Dead end: no shortest augmenting path goes through u in this phase
+                    dist[u] = -1
+                    stack.pop()
+                    if stack:
+                        current[stack[-1]] += 1
+                    continue
+
+                v = adjacency[u][current[u]]
+                w = match_right[v]
+                if w == -1 and dist[u] == limit:
+                    # Free right vertex at the end of a shortest path: flip the matching along the path. The path's vertices cannot
+                    # be reused in this phase, since the paths of a phase must be vertex-disjoint.
+                    for x in stack:
+                        y = adjacency[x][current[x]]
+                        match_left[x] = y
+                        match_right[y] = x
+                        dist[x] = -1
+                    break
+                if w != -1 and dist[u] < limit and dist[w] == dist[u] + 1:
+                    stack.append(w)
+                else:
+                    current[u] += 1
+
+    return match_left, match_right
+
+def hopcroft_karp(graph: Graph, left: Optional[Iterable[str]] = None) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Find a maximum matching in a bipartite graph with the Hopcroft-Karp algorithm, together with a minimum vertex cover (König's theorem).
+
+    Parameters:
+        graph (Graph): The bipartite graph. Edge directions are ignored.
+        left (Optional[Iterable[str]]): The vertices on one side of the bipartition. Default is to find a bipartition with get_bipartition.
+
+    Returns:
+        Tuple[Dict[str, str], Set[str]]: The partner of every matched left vertex, and a minimum vertex cover (its size equals the size of the matching).
+
+    Raises:
+        ValueError: If the graph is not bipartite, or an edge joins two vertices on the same side of the given bipartition.
+
+    Time complexity: O(E * sqrt(V)) on top of graph.edges(), where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+
+    >>> graph = Graph(['w1', 'w2', 'w3', 'j1', 'j2'], [('w1', 'j1'), ('w2', 'j1'), ('w3', 'j1'), ('w3', 'j2')])
+    >>> matching, cover = hopcroft_karp(graph, ['w1', 'w2', 'w3'])
+    >>> len(matching), sorted(cover)
+    (2, ['j1', 'w3'])
+    """
+    if left is None:
+        bipartition = get_bipartition(graph)
+        if bipartition is None:
+            raise ValueError("Graph is not bipartite")
+        left = bipartition[0]
+
+    left_side = set(left)
+    left_vertices = [v for v in graph.vertices() if v in left_side]
+    right_vertices = [v for v in graph.vertices() if v not in left_side]
+    left_index = {v: i for i, v in enumerate(left_vertices)}
+    right_index = {v: i for i, v in enumerate(right_vertices)}
+
+    adjacency: List[List[int]] = [[] for _ in left_vertices]
+    for u, v, _ in graph.edges():
+        if (u in left_side) == (v in left_side):
+            raise ValueError("Edge joins two vertices on the same side of the bipartition")
+        if v in left_side:
+            u, v = v, u
+        adjacency[left_index[u]].append(right_index[v])
+
+    match_left, match_right = hopcroft_karp_arrays(len(right_vertices), adjacency)
+
+    # König: the vertices reachable from free left vertices by alternating paths (Z) give the cover (left \ Z) + (right & Z)
+    reached_left = [match_left[u] == -1 for u in range(len(left_vertices))]
+    reached_right = [False] * len(right_vertices)
+    queue = deque(u for u in range(len(left_vertices)) if reached_left[u])
+    while queue:
+        u = queue.popleft()
+        for v in adjacency[u]:
+            if not reached_right[v] and v != match_left[u]:
+                reached_right[v] = True
+                # A reached right vertex is always matched, otherwise the matching would not be maximum
+                w = match_right[v]
+                if not reached_left[w]:
+                    reached_left[w] = True
+                    queue.append(w)
+
+    matching = {left_vertices[u]: right_vertices[v] for u, v in enumerate(match_left) if v != -1}
+    cover = {left_vertices[u] for u in range(len(left_vertices)) if not reached_left[u]}
+    cover |= {right_vertices[v] for v in range(len(right_vertices)) if reached_right[v]}
+
+    return matching, cover
@@ -1,6 +1,6 @@
-from typing import Dict, Callable, Optional, Tuple
-from graph import Graph
-from linked_queue import Queue
+from typing import Dict, Callable, Optional, Set, Tuple, List, Iterator, Iterable, Union
+from collections import deque
+from graph import Graph, Sources, source_offsets
 
 def breadth_first_search(graph: Graph, start: Optional[str] = None, callback: Optional[Callable[[str, Optional[str]], None]] = None) -> Dict[str, str]:
     """
@@ -20,20 +20,19 @@ def breadth_first_search(graph: Graph, start: Optional[str] = None, callback: Op
     parents = {vertex: None for vertex in graph.vertices()}
 
     def bfs_from_vertex(vertex: str):
-        queue = Queue()
-        queue.enqueue(vertex)
-
-        while not queue.is_empty():
-            current = queue.dequeue()
-            if not visited[current]:
-                visited[current] = True
-                if callback:
-                    callback(current, parents[current])
-                for neighbor, _ in graph.neighbors(current):
-                    if not visited[neighbor]:
-                        queue.enqueue(neighbor)
-                        if parents[neighbor] is None:
-                            parents[neighbor] = current
+        # Vertices are marked when they are discovered, so each one is enqueued at most once
+        visited[vertex] = True
+        queue = deque([vertex])
+
+        while queue:
+            current = queue.popleft()
+            if callback:
+                callback(current, parents[current])
+            for neighbor, _ in graph.neighbors(current):
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    parents[neighbor] = current
+                    queue.append(neighbor)
 
     if start is None:
         for vertex in graph.vertices():
@@ -44,13 +43,60 @@ def breadth_first_search(graph: Graph, start: Optional[str] = None, callback: Op
 
     return parents
 
-def bfs_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+def bfs_frontiers(graph: Graph, source: Sources, dist: Dict[str, float], pred: Dict[str, Optional[str]]) -> Iterator[List[str]]:
+    """
+    Level-synchronous breadth-first search engine. Yields the frontier of every level in order while filling in distances and predecessors.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to an integer starting distance).
+        dist (Dict[str, float]): The distance of every vertex, initialized to infinity. Filled in as vertices are discovered.
+        pred (Dict[str, Optional[str]]): The predecessor of every vertex, initialized to None. Filled in as vertices are discovered.
+
+    Yields:
+        List[str]: The vertices at each distance from the sources, in increasing order of distance.
+
+    Time complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V) where V is the number of vertices.
+    """
+    # Sources join the search at the level equal to their starting distance
+    seeds = sorted(source_offsets(source).items(), key=lambda seed: seed[1])
+    next_seed = 0
+    frontier = []
+    level = 0
+
+    while frontier or next_seed < len(seeds):
+        if not frontier:
+            level = seeds[next_seed][1]
+
+        while next_seed < len(seeds) and seeds[next_seed][1] <= level:
+            vertex = seeds[next_seed][0]
+            next_seed += 1
+            if dist[vertex] == float('inf'):
+                dist[vertex] = level
+                frontier.append(vertex)
+
+        yield frontier
+
+        # Expand the whole frontier, marking vertices as soon as they are discovered
+        next_frontier = []
+        for vertex in frontier:
+            for neighbor, _ in graph.neighbors(vertex):
+                if dist[neighbor] == float('inf'):
+                    dist[neighbor] = level + 1
+                    pred[neighbor] = vertex
+                    next_frontier.append(neighbor)
+
+        frontier = next_frontier
+        level += 1
+
+def bfs_sssp(graph: Graph, source: Sources) -> Tuple[Dict[str, float], Dict[str, str]]:
     """
     Breadth-first search (BFS) algorithm for single-source shortest paths.
 
     Parameters:
         graph (Graph): The graph to traverse.
-        source (str): The source vertex.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to an integer starting distance) to search from all of them at once.
 
     Returns:
         Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
@@ -66,40 +112,277 @@ def bfs_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str, str
     'C'
     """
     dist = {v: float('inf') for v in graph.vertices()}
-    dist[source] = 0
-    def record_distance(vertex: str, parent: Optional[str]) -> None:
-        if parent is not None:
-            dist[vertex] = dist[parent] + 1
-    pred = breadth_first_search(graph, source, record_distance)
+    pred = {v: None for v in graph.vertices()}
+
+    for _ in bfs_frontiers(graph, source, dist, pred):
+        pass
+
     return dist, pred
 
-def bfs_apsp(graph: Graph) -> Dict[str, Dict[str, int]]:
+def bfs_level_sizes(graph: Graph, source: Sources) -> List[int]:
+    """
+    Count the vertices at each distance from the source(s) using breadth-first search.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to an integer starting distance).
+
+    Returns:
+        List[int]: The number of vertices first reached at each level, in increasing order of distance (levels without any vertex are skipped).
+
+    Time complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V) where V is the number of vertices.
+
+    >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('A', 'C'), ('C', 'D')])
+    >>> bfs_level_sizes(graph, 'A')
+    [1, 2, 1]
+    """
+    dist = {v: float('inf') for v in graph.vertices()}
+    pred = {v: None for v in graph.vertices()}
+    return [len(frontier) for frontier in bfs_frontiers(graph, source, dist, pred) if frontier]
+
+def direction_optimizing_bfs_sssp(graph: Graph, source: Sources, alpha: float = 14, beta: float = 24) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Direction-optimizing breadth-first search for single-source shortest paths (Beamer et al.). Small frontiers are expanded top-down
+    (scanning the out-edges of the frontier). Once the frontier gets large, it is cheaper to go bottom-up: every unvisited vertex scans
+    its in-edges and stops at the first one coming from the frontier.
+
+    The distances are the same as those of bfs_sssp. The predecessors are on shortest paths too, but after a bottom-up level a vertex
+    can get a different parent than top-down search would have picked, since it keeps the first frontier vertex it finds.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to an integer starting distance).
+        alpha (float): Switch to bottom-up when the frontier's out-edges exceed 1/alpha of the unvisited vertices' out-edges. Default is 14.
+        beta (float): Switch back to top-down when the frontier has fewer than 1/beta of all vertices. Default is 24.
+
+    Returns:
+        Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
+
+    Time complexity: O(V + E) per top-down level and O(V + E) per bottom-up level, but bottom-up levels usually stop scanning early.
+    Space complexity: O(V + E) for the in-edge index, where V is the number of vertices and E is the number of edges.
+
+    >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'D')])
+    >>> dist, pred = direction_optimizing_bfs_sssp(graph, 'A')
+    >>> dist['D']
+    3
+    >>> pred['D']
+    'C'
+    """
+    vertices = graph.vertices()
+    n = len(vertices)
+    index = {v: i for i, v in enumerate(vertices)}
+
+    # Build the out-edge and in-edge indices once
+    out_edges = [[index[u] for u, _ in graph.neighbors(v)] for v in vertices]
+    in_edges = [[] for _ in vertices]
+    for v, neighbors in enumerate(out_edges):
+        for u in neighbors:
+            in_edges[u].append(v)
+
+    dist = [float('inf')] * n
+    pred = [None] * n
+
+    seeds = sorted(((index[v], offset) for v, offset in source_offsets(source).items()), key=lambda seed: seed[1])
+    next_seed = 0
+    frontier = []
+    level = 0
+    bottom_up = False
+
+    # Sum of the out-degrees of the unvisited vertices
+    unvisited_edges = sum(len(neighbors) for neighbors in out_edges)
+
+    while frontier or next_seed < len(seeds):
+        if not frontier:
+            level = seeds[next_seed][1]
+
+        while next_seed < len(seeds) and seeds[next_seed][1] <= level:
+            vertex = seeds[next_seed][0]
+            next_seed += 1
+            if dist[vertex] == float('inf'):
+                dist[vertex] = level
+                frontier.append(vertex)
+                unvisited_edges -= len(out_edges[vertex])
+
+        # Beamer's heuristic: go bottom-up while the frontier is heavy, and back top-down once it becomes small again
+        frontier_edges = sum(len(out_edges[v]) for v in frontier)
+        if not bottom_up and frontier_edges * alpha > unvisited_edges:
+            bottom_up = True
+        elif bottom_up and len(frontier) * beta < n:
+            bottom_up = False
+
+        next_frontier = []
+        if bottom_up:
+            # Frontier bitmap for constant-time membership checks
+            in_frontier = bytearray(n)
+            for v in frontier:
+                in_frontier[v] = 1
+
+            for v in range(n):
+                if dist[v] == float('inf'):
+                    for u in in_edges[v]:
+                        if in_frontier[u]:
+                            dist[v] = level + 1
+                            pred[v] = u
+                            next_frontier.append(v)
+                            break
+        else:
+            for u in frontier:
+                for v in out_edges[u]:
+                    if dist[v] == float('inf'):
+                        dist[v] = level + 1
+                        pred[v] = u
+                        next_frontier.append(v)
+
+        unvisited_edges -= sum(len(out_edges[v]) for v in next_frontier)
+        frontier = next_frontier
+        level += 1
+
+    return dict(zip(vertices, dist)), {vertices[v]: vertices[p] if p is not None else None for v, p in enumerate(pred)}
+
+def multi_source_bfs(graph: Graph, sources: Iterable[str]) -> Dict[str, Dict[str, float]]:
+    """
+    Bit-parallel multi-source breadth-first search (MS-BFS). Runs one BFS per source, but all of them at once: every vertex holds a
+    bitset (a Python int of arbitrary width) of the searches that have reached it, so each adjacency list is scanned once per level for
+    all sources together instead of once per source.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        sources (Iterable[str]): The source vertices, one BFS each.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The shortest distances from each source to all vertices.
+
+    Time complexity: O(D * (V + E) * S / w + S * V) where D is the diameter, S the number of sources and w the machine word size.
+    Space complexity: O(S * V) where S is the number of sources and V is the number of vertices.
+
+    >>> graph = Graph(['A', 'B', 'C'], [('A', 'B'), ('B', 'C')])
+    >>> multi_source_bfs(graph, ['A', 'B'])
+    {'A': {'A': 0, 'B': 1, 'C': 2}, 'B': {'A': inf, 'B': 0, 'C': 1}}
+    """
+    vertices = graph.vertices()
+    index = {v: i for i, v in enumerate(vertices)}
+    sources = list(dict.fromkeys(sources))
+
+    # Bit i of seen[v] is set once the BFS from sources[i] has reached v
+    seen = [0] * len(vertices)
+    visit = {}
+    rows = [[float('inf')] * len(vertices) for _ in sources]
+
+    for bit, source in enumerate(sources):
+        v = index[source]
+        seen[v] |= 1 << bit
+        visit[v] = visit.get(v, 0) | 1 << bit
+        rows[bit][v] = 0
+
+    out_edges = {}
+    level = 0
+
+    while visit:
+        level += 1
+        next_visit = {}
+
+        # Share each adjacency scan across every search that has u in its frontier
+        for u, searches in visit.items():
+            if u not in out_edges:
+                out_edges[u] = [index[v] for v, _ in graph.neighbors(vertices[u])]
+            for v in out_edges[u]:
+                new_searches = searches & ~seen[v]
+                if new_searches:
+                    next_visit[v] = next_visit.get(v, 0) | new_searches
+
+        for v, searches in next_visit.items():
+            seen[v] |= searches
+            # Record the distance for every search that reached v at this level
+            while searches:
+                lowest = searches & -searches
+                rows[lowest.bit_length() - 1][v] = level
+                searches ^= lowest
+
+        visit = next_visit
+
+    return {source: dict(zip(vertices, row)) for source, row in zip(sources, rows)}
+
+def bfs_apsp(graph: Graph, batch_size: Optional[int] = 64, stream: bool = False) -> Union[Dict[str, Dict[str, int]], Iterator[Tuple[str, Dict[str, int]]]]:
     """
-    Breadth-first search (BFS) algorithm for all-pairs shortest paths.
+    Breadth-first search (BFS) algorithm for all-pairs shortest paths. The sources are processed in batches with bit-parallel multi-source BFS.
 
     Parameters:
         graph (Graph): The graph to traverse.
+        batch_size (Optional[int]): The number of sources searched together. Default is 64; None searches from all vertices at once.
+        stream (bool): If True, return an iterator of (source, distances) rows that are produced batch by batch instead of one dictionary.
 
     Returns:
-        Dict[str, Dict[str, int]]: The shortest distances between all pairs of vertices.
+        Union[Dict[str, Dict[str, int]], Iterator[Tuple[str, Dict[str, int]]]]: The shortest distances between all pairs of vertices.
 
     Time complexity: O(V * (V + E)) where V is the number of vertices and E is the number of edges.
-    Space complexity: O(V^2) where V is the number of vertices.
+    Space complexity: O(V^2) where V is the number of vertices, or O(batch_size * V) per batch when streaming.
 
     >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'D')])
     >>> dist = bfs_apsp(graph)
     >>> dist['A']['D']
     3
     """
-    dist = {}
-    for vertex in graph.vertices():
-        dist[vertex], _ = bfs_sssp(graph, vertex)
-    return dist
+    rows = _bfs_apsp_rows(graph, batch_size)
+    return rows if stream else dict(rows)
+
+def _bfs_apsp_rows(graph: Graph, batch_size: Optional[int]) -> Iterator[Tuple[str, Dict[str, int]]]:
+    """
+    Generate the rows of the BFS all-pairs shortest paths batch by batch.
+    """
+    vertices = graph.vertices()
+    batch_size = batch_size or max(len(vertices), 1)
+
+    for start in range(0, len(vertices), batch_size):
+        yield from multi_source_bfs(graph, vertices[start:start + batch_size]).items()
+
+def get_bipartition(graph: Graph) -> Optional[Tuple[Set[str], Set[str]]]:
+    """
+    Split the vertices of a graph into two independent sets, i.e., sets such that every edge connects a vertex in one set with a vertex
+    in the other set. Edge directions are ignored. Each connected component is 2-colored with a breadth-first search from its first vertex.
+
+    Parameters:
+        graph (Graph): The graph to split.
+
+    Returns:
+        Optional[Tuple[Set[str], Set[str]]]: The two sets (the first vertex of every component goes to the first set), or None if the graph is not bipartite.
+
+    Time complexity: O(V + E) on top of graph.edges(), where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+
+    >>> left, right = get_bipartition(Graph(['A', 'B', 'C'], [('A', 'B'), ('C', 'B')]))
+    >>> sorted(left), sorted(right)
+    (['A', 'C'], ['B'])
+    """
+    # Build adjacency lists in both directions
+    adjacency = {vertex: [] for vertex in graph.vertices()}
+    for u, v, _ in graph.edges():
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+
+    colors = {}
+    for start in adjacency:
+        if start in colors:
+            continue
+
+        colors[start] = 0
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            for v in adjacency[u]:
+                if v not in colors:
+                    # Color the vertex the opposite color of its parent
+                    colors[v] = 1 - colors[u]
+                    queue.append(v)
+                elif colors[v] == colors[u]:
+                    return None
+
+    return {v for v, color in colors.items() if color == 0}, {v for v, color in colors.items() if color == 1}
 
 def check_bipartite(graph: Graph) -> bool:
     """
     A graph is bipartite if its vertices can be divided into two independent sets (or, equivalently, two color classes)
-    such that every edge connects a vertex in one set with a vertex in the other set. The graph is assumed to be connected.
+    such that every edge connects a vertex in one set with a vertex in the other set.
 
     Parameters:
         graph (Graph): The graph to check.
@@ -108,7 +391,7 @@ def check_bipartite(graph: Graph) -> bool:
         bool: True if the graph is bipartite, False otherwise.
 
     Time complexity: O(V + E) where V is the number of vertices and E is the number of edges.
-    Space complexity: O(V) where V is the number of vertices.
+    Space complexity: O(V + E) where V is the number of vertices and E is the number of edges.
 
     >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'D')])
     >>> check_bipartite(graph)
@@ -120,18 +403,4 @@ def check_bipartite(graph: Graph) -> bool:
     >>> check_bipartite(graph)
     False
     """
-    # Initialize color dictionary
-    colors = {vertex: None for vertex in graph.vertices()}
-
-    def color(vertex: str, parent: Optional[str]) -> None:
-        # Color the vertex the opposite color of its parent
-        colors[vertex] = 0 if (parent is None or colors[parent] == 1) else 1
-
-    breadth_first_search(graph, None, color)
-
-    # Check for an edge between two vertices of the same color
-    for u, v, _ in graph.edges():
-        if colors[u] == colors[v]:
-            return False
-
-    return True
\ No newline at end of file
+    return get_bipartition(graph) is not None
@@ -1,14 +1,15 @@
-from typing import Dict, Tuple
-from graph import Graph
-from depth_first_search import topological_sort
+from typing import Dict, Tuple, Optional, List
+from graph import Graph, Sources, source_offsets
+from depth_first_search import cached_topological_sort
 
-def dag_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+def dag_sssp(graph: Graph, source: Sources, order: Optional[List[str]] = None) -> Tuple[Dict[str, float], Dict[str, str]]:
     """
     Single-source shortest paths (SSSP) for directed acyclic graphs (DAGs).
 
     Parameters:
         graph (Graph): The graph to traverse.
-        source (str): The source vertex.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to their starting distance) to search from all of them at once.
+        order (Optional[List[str]]): A topological order of the graph to use. Default is the order cached for the current graph version.
 
     Returns:
         Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
@@ -27,14 +28,15 @@ def dag_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str, str
     dist = {v: float('inf') for v in graph.vertices()}
     pred = {v: None for v in graph.vertices()}
 
-    # Set the source distance to 0
-    dist[source] = 0
+    # Set the source distances to their offsets (0 for a single source)
+    dist.update(source_offsets(source))
 
-    # Topologically sort the vertices
-    vertices = topological_sort(graph)
+    # Topologically sort the vertices (only once per graph version)
+    if order is None:
+        order = cached_topological_sort(graph)
 
     # Loop through the vertices in topological order
-    for vertex in vertices:
+    for vertex in order:
         # Loop through the neighbors of the current vertex
         for neighbor, weight in graph.neighbors(vertex):
             # Relax the distance to the neighbor
@@ -65,7 +67,10 @@ def dag_apsp(graph: Graph) -> Dict[str, Dict[str, float]]:
     >>> dist['A']['D']
     6
     """
+    # All sources share one topological order
+    order = cached_topological_sort(graph)
+
     dist = {}
     for vertex in graph.vertices():
-        dist[vertex] = dag_sssp(graph, vertex)[0]
+        dist[vertex] = dag_sssp(graph, vertex, order)[0]
     return dist
\ No newline at end of file
@@ -1,6 +1,20 @@
-from typing import Callable, Dict, Optional, Tuple, List
+from typing import Callable, Dict, Optional, Tuple, List, Iterator
+from collections import deque
+from weakref import WeakKeyDictionary
 from graph import Graph
-from quick_sort import quick_sort
+
+# Events produced by dfs_events
+DISCOVER = 'discover'
+FINISH = 'finish'
+
+class CycleError(ValueError):
+    """
+    Raised when a directed acyclic graph was expected but the graph contains a cycle. The cycle attribute holds the vertices of one cycle
+    in edge order, i.e., cycle[i] -> cycle[i + 1] is an edge and so is cycle[-1] -> cycle[0].
+    """
+    def __init__(self, cycle: List[str]):
+        super().__init__('Graph contains a cycle')
+        self.cycle = cycle
 
 def depth_first_search(graph: Graph, start: str, callback: Optional[Callable[[str, Optional[str]], None]] = None) -> Dict[str, Tuple[int, int]]:
     """
@@ -43,6 +57,49 @@ def depth_first_search_entire_graph(graph: Graph, callback: Optional[Callable[[s
     visited, start_times, finish_times, component_numbers = dfs_helper(graph, None, callback)
     return {vertex: (start_times[vertex], finish_times[vertex], component_numbers[vertex]) for vertex in visited}
 
+def dfs_events(graph: Graph, start: Optional[str] = None) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Iterative depth-first search that yields an event when a vertex is discovered and when it is finished. The recursion is replaced by an
+    explicit stack of (vertex, parent, neighbor iterator) entries, so the depth of the search is not limited by Python's recursion limit.
+
+    Parameters:
+        graph (Graph): The graph to search.
+        start (Optional[str]): The starting vertex, or None to search the entire graph (every undiscovered vertex starts a new tree).
+
+    Yields:
+        Tuple[str, str, Optional[str]]: (event, vertex, parent) where event is DISCOVER or FINISH and parent is None for the root of a tree.
+
+    Time complexity: O(V + E)
+
+    >>> graph = Graph(['A', 'B', 'C'], [('A', 'B'), ('A', 'C')])
+    >>> list(dfs_events(graph, 'A'))
+    [('discover', 'A', None), ('discover', 'B', 'A'), ('finish', 'B', 'A'), ('discover', 'C', 'A'), ('finish', 'C', 'A'), ('finish', 'A', None)]
+    """
+    visited = set()
+    roots = graph.vertices() if start is None else [start]
+
+    for root in roots:
+        if root in visited:
+            continue
+
+        visited.add(root)
+        yield DISCOVER, root, None
+        stack = [(root, None, iter(graph.neighbors(root)))]
+
+        while stack:
+            vertex, parent, neighbors = stack[-1]
+
+            # Resume the vertex's neighbor scan where it left off and descend into the next undiscovered neighbor
+            for neighbor, _ in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield DISCOVER, neighbor, vertex
+                    stack.append((neighbor, vertex, iter(graph.neighbors(neighbor))))
+                    break
+            else:
+                stack.pop()
+                yield FINISH, vertex, parent
+
 def dfs_helper(graph: Graph, start: Optional[str] = None, callback: Optional[Callable[[str, Optional[str]], None]] = None) -> Tuple[Dict[str, bool], Dict[str, int], Dict[str, int], Optional[Dict[str, int]]]:
     """
     Helper function for depth-first search.
@@ -64,31 +121,20 @@ def dfs_helper(graph: Graph, start: Optional[str] = None, callback: Optional[Cal
         finish_times[vertex] = None
         component_numbers[vertex] = None
 
-    time, component_number = 0, 0
+    time, component_number = 0, -1
 
-    def dfs_visit(vertex: str, parent: Optional[str]):
-        nonlocal time, component_number
+    for event, vertex, parent in dfs_events(graph, start):
         time += 1
-        start_times[vertex] = time
-        visited[vertex] = True
-        component_numbers[vertex] = component_number
-        if callback:
-            callback(vertex, parent)
-
-        for neighbor, _ in graph.neighbors(vertex):
-            if not visited[neighbor]:
-                dfs_visit(neighbor, vertex)
-
-        time += 1
-        finish_times[vertex] = time
-
-    if start is None:
-        for vertex in graph.vertices():
-            if not visited[vertex]:
-                dfs_visit(vertex, None)
+        if event == DISCOVER:
+            if parent is None:
                 component_number += 1
-    else:
-        dfs_visit(start, None)
+            start_times[vertex] = time
+            visited[vertex] = True
+            component_numbers[vertex] = component_number
+            if callback:
+                callback(vertex, parent)
+        else:
+            finish_times[vertex] = time
 
     return visited, start_times, finish_times, component_numbers if start is None else None
 
@@ -108,39 +154,34 @@ def get_bridge_edges(graph: Graph) -> List[Tuple[str, str]]:
         raise ValueError('Graph must be undirected')
 
     # min_start_times[vertex] is the minimum start time of all vertices reachable from vertex except through vertex's parent
-    start_times, min_start_times, visited, time = {}, {}, {vertex: False for vertex in graph.vertices()}, 0
+    start_times, min_start_times, time = {}, {}, 0
     bridges = []
 
-    def dfs_visit(vertex: str, parent: Optional[str]):
-        nonlocal time
-        time += 1
-        start_times[vertex] = time
-        min_start_times[vertex] = time
-        visited[vertex] = True
+    for event, vertex, parent in dfs_events(graph):
+        if event == DISCOVER:
+            time += 1
+            start_times[vertex] = time
+            min_start_times[vertex] = time
+            continue
 
+        # Back edges (every neighbor has been discovered by the time the vertex finishes)
         for neighbor, _ in graph.neighbors(vertex):
-            if neighbor == parent:
-                continue
-            if not visited[neighbor]:
-                dfs_visit(neighbor, vertex)
-                # Tree edge
-                min_start_times[vertex] = min(min_start_times[vertex], min_start_times[neighbor])
-                # If the child cannot reach any vertex with a lower start time than the current vertex, then the edge is a bridge
-                if min_start_times[neighbor] > start_times[vertex]:
-                    bridges.append((vertex, neighbor))
-            else:
-                # Back edge
+            if neighbor != parent:
                 min_start_times[vertex] = min(min_start_times[vertex], start_times[neighbor])
 
-    for vertex in graph.vertices():
-        if not visited[vertex]:
-            dfs_visit(vertex, None)
+        if parent is not None:
+            # Tree edge
+            min_start_times[parent] = min(min_start_times[parent], min_start_times[vertex])
+            # If the child cannot reach any vertex with a lower start time than the parent, then the edge is a bridge
+            if min_start_times[vertex] > start_times[parent]:
+                bridges.append((parent, vertex))
 
     return bridges
 
 def topological_sort(graph: Graph) -> List[str]:
     """
-    Topological sort of a directed acyclic graph (DAG).
+    Topological sort of a directed acyclic graph (DAG). The order is the reverse of the order in which depth-first search finishes the
+    vertices, so no sorting is needed. For a graph with cycles, this is still the order used by Kosaraju's algorithm.
 
     Parameters:
         graph (Graph): The graph to sort.
@@ -148,7 +189,92 @@ def topological_sort(graph: Graph) -> List[str]:
     Returns:
         List[str]: A topological ordering of the graph vertices.
 
-    Time complexity: O(V log V + E)
+    Time complexity: O(V + E)
+    """
+    postorder = [vertex for event, vertex, _ in dfs_events(graph) if event == FINISH]
+    postorder.reverse()
+    return postorder
+
+def kahn_topological_sort(graph: Graph) -> Iterator[str]:
+    """
+    Topological sort of a directed acyclic graph (DAG) using Kahn's algorithm. Vertices are produced as soon as their in-degree drops to zero,
+    so the order can be consumed while it is being computed.
+
+    Parameters:
+        graph (Graph): The graph to sort.
+
+    Yields:
+        str: The vertices in topological order.
+
+    Raises:
+        CycleError: Once the vertices that are not on or behind a cycle have been produced, if the graph is not a DAG. The error carries a cycle.
+
+    Time complexity: O(V + E)
+
+    >>> list(kahn_topological_sort(Graph(['A', 'B', 'C'], [('B', 'C'), ('A', 'B')])))
+    ['A', 'B', 'C']
+    """
+    in_degree = {vertex: 0 for vertex in graph.vertices()}
+    for vertex in in_degree:
+        for neighbor, _ in graph.neighbors(vertex):
+            in_degree[neighbor] += 1
+
+    queue = deque(vertex for vertex, degree in in_degree.items() if degree == 0)
+    remaining = len(in_degree)
+
+    while queue:
+        vertex = queue.popleft()
+        remaining -= 1
+        yield vertex
+
+        for neighbor, _ in graph.neighbors(vertex):
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if remaining:
+        raise CycleError(_find_cycle_among(graph, {vertex for vertex, degree in in_degree.items() if degree > 0}))
+
+def _find_cycle_among(graph: Graph, remaining: set) -> List[str]:
+    """
+    Find a cycle among the vertices left over by Kahn's algorithm. Each of them has an in-edge from another leftover vertex, so walking
+    those in-edges backwards must eventually repeat a vertex.
+    """
+    incoming = {}
+    for vertex in remaining:
+        for neighbor, _ in graph.neighbors(vertex):
+            if neighbor in remaining:
+                incoming[neighbor] = vertex
+
+    walk, position = [], {}
+    vertex = next(iter(remaining))
+    while vertex not in position:
+        position[vertex] = len(walk)
+        walk.append(vertex)
+        vertex = incoming[vertex]
+
+    # The walk went backwards along the edges
+    cycle = walk[position[vertex]:]
+    cycle.reverse()
+    return cycle
+
+# Topological order of each graph, together with the graph version it was computed for
+_topological_orders = WeakKeyDictionary()
+
+def cached_topological_sort(graph: Graph) -> List[str]:
+    """
+    Topological sort of a directed acyclic graph (DAG) that is computed once per graph version and reused until the graph is modified.
+
+    Parameters:
+        graph (Graph): The graph to sort.
+
+    Returns:
+        List[str]: A topological ordering of the graph vertices. The list is shared between calls and must not be modified.
+
+    Time complexity: O(V + E) the first time for each graph version, O(1) afterwards.
     """
-    _, _, finish_times, _ = dfs_helper(graph, None, None)
-    return quick_sort(graph.vertices(), comparator=lambda v1, v2: finish_times[v1] > finish_times[v2])
\ No newline at end of file
+    version, order = _topological_orders.get(graph, (None, None))
+    if version != graph.version:
+        order = topological_sort(graph)
+        _topological_orders[graph] = (graph.version, order)
+    return order
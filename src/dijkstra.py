@@ -1,14 +1,17 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Optional
 from priority_queue import PriorityQueue
-from graph import Graph
+from graph import Graph, Sources, source_offsets
 
-def dijkstra_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+def dijkstra_sssp(graph: Graph, source: Sources, potentials: Optional[Dict[str, float]] = None) -> Tuple[Dict[str, float], Dict[str, str]]:
     """
     Dijkstra's algorithm for single-source shortest paths. This algorithm can only handle non-negative edge weights.
 
     Parameters:
         graph (Graph): The graph to traverse.
-        source (str): The source vertex.
+        source (Sources): The source vertex, or several source vertices (optionally mapped to their starting distance) to search from all of them at once.
+        potentials (Optional[Dict[str, float]]): Optional vertex potentials h. If given, every edge (u, v, w) is relaxed with the reduced cost
+            w + h[u] - h[v], which only needs to be non-negative (e.g. Johnson's potentials on a graph with negative weights). The returned
+            distances are still in terms of the original weights.
 
     Returns:
         Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
@@ -29,12 +32,15 @@ def dijkstra_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str
     dist = {v: float('inf') for v in graph.vertices()}
     pred = {v: None for v in graph.vertices()}
 
-    # Set the source distance to 0
-    dist[source] = 0
-
-    # Create a priority queue with the source vertex and its distance
+    # Create a priority queue and seed it with the source vertices and their starting distances
     queue = PriorityQueue(lambda v1, v2: v1[1] < v2[1])
-    queue.insert((source, 0))
+    offsets = source_offsets(source)
+    for vertex, offset in offsets.items():
+        if potentials is not None:
+            offset -= potentials[vertex]
+        if offset < dist[vertex]:
+            dist[vertex] = offset
+            queue.insert((vertex, offset))
 
     # Loop until the priority queue is empty
     while not queue.is_empty():
@@ -47,6 +53,10 @@ def dijkstra_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str
 
         # Loop through the neighbors of the current vertex
         for neighbor, weight in graph.neighbors(current_vertex):
+            # Apply the reduced cost on the fly instead of rewriting the graph
+            if potentials is not None:
+                weight += potentials[current_vertex] - potentials[neighbor]
+
             # Relax the distance to the neighbor
             new_dist = dist[current_vertex] + weight
 
@@ -57,6 +67,11 @@ def dijkstra_sssp(graph: Graph, source: str) -> Tuple[Dict[str, float], Dict[str
                 # We can afford to insert duplicates into the priority queue because we check if the distance is less than the current distance
                 queue.insert((neighbor, dist[neighbor]))
 
+    # Convert the reduced distances back to distances under the original weights
+    if potentials is not None:
+        for v in dist:
+            dist[v] += potentials[v]
+
     return dist, pred
 
 def dijkstra_apsp(graph: Graph) -> Dict[str, Dict[str, float]]:
@@ -0,0 +1,175 @@
+from typing import Dict, List, Optional, Tuple
+from graph import Graph
+from depth_first_search import CycleError
+
+class DynamicDAG(Graph):
+    """
+    A directed acyclic graph that keeps a topological order up to date as edges are inserted (Pearce-Kelly algorithm). Inserting an edge
+    that agrees with the current order costs O(1). Otherwise, only the vertices whose position lies between the edge's endpoints and that
+    are connected to them are searched and reordered. Edges that would create a cycle are rejected.
+
+    The maintained order can be passed to dag_sssp instead of sorting the graph again.
+
+    >>> dag = DynamicDAG(['A', 'B', 'C'])
+    >>> dag.add_edge('C', 'B')
+    >>> dag.add_edge('B', 'A')
+    >>> dag.topological_order()
+    ['C', 'B', 'A']
+    >>> try:
+    ...     dag.add_edge('A', 'C')
+    ... except CycleError as error:
+    ...     error.cycle
+    ['A', 'C', 'B']
+    """
+    def __init__(self, vertices: List[str], edges: List[Tuple[str, str, Optional[float]]] = None):
+        # The order has to exist before the base class inserts the initial edges through add_edge
+        self.position: Dict[str, int] = {v: i for i, v in enumerate(vertices)}
+        self.order: List[Optional[str]] = list(vertices)
+        # The number of positions in the order left empty by removed vertices
+        self.holes = 0
+        self.successors: Dict[str, Dict[str, None]] = {v: {} for v in vertices}
+        self.predecessors: Dict[str, Dict[str, None]] = {v: {} for v in vertices}
+        super().__init__(vertices, edges, undirected=False)
+
+    def add_vertex(self, v: str) -> None:
+        """
+        Add a vertex to the graph. The new vertex is placed at the end of the topological order.
+
+        Parameters:
+            v (str): Vertex identifier.
+        """
+        if v in self.adj_matrix:
+            return
+
+        super().add_vertex(v)
+        self.position[v] = len(self.order)
+        self.order.append(v)
+        self.successors[v] = {}
+        self.predecessors[v] = {}
+
+    def remove_vertex(self, v: str) -> None:
+        """
+        Remove a vertex from the graph. The remaining vertices stay in topological order. Once more than half of the order consists of
+        positions left empty by removed vertices, it is compacted.
+
+        Parameters:
+            v (str): Vertex identifier.
+
+        Time complexity: O(V) (for the adjacency matrix), and amortized O(1) for the order.
+        """
+        super().remove_vertex(v)
+        for u in self.successors.pop(v):
+            del self.predecessors[u][v]
+        for u in self.predecessors.pop(v):
+            del self.successors[u][v]
+        self.order[self.position.pop(v)] = None
+        self.holes += 1
+
+        if 2 * self.holes > len(self.order):
+            self.order = [u for u in self.order if u is not None]
+            self.position = {u: i for i, u in enumerate(self.order)}
+            self.holes = 0
+
+    def add_edge(self, v1: str, v2: str, weight: Optional[float] = None) -> None:
+        """
+        Add an edge to the graph and update the topological order.
+
+        Parameters:
+            v1 (str): The source vertex.
+            v2 (str): The destination vertex.
+            weight (float): Edge weight.
+
+        Raises:
+            CycleError: If the edge would create a cycle. The graph is left unchanged and the error carries the cycle.
+
+        Time complexity: O(1) if v1 already comes before v2, otherwise O(size of the affected region + its edges).
+        """
+        if v1 == v2:
+            raise CycleError([v1])
+
+        lower, upper = self.position[v2], self.position[v1]
+        if lower < upper and v2 not in self.successors[v1]:
+            # v2 comes before v1: find everything after v2 that v2 reaches, and everything before v1 that reaches v1
+            forward = self._search_forward(v2, v1, upper)
+            backward = self._search_backward(v1, lower)
+            self._reorder(backward, forward)
+
+        super().add_edge(v1, v2, weight)
+        self.successors[v1][v2] = None
+        self.predecessors[v2][v1] = None
+
+    def remove_edge(self, v1: str, v2: str) -> None:
+        """
+        Remove an edge from the graph. The topological order stays valid.
+
+        Parameters:
+            v1 (str): The source vertex.
+            v2 (str): The destination vertex.
+        """
+        super().remove_edge(v1, v2)
+        self.successors[v1].pop(v2, None)
+        self.predecessors[v2].pop(v1, None)
+
+    def topological_order(self) -> List[str]:
+        """
+        Get the current topological order.
+
+        Returns:
+            List[str]: The vertices in topological order.
+
+        Time complexity: O(V)
+        """
+        return [v for v in self.order if v is not None]
+
+    def _search_forward(self, start: str, target: str, upper: int) -> List[str]:
+        """
+        Find the vertices reachable from start whose position is below upper. Raises CycleError if target is reachable.
+        """
+        parent = {start: None}
+        stack = [start]
+
+        while stack:
+            vertex = stack.pop()
+            for neighbor in self.successors[vertex]:
+                if neighbor == target:
+                    # target -> start -> ... -> vertex -> target
+                    cycle = [vertex]
+                    while parent[cycle[-1]] is not None:
+                        cycle.append(parent[cycle[-1]])
+                    cycle.append(target)
+                    cycle.reverse()
+                    raise CycleError(cycle)
+                if neighbor not in parent and self.position[neighbor] < upper:
+                    parent[neighbor] = vertex
+                    stack.append(neighbor)
+
+        return list(parent)
+
+    def _search_backward(self, start: str, lower: int) -> List[str]:
+        """
+        Find the vertices that reach start whose position is above lower.
+        """
+        visited = {start: None}
+        stack = [start]
+
+        while stack:
+            vertex = stack.pop()
+            for neighbor in self.predecessors[vertex]:
+                if neighbor not in visited and self.position[neighbor] > lower:
+                    visited[neighbor] = None
+                    stack.append(neighbor)
+
+        return list(visited)
+
+    def _reorder(self, backward: List[str], forward: List[str]) -> None:
+        """
+        Move the backward region in front of the forward region, reusing the positions both regions occupied and keeping the relative order
+        within each region.
+        """
+        backward.sort(key=self.position.__getitem__)
+        forward.sort(key=self.position.__getitem__)
+        positions = sorted(self.position[v] for v in backward + forward)
+
+        for position, vertex in zip(positions, backward + forward):
+            self.position[vertex] = position
+            self.order[position] = vertex
@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union, Iterable
 
 class Graph:
     def __init__(self, vertices: List[str], edges: List[Tuple[str, str, Optional[float]]] = None, undirected: bool = False, default_weight: float = float('inf')):
@@ -13,6 +13,8 @@ class Graph:
         """
         self.undirected = undirected
         self.default_weight = default_weight
+        # Incremented on every modification so that derived data (e.g. a cached topological order) can tell when it is stale
+        self.version = 0
         self.adj_matrix: Dict[str, Dict[str, Optional[float]]] = {v: {u: default_weight for u in vertices} for v in vertices}
 
         for v in vertices:
@@ -38,6 +40,7 @@ class Graph:
         if v in self.adj_matrix:
             return  # Vertex already exists
 
+        self.version += 1
         # Add the new vertex with infinite weights to others
         self.adj_matrix[v] = {u: self.default_weight for u in self.adj_matrix}
         for u in self.adj_matrix:
@@ -53,6 +56,7 @@ class Graph:
             v (str): Vertex identifier.
         """
         del self.adj_matrix[v]
+        self.version += 1
         for u in self.adj_matrix:
             del self.adj_matrix[u][v]
 
@@ -66,6 +70,7 @@ class Graph:
             weight (float): Edge weight.
         """
         weight = weight if weight is not None else 1
+        self.version += 1
         self.adj_matrix[v1][v2] = weight
         if self.undirected:
             self.adj_matrix[v2][v1] = weight
@@ -79,6 +84,7 @@ class Graph:
             v2 (str): The destination vertex.
         """
         self.adj_matrix[v1][v2] = self.default_weight
+        self.version += 1
         if self.undirected:
             self.adj_matrix[v2][v1] = self.default_weight
 
@@ -167,4 +173,33 @@ class Graph:
                     edge += f": {weight}" if not is_unweighted else ""
                     edge_list.append(edge)
 
-        return ', '.join(edge_list)
\ No newline at end of file
+        return ', '.join(edge_list)
+
+# One source vertex, several source vertices, or source vertices mapped to their starting distance (offset)
+Sources = Union[str, Iterable[str], Dict[str, float]]
+
+def source_offsets(sources: Sources) -> Dict[str, float]:
+    """
+    Normalize the sources of a shortest path search into a mapping from each source vertex to its starting distance.
+
+    Parameters:
+        sources (Sources): A single vertex (any non-iterable value or a string), an iterable of vertices (all starting at distance 0), or a dictionary of vertices to offsets.
+
+    Returns:
+        Dict[str, float]: The starting distance of each source vertex.
+
+    >>> source_offsets('A')
+    {'A': 0}
+    >>> source_offsets(['A', 'B'])
+    {'A': 0, 'B': 0}
+    >>> source_offsets({'A': 2})
+    {'A': 2}
+    >>> source_offsets(0)
+    {0: 0}
+    """
+    if isinstance(sources, dict):
+        return dict(sources)
+    # Strings are iterable, but name a single vertex. So does any other non-iterable value, such as an integer component id.
+    if isinstance(sources, str) or not isinstance(sources, Iterable):
+        return {sources: 0}
+    return {source: 0 for source in sources}
\ No newline at end of file
@@ -1,14 +1,41 @@
-from typing import Dict
+import os
+from typing import Dict, Optional
+from concurrent.futures import Executor
+from functools import partial
 from graph import Graph
-from bellman_ford import bellman_ford_sssp
+from bellman_ford import spfa_sssp
 from dijkstra import dijkstra_sssp
 
-def johnson_apsp(graph: Graph) -> Dict[str, Dict[str, float]]:
+def johnson_potentials(graph: Graph) -> Dict[str, float]:
     """
-    Johnson's algorithm for all-pairs shortest paths. Can be used to detect negative-weight cycles.
+    Compute Johnson's vertex potentials, i.e., the shortest distances from a virtual source that has a zero-weight edge to every vertex.
+    The virtual source is never added to the graph: starting every distance at 0 is exactly the state of Bellman-Ford after relaxing its edges.
+
+    Parameters:
+        graph (Graph): The graph.
+
+    Returns:
+        Dict[str, float]: The potential h[v] of every vertex. Every edge (u, v, w) satisfies w + h[u] - h[v] >= 0.
+
+    Raises:
+        NegativeCycleError: If the graph contains a negative-weight cycle.
+
+    Time complexity: O(VE) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V) where V is the number of vertices.
+    """
+    # Searching from every vertex at once (all starting at 0) is equivalent to searching from the virtual source
+    potentials, _ = spfa_sssp(graph, graph.vertices())
+    return potentials
+
+def johnson_apsp(graph: Graph, executor: Optional[Executor] = None, chunksize: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Johnson's algorithm for all-pairs shortest paths. Can be used to detect negative-weight cycles. The graph is not modified.
 
     Parameters:
         graph (Graph): The graph to traverse.
+        executor (Optional[Executor]): Optional executor (e.g. a ProcessPoolExecutor) to distribute the per-source Dijkstra runs over. Default is to run them sequentially.
+        chunksize (Optional[int]): The number of sources sent to a worker process at once. The graph and the potentials are pickled once
+            per chunk, not once per source. Default is to split the sources into about 4 chunks per CPU.
 
     Returns:
         Dict[str, Dict[str, float]]: The shortest distances between all pairs of vertices.
@@ -21,36 +48,23 @@ def johnson_apsp(graph: Graph) -> Dict[str, Dict[str, float]]:
     >>> dist['A']['D']
     6
     """
-    # Add a new vertex and connect it to all other vertices with zero-weight edges
-    graph.add_vertex('S')
-    for vertex in graph.vertices():
-        graph.add_edge('S', vertex, 0)
-
-    # Run Bellman-Ford algorithm to find the shortest distances from the new vertex to all other vertices
-    dist_from_new_vertex, _ = bellman_ford_sssp(graph, 'S')
-
-    # Remove the new vertex and its edges
-    graph.remove_vertex('S')
-
-    # Recompute the weights of all edges
-    for u, v, w in graph.edges():
-        graph.remove_edge(u, v)
-        graph.add_edge(u, v, w + dist_from_new_vertex[u] - dist_from_new_vertex[v])
-
-    # Run Dijkstra's algorithm for all vertices
-    all_dist = {}
-    for vertex in graph.vertices():
-        dist, _ = dijkstra_sssp(graph, vertex)
-        all_dist[vertex] = dist
-
-    # Restore the original weights of all edges
-    for u, v, w in graph.edges():
-        graph.remove_edge(u, v)
-        graph.add_edge(u, v, w - dist_from_new_vertex[u] + dist_from_new_vertex[v])
-
-    # Fix the distances
-    for u in graph.vertices():
-        for v in graph.vertices():
-            all_dist[u][v] = all_dist[u][v] - dist_from_new_vertex[u] + dist_from_new_vertex[v]
-
-    return all_dist
\ No newline at end of file
+    # Find potentials that make every reduced edge weight non-negative
+    potentials = johnson_potentials(graph)
+
+    # Run Dijkstra's algorithm for all vertices, applying the reduced weights on the fly
+    vertices = graph.vertices()
+    run_dijkstra = partial(_johnson_dijkstra, graph, potentials)
+    if executor is None:
+        rows = map(run_dijkstra, vertices)
+    else:
+        if chunksize is None:
+            chunksize = max(1, len(vertices) // (4 * (os.cpu_count() or 1)))
+        rows = executor.map(run_dijkstra, vertices, chunksize=chunksize)
+
+    return dict(zip(vertices, rows))
+
+def _johnson_dijkstra(graph: Graph, potentials: Dict[str, float], source: str) -> Dict[str, float]:
+    """
+    Run Dijkstra's algorithm with Johnson's potentials from a single source. Defined at module level so that it can be sent to worker processes.
+    """
+    return dijkstra_sssp(graph, source, potentials)[0]
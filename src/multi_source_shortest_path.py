@@ -1,5 +1,5 @@
-from graph import Graph
-from typing import List, Optional, Tuple, Dict
+from graph import Graph, Sources
+from typing import List, Optional, Tuple, Dict, Union
 from breadth_first_search import bfs_sssp
 from dijkstra import dijkstra_sssp
 from dag_shortest_path import dag_sssp
@@ -8,6 +8,7 @@ from bellman_ford import bellman_ford_sssp
 def create_multi_source_node(graph: Graph, nodes: Optional[List[str]] = None, name: str = 'multi', weight: int = 0) -> str:
     """
     Create a new portal node in the graph that is connected to the specified nodes (or all nodes if None) with directed edges of the specified weight.
+    The multi-source algorithms below do not need a portal node since the single-source algorithms can be seeded with several sources directly.
 
     Parameters:
         graph (Graph): The graph to modify.
@@ -27,18 +28,19 @@ def create_multi_source_node(graph: Graph, nodes: Optional[List[str]] = None, na
 
     return name
 
-def bfs_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float], Dict[str, str]]:
+def bfs_mssp(graph: Graph, sources: Sources, return_sources: bool = False) -> Union[Tuple[Dict[str, float], Dict[str, str]], Tuple[Dict[str, float], Dict[str, str], Dict[str, str]]]:
     """
-    Breadth-first search (BFS) algorithm for multi-source shortest paths.
+    Breadth-first search (BFS) algorithm for multi-source shortest paths. The graph is not modified.
 
     Parameters:
         graph (Graph): The graph to traverse.
-        sources (List[str]): The source vertices.
+        sources (Sources): The source vertices, optionally mapped to their starting distance.
+        return_sources (bool): If True, also return the source each vertex was reached from (i.e., its nearest source).
 
     Returns:
-        Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
+        Tuple: The shortest distances to all vertices and their predecessors (and the nearest source of each vertex if return_sources is True).
 
-    Time complexity: O(V * (V + E)) where V is the number of vertices and E is the number of edges.
+    Time complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space complexity: O(V) where V is the number of vertices.
 
     >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'D')])
@@ -46,37 +48,28 @@ def bfs_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float], Dict[s
     >>> dist['D']
     2
     >>> pred['D'], pred['C']
-    'C', 'B'
+    ('C', 'B')
     """
-    create_multi_source_node(graph, sources, 'multi', 1)
-    dist, pred = bfs_sssp(graph, 'multi')
-    graph.remove_vertex('multi')
+    dist, pred = bfs_sssp(graph, sources)
 
-    # Subtract 1 from the distance to each destination to account for the extra edge weight added by the portal node.
-    for destination in dist:
-        dist[destination] -= 1
-
-    for vertex in pred:
-        if pred[vertex] == 'multi':
-            pred[vertex] = None
-
-    del dist['multi']
-    del pred['multi']
+    if return_sources:
+        return dist, pred, get_source_assignment(dist, pred)
 
     return dist, pred
 
-def dijkstra_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float], Dict[str, str]]:
+def dijkstra_mssp(graph: Graph, sources: Sources, return_sources: bool = False) -> Union[Tuple[Dict[str, float], Dict[str, str]], Tuple[Dict[str, float], Dict[str, str], Dict[str, str]]]:
     """
-    Dijkstra's algorithm for multi-source shortest paths.
+    Dijkstra's algorithm for multi-source shortest paths. The graph is not modified.
 
     Parameters:
         graph (Graph): The graph to traverse.
-        sources (List[str]): The source vertices.
+        sources (Sources): The source vertices, optionally mapped to their starting distance.
+        return_sources (bool): If True, also return the source each vertex was reached from (i.e., its nearest source).
 
     Returns:
-        Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
+        Tuple: The shortest distances to all vertices and their predecessors (and the nearest source of each vertex if return_sources is True).
 
-    Time complexity: O(V * (V + E) * log(V)) where V is the number of vertices and E is the number of edges.
+    Time complexity: O((V + E) log V) where V is the number of vertices and E is the number of edges.
     Space complexity: O(V) where V is the number of vertices.
 
     >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', 1), ('B', 'C', 3), ('C', 'D', 5)])
@@ -84,33 +77,28 @@ def dijkstra_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float], D
     >>> dist['D']
     8
     >>> pred['D'], pred['C']
-    'C', 'B'
+    ('C', 'B')
     """
-    create_multi_source_node(graph, sources, 'multi', 0)
-    dist, pred = dijkstra_sssp(graph, 'multi')
-    graph.remove_vertex('multi')
-
-    for vertex in pred:
-        if pred[vertex] == 'multi':
-            pred[vertex] = None
+    dist, pred = dijkstra_sssp(graph, sources)
 
-    del dist['multi']
-    del pred['multi']
+    if return_sources:
+        return dist, pred, get_source_assignment(dist, pred)
 
     return dist, pred
 
-def dag_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float], Dict[str, str]]:
+def dag_mssp(graph: Graph, sources: Sources, return_sources: bool = False) -> Union[Tuple[Dict[str, float], Dict[str, str]], Tuple[Dict[str, float], Dict[str, str], Dict[str, str]]]:
     """
-    DAG shortest path algorithm for multi-source shortest paths.
+    DAG shortest path algorithm for multi-source shortest paths. The graph is not modified.
 
     Parameters:
         graph (Graph): The graph to traverse.
-        sources (List[str]): The source vertices.
+        sources (Sources): The source vertices, optionally mapped to their starting distance.
+        return_sources (bool): If True, also return the source each vertex was reached from (i.e., its nearest source).
 
     Returns:
-        Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
+        Tuple: The shortest distances to all vertices and their predecessors (and the nearest source of each vertex if return_sources is True).
 
-    Time complexity: O(V * (V + E)) where V is the number of vertices and E is the number of edges.
+    Time complexity: O(V + E) where V is the number of vertices and E is the number of edges.
     Space complexity: O(V) where V is the number of vertices.
 
     >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', 1), ('B', 'C', 3), ('C', 'D', 5)])
@@ -118,33 +106,28 @@ def dag_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float], Dict[s
     >>> dist['D']
     8
     >>> pred['D'], pred['C']
-    'C', 'B'
+    ('C', 'B')
     """
-    create_multi_source_node(graph, sources, 'multi', 0)
-    dist, pred = dag_sssp(graph, 'multi')
-    graph.remove_vertex('multi')
+    dist, pred = dag_sssp(graph, sources)
 
-    for vertex in pred:
-        if pred[vertex] == 'multi':
-            pred[vertex] = None
-
-    del dist['multi']
-    del pred['multi']
+    if return_sources:
+        return dist, pred, get_source_assignment(dist, pred)
 
     return dist, pred
 
-def bellman_ford_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float], Dict[str, str]]:
+def bellman_ford_mssp(graph: Graph, sources: Sources, return_sources: bool = False) -> Union[Tuple[Dict[str, float], Dict[str, str]], Tuple[Dict[str, float], Dict[str, str], Dict[str, str]]]:
     """
-    Bellman-Ford algorithm for multi-source shortest paths.
+    Bellman-Ford algorithm for multi-source shortest paths. The graph is not modified.
 
     Parameters:
         graph (Graph): The graph to traverse.
-        sources (List[str]): The source vertices.
+        sources (Sources): The source vertices, optionally mapped to their starting distance.
+        return_sources (bool): If True, also return the source each vertex was reached from (i.e., its nearest source).
 
     Returns:
-        Tuple[Dict[str, float], Dict[str, str]]: The shortest distances to all vertices and their predecessors.
+        Tuple: The shortest distances to all vertices and their predecessors (and the nearest source of each vertex if return_sources is True).
 
-    Time complexity: O(V * (V + E)) where V is the number of vertices and E is the number of edges.
+    Time complexity: O(VE) where V is the number of vertices and E is the number of edges.
     Space complexity: O(V) where V is the number of vertices.
 
     >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', 1), ('B', 'C', 3), ('C', 'D', 5)])
@@ -152,17 +135,48 @@ def bellman_ford_mssp(graph: Graph, sources: List[str]) -> Tuple[Dict[str, float
     >>> dist['D']
     8
     >>> pred['D'], pred['C']
-    'C', 'B'
+    ('C', 'B')
     """
-    create_multi_source_node(graph, sources, 'multi', 0)
-    dist, pred = bellman_ford_sssp(graph, 'multi')
-    graph.remove_vertex('multi')
+    dist, pred = bellman_ford_sssp(graph, sources)
 
-    for vertex in pred:
-        if pred[vertex] == 'multi':
-            pred[vertex] = None
+    if return_sources:
+        return dist, pred, get_source_assignment(dist, pred)
 
-    del dist['multi']
-    del pred['multi']
+    return dist, pred
 
-    return dist, pred
\ No newline at end of file
+def get_source_assignment(dist: Dict[str, float], pred: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    """
+    Find the source each vertex was reached from by following the predecessors of a multi-source search back to a source.
+
+    Parameters:
+        dist (Dict[str, float]): The shortest distances to all vertices.
+        pred (Dict[str, Optional[str]]): The predecessors of all vertices.
+
+    Returns:
+        Dict[str, Optional[str]]: The source of the shortest path to each vertex, or None if the vertex is unreachable.
+
+    Time complexity: O(V) where V is the number of vertices.
+
+    >>> get_source_assignment({'A': 0, 'B': 1, 'C': float('inf')}, {'A': None, 'B': 'A', 'C': None})
+    {'A': 'A', 'B': 'A', 'C': None}
+    """
+    origin = {}
+
+    for vertex in pred:
+        if dist[vertex] == float('inf'):
+            origin[vertex] = None
+            continue
+
+        # Walk up to a vertex whose source is known (or a source itself), then label the whole walk
+        path = []
+        current = vertex
+        while current not in origin and pred[current] is not None:
+            path.append(current)
+            current = pred[current]
+
+        root = origin.get(current, current)
+        origin[current] = root
+        for v in path:
+            origin[v] = root
+
+    return origin
@@ -1,12 +1,119 @@
 from graph import Graph
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, List, Optional, Set, Tuple, Callable
+from collections import deque
+from functools import partial
 from breadth_first_search import breadth_first_search
+from bellman_ford import bellman_ford_sssp
+from dijkstra import dijkstra_sssp
+
+class ResidualGraph(Graph):
+    """
+    The residual graph of a flow network. Besides the adjacency matrix, it keeps the residual edges leaving every vertex in a sparse
+    dictionary, so that neighbors takes time proportional to the out-degree instead of V, and a search over the residual graph (such as
+    finding an augmenting path) takes O(V + E) instead of O(V^2).
+    """
+    def __init__(self, vertices: List[str], edges: List[Tuple[str, str, Optional[float]]] = None):
+        """
+        Initialize a residual graph.
+
+        Parameters:
+            vertices (List[str]): List of vertex identifiers.
+            edges (List[Tuple[str, str, float]]): Optional list of residual edges as tuples (v1, v2, residual capacity).
+        """
+        self.arcs: Dict[str, Dict[str, float]] = {v: {} for v in vertices}
+        super().__init__(vertices, edges)
+
+    def add_vertex(self, v: str) -> None:
+        """
+        Add a vertex with no residual edges.
+        """
+        self.arcs.setdefault(v, {})
+        super().add_vertex(v)
+
+    def remove_vertex(self, v: str) -> None:
+        """
+        Remove a vertex and its residual edges.
+        """
+        super().remove_vertex(v)
+        del self.arcs[v]
+        for arcs in self.arcs.values():
+            arcs.pop(v, None)
+
+    def add_edge(self, v1: str, v2: str, weight: Optional[float] = None) -> None:
+        """
+        Add or update the residual edge from v1 to v2.
+        """
+        super().add_edge(v1, v2, weight)
+        if v1 != v2:
+            self.arcs[v1][v2] = self.adj_matrix[v1][v2]
+
+    def remove_edge(self, v1: str, v2: str) -> None:
+        """
+        Remove the residual edge from v1 to v2.
+        """
+        super().remove_edge(v1, v2)
+        self.arcs[v1].pop(v2, None)
+
+    def neighbors(self, vertex: str) -> List[Tuple[str, float]]:
+        """
+        Get the vertices reachable from a vertex through a residual edge, along with the residual capacities, in O(out-degree).
+        """
+        return list(self.arcs[vertex].items())
 
 class NetworkFlow(Graph):
     def __init__(self, vertices: List[str], edges: List[Tuple[str, str, Optional[float]]] = None):
-        super().__init__(vertices, edges, undirected=False, default_weight=0)
+        """
+        Initialize a flow network.
+
+        Parameters:
+            vertices (List[str]): List of vertex identifiers.
+            edges (List[Tuple[str, str, float]]): Optional list of edges as tuples (v1, v2, capacity), or (v1, v2, capacity, cost) for min-cost flow.
+        """
         self.flow_network: Dict[str, Dict[str, float]] = {v: {u: 0 for u in vertices} for v in vertices}
-        self.residual_graph: Graph = self.get_residual_graph()
+        # The residual graph is kept up to date by add_edge as the edges are added
+        self.residual_graph: ResidualGraph = ResidualGraph(vertices)
+        super().__init__(vertices, edges, undirected=False, default_weight=0)
+        # The cost per unit of flow of every edge that has one
+        self.cost: Dict[Tuple[str, str], float] = {(v1, v2): rest[1] for v1, v2, *rest in edges or [] if len(rest) > 1}
+
+    def add_vertex(self, v: str) -> None:
+        """
+        Add a vertex to the flow network, with no flow and no residual edges.
+
+        Parameters:
+            v (str): Vertex identifier.
+        """
+        if v in self.adj_matrix:
+            return
+
+        super().add_vertex(v)
+        for u in self.flow_network:
+            self.flow_network[u][v] = 0
+        self.flow_network[v] = {u: 0 for u in self.adj_matrix}
+        self.residual_graph.add_vertex(v)
+
+    def add_edge(self, v1: str, v2: str, weight: Optional[float] = None, cost: Optional[float] = None) -> None:
+        """
+        Add an edge to the flow network, or change the capacity of an existing edge, and update the residual graph. The flow on the edge
+        is left as it is, so the caller must make sure that it still fits the capacity (update_capacity does this).
+
+        Parameters:
+            v1 (str): The source vertex.
+            v2 (str): The destination vertex.
+            weight (float): The capacity of the edge.
+            cost (Optional[float]): The cost per unit of flow, for min-cost flow. Default is to keep the current cost of the edge (none for a new edge).
+
+        >>> network = NetworkFlow(["S", "T"])
+        >>> network.add_vertex("A")
+        >>> network.add_edge("S", "A", 2, cost=3)
+        >>> network.add_edge("A", "T", 1, cost=1)
+        >>> min_cost_max_flow(network, "S", "T")[:2]
+        (1, 4)
+        """
+        super().add_edge(v1, v2, weight)
+        if cost is not None:
+            self.cost[(v1, v2)] = cost
+        self.update_residual_graph(v1, v2)
 
     def add_flow(self, v1: str, v2: str, flow: float) -> None:
         """
@@ -19,8 +126,9 @@ class NetworkFlow(Graph):
         """
         current_flow = self.get_flow(v1, v2)
 
-        if current_flow + flow < 0:
-                return self.add_flow(v2, v1, -flow)
+        if current_flow + flow < 0 or (current_flow + flow == 0 and self.adj_matrix[v1][v2] == 0 and self.adj_matrix[v2][v1] != 0):
+            # The result is flow from v2 to v1 (or cancels flow from v2 to v1 exactly, which may not have a v1 -> v2 edge)
+            return self.add_flow(v2, v1, -flow)
 
         if self.adj_matrix[v1][v2] != 0:
             if current_flow + flow <= self.adj_matrix[v1][v2]:
@@ -45,6 +153,108 @@ class NetworkFlow(Graph):
         for i in range(len(path) - 1):
             self.add_flow(path[i], path[i + 1], flow)
 
+    def set_flow(self, v1: str, v2: str, flow: float) -> None:
+        """
+        Set the net flow from v1 to v2, replacing the current flow between them.
+
+        Parameters:
+            v1 (str): The source vertex.
+            v2 (str): The destination vertex.
+            flow (float): The net flow (negative for flow from v2 to v1).
+        """
+        if flow < 0:
+            return self.set_flow(v2, v1, -flow)
+
+        if flow > self.adj_matrix[v1][v2]:
+            raise ValueError("Invalid flow: exceeds capacity.")
+
+        if v1 < v2:
+            self.flow_network[v1][v2] = flow
+        else:
+            self.flow_network[v2][v1] = -flow
+        self.update_residual_graph(v1, v2)
+
+    def flow_value(self, source: str) -> float:
+        """
+        Get the value of the current flow, i.e., the net flow out of the source.
+
+        Parameters:
+            source (str): The source vertex.
+
+        Returns:
+            float: The value of the flow.
+        """
+        return sum(self.get_flow(source, v) for v in self.vertices() if v != source)
+
+    def update_capacity(self, v1: str, v2: str, capacity: float, source: str, sink: str) -> float:
+        """
+        Change the capacity of an edge and recompute the maximum flow from the current flow instead of from scratch. If the edge carries
+        more flow than its new capacity, the excess is first rerouted from v1 to v2 through the residual graph, and whatever cannot be
+        rerouted is sent back from v1 to the source and pulled from the sink to v2, which makes the flow valid again. The flow is then
+        augmented back to a maximum flow. The edge keeps its cost.
+
+        Parameters:
+            v1 (str): The source vertex of the edge.
+            v2 (str): The destination vertex of the edge.
+            capacity (float): The new capacity (0 removes the edge).
+            source (str): The source vertex of the flow.
+            sink (str): The sink vertex of the flow.
+
+        Returns:
+            float: The value of the new maximum flow.
+
+        Time complexity: O(k * E) for k augmentations, which is small when the capacity changes little.
+
+        >>> network = NetworkFlow(["A", "B", "C", "D"], [("A", "B", 5), ("A", "C", 5), ("B", "D", 5), ("C", "D", 5), ("B", "C", 5)])
+        >>> edmonds_karp(network, "A", "D")
+        10
+        >>> network.update_capacity("C", "D", 2, "A", "D")
+        7
+        >>> network.update_capacity("B", "D", 9, "A", "D")
+        7
+        >>> network.update_capacity("A", "B", 9, "A", "D")
+        11
+        """
+        self.add_edge(v1, v2, capacity)
+        excess = self.get_flow(v1, v2) - capacity
+
+        if excess > 0:
+            # Cut the flow down to the new capacity. This leaves v1 with more inflow than outflow and v2 with less.
+            self.set_flow(v1, v2, capacity)
+            excess -= self.push_along_paths(v1, v2, excess)
+            if excess > 0:
+                # Nothing more can be rerouted, so give up the rest of the flow through the edge
+                if v1 != source:
+                    self.push_along_paths(v1, source, excess)
+                if v2 != sink:
+                    self.push_along_paths(sink, v2, excess)
+
+        ford_fulkerson(self, source, sink, find_path_bfs)
+        return self.flow_value(source)
+
+    def push_along_paths(self, start: str, end: str, amount: float) -> float:
+        """
+        Push up to the given amount of flow from start to end along shortest paths in the residual graph.
+
+        Parameters:
+            start (str): The vertex to push flow from.
+            end (str): The vertex to push flow to.
+            amount (float): The maximum amount of flow to push.
+
+        Returns:
+            float: The amount of flow pushed.
+        """
+        pushed = 0
+        while pushed < amount:
+            path = find_path_bfs(self.residual_graph, start, end)
+            if path is None:
+                break
+            flow = min(amount - pushed, min(self.residual_graph.edge_weight(path[i], path[i + 1]) for i in range(len(path) - 1)))
+            self.add_flow_path(path, flow)
+            pushed += flow
+
+        return pushed
+
     def get_flow(self, v1: str, v2: str) -> float:
         """
         Get the flow from v1 to v2. The flow is returned as positive if it's from v1 to v2, and negative if from v2 to v1.
@@ -62,12 +272,31 @@ class NetworkFlow(Graph):
 
         return self.flow_network[v1][v2]
 
-    def get_residual_graph(self) -> Graph:
+    def edge_flows(self) -> Dict[Tuple[str, str], float]:
+        """
+        Get the flow on every edge that carries flow.
+
+        Returns:
+            Dict[Tuple[str, str], float]: The flow of every edge (v1, v2) with positive flow from v1 to v2.
+
+        Time complexity: O(V + E)
+        """
+        flows = {}
+        # Every edge (v1, v2) with flow has the reverse residual edge v2 -> v1, so only the sparse residual edges need to be walked
+        for v2, arcs in self.residual_graph.arcs.items():
+            for v1 in arcs:
+                flow = self.get_flow(v1, v2)
+                if flow > 0:
+                    flows[(v1, v2)] = flow
+
+        return flows
+
+    def get_residual_graph(self) -> ResidualGraph:
         """
         Create and return the residual graph based on current flows and capacities.
 
         Returns:
-            Graph: The residual graph.
+            ResidualGraph: The residual graph.
         """
         residual_edges = []
         for v1, v2, capacity in self.edges():
@@ -86,7 +315,7 @@ class NetworkFlow(Graph):
                 # Add an edge in the forward direction if there's residual capacity
                 residual_edges.append((v1, v2, residual_capacity))
 
-        return Graph(self.vertices(), residual_edges)
+        return ResidualGraph(self.vertices(), residual_edges)
 
     def update_residual_graph(self, v1: str, v2: str) -> None:
         """
@@ -125,29 +354,36 @@ def ford_fulkerson(network: NetworkFlow, source: str, sink: str, find_path: Call
         source (str): The source vertex.
         sink (str): The sink vertex.
         find_path (Callable[[Graph, str, str], Optional[List[str]]]): The function to find an augmenting path in the residual graph. Takes the residual graph, source, and sink as parameters, and returns a list of vertices in the augmenting path.
+            The residual graph is the one maintained by the network, so find_path must not modify it.
 
     Returns:
         float: The maximum flow from source to sink.
+
+    Time complexity: O(k * (V + E)) for k augmenting paths found by a breadth-first search, since the residual graph lists the residual
+    edges of every vertex sparsely.
     """
     # Initialize max flow to 0
     max_flow = 0
 
+    # The network keeps its residual graph up to date as flow is added, so it never has to be rebuilt
+    residual_graph = network.residual_graph
+
     # Find an augmenting path in the residual graph
-    augmenting_path = find_path(network.get_residual_graph(), source, sink)
+    augmenting_path = find_path(residual_graph, source, sink)
 
     # Iterate until no augmenting path can be found
     while augmenting_path is not None:
         # Find the maximum flow along the path based on the residual capacities
-        min_flow_capacity = min([network.get_residual_graph().edge_weight(augmenting_path[i], augmenting_path[i + 1]) for i in range(len(augmenting_path) - 1)])
+        min_flow_capacity = min(residual_graph.edge_weight(augmenting_path[i], augmenting_path[i + 1]) for i in range(len(augmenting_path) - 1))
 
-        # Add the maximum flow along the path to the network
+        # Add the maximum flow along the path to the network (this also updates the residual graph)
         network.add_flow_path(augmenting_path, min_flow_capacity)
 
         # Add the maximum flow to the overall flow
         max_flow += min_flow_capacity
 
         # Find another augmenting path in the residual graph
-        augmenting_path = find_path(network.get_residual_graph(), source, sink)
+        augmenting_path = find_path(residual_graph, source, sink)
 
     # Return the maximum flow
     return max_flow
@@ -204,4 +440,545 @@ def edmonds_karp(network: NetworkFlow, source: str, sink: str) -> float:
         >>> edmonds_karp(network, "A", "E")
         10
     """
-    return ford_fulkerson(network, source, sink, find_path_bfs)
\ No newline at end of file
+    return ford_fulkerson(network, source, sink, find_path_bfs)
+
+def find_path_min_capacity(residual_graph: Graph, source: str, sink: str, min_capacity: float) -> Optional[List[str]]:
+    """
+    Find an augmenting path in the residual graph using breadth-first search over the residual edges with capacity at least min_capacity.
+
+    Parameters:
+        residual_graph (Graph): The residual graph.
+        source (str): The source vertex.
+        sink (str): The sink vertex.
+        min_capacity (float): The smallest residual capacity an edge on the path may have.
+
+    Returns:
+        Optional[List[str]]: A list of vertices in the augmenting path, or None if no such path exists.
+    """
+    pred = {source: None}
+    queue = deque([source])
+
+    while queue and sink not in pred:
+        u = queue.popleft()
+        for v, capacity in residual_graph.neighbors(u):
+            if v not in pred and capacity >= min_capacity:
+                pred[v] = u
+                queue.append(v)
+
+    if sink not in pred:
+        return None
+
+    # Reconstruct the path from source to sink
+    path = [sink]
+    while path[-1] != source:
+        path.append(pred[path[-1]])
+    path.reverse()
+
+    return path
+
+def capacity_scaling(network: NetworkFlow, source: str, sink: str) -> float:
+    """
+    Implement the capacity-scaling variant of Ford-Fulkerson to find the maximum flow from source to sink. Phase Δ only augments along
+    residual edges with capacity at least Δ, starting from the largest power of 2 not above the largest capacity and halving Δ every phase,
+    so the few large augmentations happen first. A final unrestricted phase handles non-integer capacities.
+
+    Parameters:
+        network (NetworkFlow): The flow network.
+        source (str): The source vertex.
+        sink (str): The sink vertex.
+
+    Returns:
+        float: The maximum flow from source to sink.
+
+    Time complexity: O(E^2 * log U) augmentation work for integer capacities, where U is the largest capacity.
+    Space complexity: O(V + E)
+
+    Examples:
+        >>> network = NetworkFlow(["A", "B", "C", "D"], [("A", "B", 1000), ("A", "C", 1000), ("B", "C", 1), ("B", "D", 1000), ("C", "D", 1000)])
+        >>> capacity_scaling(network, "A", "D")
+        2000
+    """
+    max_flow = 0
+    largest = max((capacity for _, _, capacity in network.edges()), default=0)
+
+    delta = 1
+    while delta * 2 <= largest:
+        delta *= 2
+
+    while delta >= 1:
+        max_flow += ford_fulkerson(network, source, sink, partial(find_path_min_capacity, min_capacity=delta))
+        delta //= 2
+
+    # Residual capacities below 1 are left only if some capacities are not integers
+    return max_flow + ford_fulkerson(network, source, sink, find_path_bfs)
+
+class MaxFlowResult:
+    """
+    A maximum flow together with a minimum cut.
+    """
+    def __init__(self, value: float, source_side: Set[str], cut_edges: List[Tuple[str, str, float]], flows: Dict[Tuple[str, str], float]):
+        """
+        Initialize a max-flow result.
+
+        Parameters:
+            value (float): The value of the maximum flow, which equals the capacity of the minimum cut.
+            source_side (Set[str]): The vertices on the source side of the minimum cut (those reachable from the source in the residual graph).
+            cut_edges (List[Tuple[str, str, float]]): The edges (v1, v2, capacity) from the source side to the sink side.
+            flows (Dict[Tuple[str, str], float]): The flow of every edge that carries flow.
+        """
+        self.value = value
+        self.source_side = source_side
+        self.cut_edges = cut_edges
+        self.flows = flows
+
+def max_flow_min_cut(network: NetworkFlow, source: str, sink: str, algorithm: Callable[[NetworkFlow, str, str], float] = edmonds_karp) -> MaxFlowResult:
+    """
+    Find a maximum flow and a minimum s-t cut. After the flow is maximum, the vertices reachable from the source in the residual graph form
+    the source side of a minimum cut, so the cut takes a single breadth-first search. The search and the collection of the cut edges and
+    flows only walk the sparse residual edges, so they take O(V + E) on top of the max-flow algorithm.
+
+    Parameters:
+        network (NetworkFlow): The flow network.
+        source (str): The source vertex.
+        sink (str): The sink vertex.
+        algorithm (Callable[[NetworkFlow, str, str], float]): The max-flow algorithm to run (e.g. edmonds_karp, dinic or push_relabel). Default is Edmonds-Karp.
+
+    Returns:
+        MaxFlowResult: The flow value, the source side of the cut, the cut edges and the per-edge flows.
+
+    Examples:
+        >>> network = NetworkFlow(["A", "B", "C", "D"], [("A", "B", 3), ("A", "C", 2), ("B", "D", 1), ("C", "D", 5)])
+        >>> result = max_flow_min_cut(network, "A", "D")
+        >>> result.value, sorted(result.source_side), sorted(result.cut_edges)
+        (3, ['A', 'B'], [('A', 'C', 2), ('B', 'D', 1)])
+    """
+    algorithm(network, source, sink)
+
+    source_side: Set[str] = set()
+    breadth_first_search(network.residual_graph, source, lambda vertex, _: source_side.add(vertex))
+    # Every cut edge (u, v) is saturated, so the residual graph has its reverse edge v -> u
+    residual = network.residual_graph.arcs
+    cut_edges = [(u, v, network.adj_matrix[u][v]) for v in network.vertices() if v not in source_side
+                 for u in residual[v] if u in source_side and network.adj_matrix[u][v] != 0]
+
+    return MaxFlowResult(sum(capacity for _, _, capacity in cut_edges), source_side, cut_edges, network.edge_flows())
+
+def residual_arrays(network: NetworkFlow) -> Tuple[List[str], List[List[int]], List[int], List[float], List[Tuple[str, str]]]:
+    """
+    Flatten the residual graph of a network into arrays of paired arcs. Every pair of vertices joined by an edge in either direction gets
+    two arcs, 2i (u -> v) and 2i + 1 (v -> u), so the reverse of arc e is e ^ 1. Pushing flow along an arc moves residual capacity to its
+    reverse, and the net flow from u to v grows by the residual capacity that arc 2i lost.
+
+    Parameters:
+        network (NetworkFlow): The flow network.
+
+    Returns:
+        Tuple[List[str], List[List[int]], List[int], List[float], List[Tuple[str, str]]]: The vertices (defining the indices), the arcs
+            leaving every vertex, the head and residual capacity of every arc, and the vertex pair (u, v) of every arc pair.
+
+    Time complexity: O(V + E) on top of network.edges().
+    """
+    vertices = network.vertices()
+    index = {v: i for i, v in enumerate(vertices)}
+    residual = network.residual_graph.adj_matrix
+    inf = network.residual_graph.default_weight
+    arcs: List[List[int]] = [[] for _ in vertices]
+    head, capacity, pairs = [], [], []
+    seen = set()
+
+    for u, v, _ in network.edges():
+        if (v, u) in seen:
+            continue
+        seen.add((u, v))
+
+        for a, b in ((u, v), (v, u)):
+            arcs[index[a]].append(len(head))
+            head.append(index[b])
+            capacity.append(residual[a][b] if residual[a][b] != inf else 0)
+        pairs.append((u, v))
+
+    return vertices, arcs, head, capacity, pairs
+
+def dinic(network: NetworkFlow, source: str, sink: str) -> float:
+    """
+    Implement Dinic's algorithm to find the maximum flow from source to sink. Every phase builds the level graph of the residual network
+    with a breadth-first search and saturates it with a blocking flow, found by an iterative depth-first search that keeps a current-arc
+    pointer per vertex so that no arc is scanned twice in a phase. The flows are written back to the network.
+
+    Parameters:
+        network (NetworkFlow): The flow network.
+        source (str): The source vertex.
+        sink (str): The sink vertex.
+
+    Returns:
+        float: The maximum flow from source to sink (on top of the flow already in the network).
+
+    Time complexity: O(V^2 * E), or O(E * sqrt(V)) on unit-capacity networks such as bipartite matching networks.
+    Space complexity: O(V + E)
+
+    Examples:
+        >>> network = NetworkFlow(["A", "B", "C", "D", "E"], [("A", "B", 10), ("B", "C", 15), ("B", "D", 5), ("C", "E", 10), ("D", "E", 10)])
+        >>> dinic(network, "A", "E")
+        10
+        >>> network.get_flow("A", "B"), network.get_flow("E", "C")
+        (10, -10)
+    """
+    vertices, arcs, head, capacity, pairs = residual_arrays(network)
+    initial_capacity = capacity[:]
+    s, t = vertices.index(source), vertices.index(sink)
+    max_flow = 0
+
+    while True:
+        # Build the level graph: level[v] is the BFS distance from the source over arcs with residual capacity
+        level = [-1] * len(vertices)
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            for e in arcs[u]:
+                if capacity[e] > 0 and level[head[e]] < 0:
+                    level[head[e]] = level[u] + 1
+                    queue.append(head[e])
+
+        if level[t] < 0:
+            break
+
+        # Find a blocking flow. path holds the arcs from the source to the current vertex, current[v] is v's next arc to try.
+        current = [0] * len(vertices)
+        path: List[int] = []
+        u = s
+        while True:
+            if u == t:
+                # Augment along the path and go back to the tail of the first saturated arc
+                bottleneck = min(capacity[e] for e in path)
+                for e in path:
+                    capacity[e] -= bottleneck
+                    capacity[e ^ 1] += bottleneck
+                max_flow += bottleneck
+                saturated = next(i for i, e in enumerate(path) if capacity[e] == 0)
+                del path[saturated:]
+                u = head[path[-1]] if path else s
+                continue
+
+            # Advance along the current arc if it leads to the next level
+            while current[u] < len(arcs[u]):
+                e = arcs[u][current[u]]
+                if capacity[e] > 0 and level[head[e]] == level[u] + 1:
+                    break
+                current[u] += 1
+            else:
+                # Dead end: no more flow can go through u in this phase
+                if u == s:
+                    break
+                level[u] = -1
+                e = path.pop()
+                u = head[e ^ 1]
+                current[u] += 1
+                continue
+
+            path.append(e)
+            u = head[e]
+
+    write_back_flows(network, pairs, initial_capacity, capacity)
+    return max_flow
+
+def push_relabel(network: NetworkFlow, source: str, sink: str, highest_label: bool = True) -> float:
+    """
+    Implement the push-relabel (preflow-push) algorithm to find the maximum flow from source to sink. Active vertices (with more inflow
+    than outflow) are discharged by pushing their excess to neighbors one level lower, and are relabeled (lifted) when they cannot push.
+    Heights are periodically recomputed exactly by a reverse breadth-first search from the sink (global relabeling), and when no vertex is
+    left at some height below V, every vertex above it is lifted to V at once because it can no longer reach the sink (gap heuristic).
+    The flows are written back to the network.
+
+    Parameters:
+        network (NetworkFlow): The flow network.
+        source (str): The source vertex.
+        sink (str): The sink vertex.
+        highest_label (bool): If True, always discharge an active vertex of maximum height (kept in buckets by height). If False, discharge active vertices in FIFO order.
+
+    Returns:
+        float: The maximum flow from source to sink (on top of the flow already in the network).
+
+    Time complexity: O(V^2 * sqrt(E)) with highest-label selection, O(V^3) with FIFO selection.
+    Space complexity: O(V + E)
+
+    Examples:
+        >>> network = NetworkFlow(["A", "B", "C", "D", "E"], [("A", "B", 10), ("B", "C", 15), ("B", "D", 5), ("C", "E", 10), ("D", "E", 10)])
+        >>> push_relabel(network, "A", "E")
+        10
+        >>> network.get_flow("A", "B")
+        10
+    """
+    vertices, arcs, head, capacity, pairs = residual_arrays(network)
+    initial_capacity = capacity[:]
+    n = len(vertices)
+    s, t = vertices.index(source), vertices.index(sink)
+
+    excess = [0] * n
+    height = [0] * n
+    # count[h] is the number of vertices at height h < n, used to detect gaps
+    count = [0] * n
+    current = [0] * n
+    buckets: List[List[int]] = [[] for _ in range(2 * n + 2)]
+    fifo = deque()
+    top = 0
+    relabels = 0
+
+    def activate(v: int) -> None:
+        nonlocal top
+        if highest_label:
+            buckets[height[v]].append(v)
+            top = max(top, height[v])
+        else:
+            fifo.append(v)
+
+    def next_active() -> Optional[int]:
+        # Entries are not removed when a vertex is lifted or runs out of excess, so skip the outdated ones
+        nonlocal top
+        if highest_label:
+            while top >= 0:
+                if not buckets[top]:
+                    top -= 1
+                    continue
+                v = buckets[top].pop()
+                if height[v] == top and excess[v] > 0:
+                    return v
+            return None
+
+        while fifo:
+            v = fifo.popleft()
+            if excess[v] > 0:
+                return v
+        return None
+
+    def global_relabel() -> None:
+        # Exact heights: the residual distance to the sink, or V plus the residual distance to the source for vertices that cannot reach the sink
+        nonlocal top
+        for v in range(n):
+            height[v] = 2 * n
+        height[t], height[s] = 0, n
+        for root in (t, s):
+            queue = deque([root])
+            while queue:
+                x = queue.popleft()
+                for e in arcs[x]:
+                    y = head[e]
+                    if capacity[e ^ 1] > 0 and height[y] == 2 * n:
+                        height[y] = height[x] + 1
+                        queue.append(y)
+
+        count[:] = [0] * n
+        for v in range(n):
+            if height[v] < n:
+                count[height[v]] += 1
+        current[:] = [0] * n
+
+        for bucket in buckets:
+            bucket.clear()
+        fifo.clear()
+        top = 0
+        for v in range(n):
+            if excess[v] > 0 and v != s and v != t:
+                activate(v)
+
+    def relabel(u: int) -> None:
+        nonlocal relabels
+        relabels += 1
+        old = height[u]
+        height[u] = 1 + min(height[head[e]] for e in arcs[u] if capacity[e] > 0)
+        current[u] = 0
+        if old < n:
+            count[old] -= 1
+        if height[u] < n:
+            count[height[u]] += 1
+
+        if old < n and count[old] == 0:
+            # Gap: nothing above this height can reach the sink anymore
+            for v in range(n):
+                if old < height[v] < n:
+                    count[height[v]] -= 1
+                    height[v] = n
+                    current[v] = 0
+                    if excess[v] > 0 and v != u:
+                        activate(v)
+
+    def discharge(u: int) -> None:
+        while excess[u] > 0:
+            if current[u] == len(arcs[u]):
+                relabel(u)
+                continue
+
+            e = arcs[u][current[u]]
+            w = head[e]
+            if capacity[e] > 0 and height[u] == height[w] + 1:
+                # Push as much excess as the arc allows
+                delta = min(excess[u], capacity[e])
+                capacity[e] -= delta
+                capacity[e ^ 1] += delta
+                if excess[w] == 0 and w != s and w != t:
+                    activate(w)
+                excess[u] -= delta
+                excess[w] += delta
+            else:
+                current[u] += 1
+
+    # Saturate every arc out of the source
+    for e in arcs[s]:
+        if capacity[e] > 0:
+            excess[head[e]] += capacity[e]
+            excess[s] -= capacity[e]
+            capacity[e ^ 1] += capacity[e]
+            capacity[e] = 0
+
+    global_relabel()
+    while True:
+        if relabels >= n:
+            relabels = 0
+            global_relabel()
+
+        u = next_active()
+        if u is None:
+            break
+        discharge(u)
+
+    write_back_flows(network, pairs, initial_capacity, capacity)
+    return excess[t]
+
+def write_back_flows(network: NetworkFlow, pairs: List[Tuple[str, str]], initial_capacity: List[float], capacity: List[float]) -> None:
+    """
+    Write the flows found on residual arc arrays (see residual_arrays) back to the network.
+
+    Parameters:
+        network (NetworkFlow): The flow network the arrays were built from.
+        pairs (List[Tuple[str, str]]): The vertex pair of every arc pair.
+        initial_capacity (List[float]): The residual capacity of every arc when the arrays were built.
+        capacity (List[float]): The final residual capacity of every arc.
+    """
+    # The net flow from u to v changed by the residual capacity that arc 2i lost
+    for i, (u, v) in enumerate(pairs):
+        if capacity[2 * i] != initial_capacity[2 * i]:
+            network.set_flow(u, v, network.get_flow(u, v) + initial_capacity[2 * i] - capacity[2 * i])
+
+class CostResidualGraph:
+    """
+    The residual graph of a network with edge costs, stored as paired arcs: every edge (v1, v2) becomes arc 2i with its capacity and cost,
+    and arc 2i + 1 (v2 -> v1) with no capacity and the negated cost, through which flow on the edge can be cancelled. Antiparallel edges
+    keep separate arcs. The graph exposes vertices, neighbors and edges with the arc costs as weights, so the shortest path algorithms
+    can run on it directly (parallel arcs show up as repeated neighbors).
+    """
+    def __init__(self, network: NetworkFlow):
+        """
+        Build the residual graph of a network with zero flow.
+
+        Parameters:
+            network (NetworkFlow): The flow network. Edges without a cost have cost 0.
+        """
+        self.undirected = False
+        self.vertex_list = network.vertices()
+        self.arcs: Dict[str, List[int]] = {v: [] for v in self.vertex_list}
+        self.head: List[str] = []
+        self.capacity: List[float] = []
+        self.cost: List[float] = []
+        self.edge_list: List[Tuple[str, str]] = []
+
+        for v1, v2, capacity in network.edges():
+            cost = network.cost.get((v1, v2), 0)
+            for tail, head, arc_capacity, arc_cost in ((v1, v2, capacity, cost), (v2, v1, 0, -cost)):
+                self.arcs[tail].append(len(self.head))
+                self.head.append(head)
+                self.capacity.append(arc_capacity)
+                self.cost.append(arc_cost)
+            self.edge_list.append((v1, v2))
+
+    def vertices(self) -> List[str]:
+        """
+        Get all vertices.
+        """
+        return self.vertex_list
+
+    def neighbors(self, vertex: str) -> List[Tuple[str, float]]:
+        """
+        Get the heads and costs of the arcs with residual capacity leaving a vertex.
+        """
+        return [(self.head[e], self.cost[e]) for e in self.arcs[vertex] if self.capacity[e] > 0]
+
+    def edges(self) -> List[Tuple[str, str, float]]:
+        """
+        Get all arcs with residual capacity as tuples (v1, v2, cost).
+        """
+        return [(v, self.head[e], self.cost[e]) for v in self.vertex_list for e in self.arcs[v] if self.capacity[e] > 0]
+
+    def cheapest_arc(self, v1: str, v2: str) -> int:
+        """
+        Get the cheapest arc with residual capacity from v1 to v2 (the one a shortest path uses).
+        """
+        return min((e for e in self.arcs[v1] if self.head[e] == v2 and self.capacity[e] > 0), key=self.cost.__getitem__)
+
+def min_cost_max_flow(network: NetworkFlow, source: str, sink: str) -> Tuple[float, float, Dict[Tuple[str, str], float]]:
+    """
+    Find a maximum flow of minimum cost with successive shortest paths: flow is always augmented along a cheapest path in the residual
+    graph. Johnson-style potentials keep every reduced arc cost non-negative, so each path is found by Dijkstra's algorithm; Bellman-Ford
+    is only needed once, for the initial potentials when some costs are negative. The flows are written to the network, replacing any
+    flow already in it.
+
+    Parameters:
+        network (NetworkFlow): The flow network, with edge costs given as (v1, v2, capacity, cost) tuples. There must be no negative-cost cycle.
+        source (str): The source vertex.
+        sink (str): The sink vertex.
+
+    Returns:
+        Tuple[float, float, Dict[Tuple[str, str], float]]: The value of the maximum flow, its total cost and the flow of every edge that carries flow.
+
+    Time complexity: O(F * (V + E) log V) for integer capacities, where F is the value of the maximum flow (one Dijkstra run per augmenting path).
+    Space complexity: O(V + E)
+
+    Examples:
+        >>> network = NetworkFlow(["S", "A", "B", "T"], [("S", "A", 2, 1), ("S", "B", 1, 5), ("A", "T", 1, 1), ("A", "B", 1, 1), ("B", "T", 2, 1)])
+        >>> flow, cost, flows = min_cost_max_flow(network, "S", "T")
+        >>> flow, cost
+        (3, 11)
+        >>> flows[("A", "B")]
+        1
+    """
+    residual = CostResidualGraph(network)
+    max_flow, total_cost = 0, 0
+
+    # Initial potentials: shortest path costs from the source (vertices it cannot reach are never reached later either)
+    potentials = {v: 0 for v in residual.vertices()}
+    if any(cost < 0 for cost in residual.cost[::2]):
+        dist, _ = bellman_ford_sssp(residual, source)
+        potentials = {v: d if d != float('inf') else 0 for v, d in dist.items()}
+
+    while True:
+        # Find a cheapest augmenting path. The reduced costs are non-negative, so Dijkstra's algorithm applies.
+        dist, pred = dijkstra_sssp(residual, source, potentials)
+        if dist[sink] == float('inf'):
+            break
+
+        # The new distances keep the reduced costs non-negative, including on the reversed arcs of the path
+        potentials = {v: d if d != float('inf') else potentials[v] for v, d in dist.items()}
+
+        path = []
+        v = sink
+        while v != source:
+            path.append(residual.cheapest_arc(pred[v], v))
+            v = pred[v]
+
+        # Augment along the path by its bottleneck capacity
+        bottleneck = min(residual.capacity[e] for e in path)
+        for e in path:
+            residual.capacity[e] -= bottleneck
+            residual.capacity[e ^ 1] += bottleneck
+            total_cost += bottleneck * residual.cost[e]
+        max_flow += bottleneck
+
+    # The flow on edge i is the capacity its reverse arc gained
+    flows = {edge: residual.capacity[2 * i + 1] for i, edge in enumerate(residual.edge_list) if residual.capacity[2 * i + 1] > 0}
+    # The network stores one net flow per pair of vertices
+    written = set()
+    for v1, v2 in residual.edge_list:
+        if (v2, v1) not in written:
+            written.add((v1, v2))
+            network.set_flow(v1, v2, flows.get((v1, v2), 0) - flows.get((v2, v1), 0))
+
+    return max_flow, total_cost, flows
@@ -0,0 +1,244 @@
+from typing import Callable, Dict, Iterable, List, Optional, Any
+from functools import reduce
+from operator import add, and_
+from graph import Graph
+
+class Semiring:
+    """
+    A semiring (S, ⊕, ⊗, 0, 1) used to generalize matrix multiplication. The ordinary product uses (+, ×), shortest paths use (min, +),
+    longest paths use (max, +) and reachability uses (or, and).
+    """
+    def __init__(self, add: Callable[[Any, Any], Any], multiply: Callable[[Any, Any], Any], zero: Any, one: Any,
+                 total: Optional[Callable[[Iterable[Any]], Any]] = None, edge_value: Optional[Callable[[float], Any]] = None):
+        """
+        Initialize a semiring.
+
+        Parameters:
+            add (Callable): The ⊕ operation, which must be associative and commutative with identity zero.
+            multiply (Callable): The ⊗ operation, which must be associative with identity one and distribute over ⊕.
+            zero (Any): The identity of ⊕, which must also annihilate ⊗ (zero ⊗ x = zero).
+            one (Any): The identity of ⊗.
+            total (Optional[Callable]): The ⊕-sum of an iterable of values (zero if it is empty), e.g. a builtin like min or any.
+                Default is to fold the values with add.
+            edge_value (Optional[Callable]): Maps an edge weight to its matrix entry. Default is to use the weight itself.
+        """
+        self.add = add
+        self.multiply = multiply
+        self.zero = zero
+        self.one = one
+        self.total = total or (lambda values: reduce(add, values, zero))
+        self.edge_value = edge_value or (lambda weight: weight)
+
+MIN_PLUS = Semiring(min, add, float('inf'), 0, lambda values: min(values, default=float('inf')))
+MAX_PLUS = Semiring(max, add, float('-inf'), 0, lambda values: max(values, default=float('-inf')))
+BOOLEAN = Semiring(lambda x, y: x or y, and_, False, True, any, lambda weight: True)
+
+def semiring_multiply(A: List[List[Any]], B: List[List[Any]], semiring: Semiring = MIN_PLUS) -> List[List[Any]]:
+    """
+    Multiply two matrices over a semiring, i.e., C[i][j] = ⊕_k (A[i][k] ⊗ B[k][j]).
+
+    B is transposed once, so every entry is a single ⊕-reduction (e.g. min) over the ⊗-map of a row of A and a column of B, which runs
+    inside the builtins instead of as a Python-level loop per term.
+
+    Parameters:
+        A (List[List[Any]]): The first matrix (n x m).
+        B (List[List[Any]]): The second matrix (m x p).
+        semiring (Semiring): The semiring to multiply over. Default is the min-plus semiring.
+
+    Returns:
+        List[List[Any]]: The product of A and B (n x p).
+
+    Time complexity: O(n * m * p)
+    Space complexity: O(n * p)
+
+    Examples:
+        >>> semiring_multiply([[0, 1], [float('inf'), 0]], [[0, 1], [float('inf'), 0]])
+        [[0, 1], [inf, 0]]
+        >>> semiring_multiply([[False, True], [False, False]], [[False, True], [True, False]], BOOLEAN)
+        [[True, False], [False, False]]
+    """
+    if A and len(A[0]) != len(B):
+        raise ValueError("The number of columns of A must match the number of rows of B")
+
+    total, multiply = semiring.total, semiring.multiply
+    columns = list(zip(*B))
+    return [[total(map(multiply, row, column)) for column in columns] for row in A]
+
+def semiring_identity(n: int, semiring: Semiring = MIN_PLUS) -> List[List[Any]]:
+    """
+    Get the n x n identity matrix of a semiring (one on the diagonal, zero elsewhere).
+
+    Parameters:
+        n (int): The size of the matrix.
+        semiring (Semiring): The semiring. Default is the min-plus semiring.
+
+    Returns:
+        List[List[Any]]: The identity matrix.
+    """
+    return [[semiring.one if i == j else semiring.zero for j in range(n)] for i in range(n)]
+
+def semiring_power(A: List[List[Any]], k: int, semiring: Semiring = MIN_PLUS) -> List[List[Any]]:
+    """
+    Raise a square matrix to the k-th power over a semiring using repeated squaring.
+
+    Parameters:
+        A (List[List[Any]]): The square matrix.
+        k (int): The (non-negative) exponent.
+        semiring (Semiring): The semiring. Default is the min-plus semiring.
+
+    Returns:
+        List[List[Any]]: A^k over the semiring.
+
+    Time complexity: O(n^3 log k) where n is the number of rows/columns in the matrix.
+    Space complexity: O(n^2)
+
+    >>> semiring_power([[float('inf'), 1], [1, float('inf')]], 2)
+    [[2, inf], [inf, 2]]
+    """
+    if k < 0:
+        raise ValueError("The exponent must be non-negative")
+
+    result = semiring_identity(len(A), semiring)
+    base = A
+
+    while k > 0:
+        if k & 1:
+            result = semiring_multiply(result, base, semiring)
+        k >>= 1
+        if k > 0:
+            base = semiring_multiply(base, base, semiring)
+
+    return result
+
+def graph_to_matrix(graph: Graph, semiring: Semiring = MIN_PLUS, include_identity: bool = True) -> List[List[Any]]:
+    """
+    Build the adjacency matrix of a graph over a semiring. Edges map to semiring.edge_value(weight) and missing edges map to zero.
+
+    Parameters:
+        graph (Graph): The graph.
+        semiring (Semiring): The semiring. Default is the min-plus semiring.
+        include_identity (bool): If True, the diagonal is set to one, so that powers count paths with at most k edges. If False, the powers count paths with exactly k edges.
+
+    Returns:
+        List[List[Any]]: The adjacency matrix, with rows and columns in the order of graph.vertices().
+    """
+    vertices = graph.vertices()
+    index = {v: i for i, v in enumerate(vertices)}
+    matrix = [[semiring.zero] * len(vertices) for _ in vertices]
+
+    for u, v, w in graph.edges():
+        value = semiring.edge_value(w)
+        matrix[index[u]][index[v]] = value
+        if graph.undirected:
+            matrix[index[v]][index[u]] = value
+
+    if include_identity:
+        for i in range(len(vertices)):
+            matrix[i][i] = semiring.one
+
+    return matrix
+
+def matrix_to_dict(graph: Graph, matrix: List[List[Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Convert a matrix indexed like graph.vertices() back into a dictionary of dictionaries keyed by vertex.
+
+    Parameters:
+        graph (Graph): The graph the matrix was built from.
+        matrix (List[List[Any]]): The matrix.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The matrix keyed by vertex.
+    """
+    vertices = graph.vertices()
+    return {u: dict(zip(vertices, row)) for u, row in zip(vertices, matrix)}
+
+def repeated_squaring_apsp(graph: Graph) -> Dict[str, Dict[str, float]]:
+    """
+    All-pairs shortest paths by repeated squaring of the adjacency matrix over the min-plus semiring. This algorithm can detect negative-weight cycles.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The shortest distances between all pairs of vertices.
+
+    Time complexity: O(V^3 log V) where V is the number of vertices.
+    Space complexity: O(V^2) where V is the number of vertices.
+
+    >>> graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', 1), ('B', 'C', 2), ('C', 'D', 3)])
+    >>> dist = repeated_squaring_apsp(graph)
+    >>> dist['A']['D']
+    6
+    """
+    dist = graph_to_matrix(graph, MIN_PLUS)
+    n = len(dist)
+
+    # After i squarings, dist holds the shortest paths with at most 2^i edges. Squaring until 2^i >= V makes every negative-weight cycle
+    # (which has at most V edges) show up on the diagonal. We can stop early once squaring no longer changes the matrix.
+    hops = 1
+    while hops < n:
+        squared = semiring_multiply(dist, dist, MIN_PLUS)
+        hops *= 2
+        if squared == dist:
+            break
+        dist = squared
+
+    # Check for negative-weight cycles
+    if any(dist[i][i] < 0 for i in range(n)):
+        raise ValueError('Graph contains a negative-weight cycle')
+
+    return matrix_to_dict(graph, dist)
+
+def transitive_closure(graph: Graph) -> Dict[str, Dict[str, bool]]:
+    """
+    Compute the reflexive transitive closure of a graph by repeated squaring over the boolean semiring.
+
+    Parameters:
+        graph (Graph): The graph.
+
+    Returns:
+        Dict[str, Dict[str, bool]]: reachable[u][v] is True if v can be reached from u (every vertex reaches itself).
+
+    Time complexity: O(V^3 log V) where V is the number of vertices.
+    Space complexity: O(V^2) where V is the number of vertices.
+
+    >>> graph = Graph(['A', 'B', 'C'], [('A', 'B'), ('B', 'C')])
+    >>> reachable = transitive_closure(graph)
+    >>> reachable['A']['C'], reachable['C']['A']
+    (True, False)
+    """
+    reachable = graph_to_matrix(graph, BOOLEAN)
+
+    while True:
+        squared = semiring_multiply(reachable, reachable, BOOLEAN)
+        if squared == reachable:
+            break
+        reachable = squared
+
+    return matrix_to_dict(graph, reachable)
+
+def hop_limited_apsp(graph: Graph, k: int, exact: bool = False, semiring: Optional[Semiring] = None) -> Dict[str, Dict[str, float]]:
+    """
+    All-pairs shortest paths using at most k edges (or exactly k edges), computed as the k-th power of the adjacency matrix.
+
+    Parameters:
+        graph (Graph): The graph to traverse.
+        k (int): The maximum (or exact) number of edges on a path.
+        exact (bool): If True, only walks with exactly k edges are considered. Default is False (at most k edges).
+        semiring (Optional[Semiring]): The semiring. Default is min-plus (shortest paths); max-plus gives longest walks.
+
+    Returns:
+        Dict[str, Dict[str, float]]: dist[u][v] is the best weight of a walk from u to v with at most (or exactly) k edges.
+
+    Time complexity: O(V^3 log k) where V is the number of vertices.
+    Space complexity: O(V^2) where V is the number of vertices.
+
+    >>> graph = Graph(['A', 'B', 'C'], [('A', 'B', 1), ('B', 'C', 1), ('A', 'C', 5)])
+    >>> hop_limited_apsp(graph, 1)['A']['C']
+    5
+    >>> hop_limited_apsp(graph, 2)['A']['C']
+    2
+    """
+    semiring = semiring or MIN_PLUS
+    matrix = graph_to_matrix(graph, semiring, include_identity=not exact)
+    return matrix_to_dict(graph, semiring_power(matrix, k, semiring))
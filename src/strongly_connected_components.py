@@ -1,28 +1,95 @@
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from functools import partial
 from graph import Graph
-from depth_first_search import dfs_helper
-from quick_sort import quick_sort
+from union_find import RollbackUnionFind
 
-class SCCGraph(Graph):
+class SCCGraph:
     """
-    A graph where each vertex represents a strongly connected component in the original graph.
+    The condensation of a directed graph: each vertex is the integer id of a strongly connected component in the original graph, and
+    there is one edge per pair of components joined by at least one edge. The condensation is stored sparsely, so memory is O(k + E)
+    for k components instead of O(k^2), and it is acyclic with the ids already in topological order.
     """
     def __init__(self, sccs: List[List[str]], original_graph: Graph):
-        super().__init__(vertices=[str(i) for i in range(len(sccs))], undirected=False)
+        """
+        Build the condensation of a graph.
+
+        Parameters:
+            sccs (List[List[str]]): The strongly connected components, in topological order of the condensation (as returned by get_strongly_connected_components).
+            original_graph (Graph): The graph the components were found in.
+        """
+        self.undirected = False
+        # The condensation is never modified after it is built, so it keeps its first version (see cached_topological_sort)
+        self.version = 0
         self.sccs = sccs
         self.scc_mapping = {v: idx for idx, scc in enumerate(sccs) for v in scc}
+        self.sizes = [len(scc) for scc in sccs]
+        # adjacency[c][d] is the number of edges of the original graph from component c to component d
+        self.adjacency: List[Dict[int, int]] = [{} for _ in sccs]
         self.build_scc_graph(sccs, original_graph)
 
-    """
-    Build the SCC graph from the original graph and the list of SCCs.
-    """
-    def build_scc_graph(self, sccs: List[List[str]], original_graph: Graph):
+    def build_scc_graph(self, sccs: List[List[str]], original_graph: Graph) -> None:
+        """
+        Build the SCC graph from the original graph and the list of SCCs, counting the edges between every pair of components.
+        """
         for scc_index, scc in enumerate(sccs):
+            successors = self.adjacency[scc_index]
             for vertex in scc:
                 for neighbor, _ in original_graph.neighbors(vertex):
                     neighbor_scc_index = self.scc_mapping[neighbor]
                     if neighbor_scc_index != scc_index:
-                        self.add_edge(str(scc_index), str(neighbor_scc_index))
+                        successors[neighbor_scc_index] = successors.get(neighbor_scc_index, 0) + 1
+
+    def vertices(self) -> List[int]:
+        """
+        Get the component ids.
+
+        Returns:
+            List[int]: The ids 0..k-1 of the components.
+        """
+        return list(range(len(self.sccs)))
+
+    def neighbors(self, scc_index: int) -> List[Tuple[int, int]]:
+        """
+        Get the components that a component has edges to.
+
+        Parameters:
+            scc_index (int): The id of the component.
+
+        Returns:
+            List[Tuple[int, int]]: A list of tuples, each containing a successor component and the weight of the edge to it, which is 1.
+        """
+        return [(d, 1) for d in self.adjacency[scc_index]]
+
+    def edges(self) -> List[Tuple[int, int, int]]:
+        """
+        Get all edges of the condensation.
+
+        Returns:
+            List[Tuple[int, int, int]]: The edges as tuples (c, d, 1).
+        """
+        return [(c, d, 1) for c, successors in enumerate(self.adjacency) for d in successors]
+
+    def multiplicity(self, c: int, d: int) -> int:
+        """
+        Get the number of edges of the original graph from component c to component d.
+
+        Parameters:
+            c (int): The id of the source component.
+            d (int): The id of the destination component.
+
+        Returns:
+            int: The number of original edges, 0 if the components are not joined.
+        """
+        return self.adjacency[c].get(d, 0)
+
+    def topological_order(self) -> List[int]:
+        """
+        Get a topological order of the components. The ids are assigned in topological order, so this is simply 0..k-1.
+
+        Returns:
+            List[int]: The component ids in topological order.
+        """
+        return self.vertices()
 
     def get_scc_vertices(self, scc_index: int) -> List[str]:
         """
@@ -52,44 +119,149 @@ class SCCGraph(Graph):
             raise ValueError("Vertex not found in the original graph")
         return self.scc_mapping[vertex]
 
-def get_strongly_connected_components(graph: Graph) -> List[List[str]]:
+def adjacency_arrays(graph: Graph) -> Tuple[List[str], List[int], List[int]]:
     """
-    Finds strongly connected components in a directed graph using Kosaraju's algorithm.
+    Flatten the adjacency lists of a graph into compressed sparse row (CSR) arrays.
+
+    Parameters:
+        graph (Graph): The graph.
+
+    Returns:
+        Tuple[List[str], List[int], List[int]]: The vertices (defining the indices), the offsets and the targets. The out-neighbors of
+            vertex i are targets[offsets[i]:offsets[i + 1]].
+
+    Time complexity: O(V + E) on top of graph.neighbors().
+    """
+    vertices = graph.vertices()
+    index = {v: i for i, v in enumerate(vertices)}
+    offsets = [0]
+    targets = []
+
+    for v in vertices:
+        targets.extend(index[u] for u, _ in graph.neighbors(v))
+        offsets.append(len(targets))
+
+    return vertices, offsets, targets
+
+def scc_component_ids(num_vertices: int, offsets: List[int], targets: List[int]) -> Tuple[List[int], int]:
+    """
+    Find the strongly connected components of a graph given as CSR arrays, using Pearce's single-pass variant of Tarjan's algorithm.
+    The depth-first search is iterative, and a single integer per vertex serves as the DFS index, the low-link and the component id,
+    so apart from the arrays this only needs a root flag and a resume pointer per vertex.
+
+    Parameters:
+        num_vertices (int): The number of vertices.
+        offsets (List[int]): The CSR offsets (num_vertices + 1 entries).
+        targets (List[int]): The CSR targets.
+
+    Returns:
+        Tuple[List[int], int]: The component id of every vertex and the number of components. Ids are numbered in topological order of
+            the condensation, i.e., every edge between two components goes from a smaller id to a larger id.
+
+    Time complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+    Space complexity: O(V) where V is the number of vertices.
+
+    >>> scc_component_ids(3, [0, 1, 2, 3], [1, 0, 0])
+    ([1, 1, 0], 2)
+    """
+    n = num_vertices
+    # rindex[v] is 0 for unvisited vertices, the low-link while v is on the stack, and the component value once v is assigned.
+    # Component values count down from n, which always stays above the DFS index of every vertex still on the stack.
+    rindex = [0] * n
+    root = bytearray(n)
+    next_edge = offsets[:-1]
+    index = 1
+    component = n
+    stack = []
+
+    for start in range(n):
+        if rindex[start]:
+            continue
+
+        rindex[start] = index
+        index += 1
+        root[start] = True
+        call_stack = [start]
+
+        while call_stack:
+            v = call_stack[-1]
+            e, end = next_edge[v], offsets[v + 1]
+
+            while e < end:
+                w = targets[e]
+                if not rindex[w]:
+                    # Descend into w. The edge is scanned again after w finishes, which updates v's low-link.
+                    rindex[w] = index
+                    index += 1
+                    root[w] = True
+                    call_stack.append(w)
+                    break
+                if rindex[w] < rindex[v]:
+                    rindex[v] = rindex[w]
+                    root[v] = False
+                e += 1
+
+            next_edge[v] = e
+            if e < end:
+                continue
+
+            # All edges of v are done
+            call_stack.pop()
+            if root[v]:
+                # v is the root of a component: assign it together with everything above it on the stack
+                index -= 1
+                while stack and rindex[v] <= rindex[stack[-1]]:
+                    w = stack.pop()
+                    rindex[w] = component
+                    index -= 1
+                rindex[v] = component
+                component -= 1
+            else:
+                stack.append(v)
+
+    # Components were assigned in reverse topological order, counting down from n
+    return [r - component - 1 for r in rindex], n - component
+
+def get_scc_ids(graph: Graph) -> Tuple[List[int], List[List[str]]]:
+    """
+    Find the strongly connected components of a directed graph in a single depth-first pass (see scc_component_ids).
 
     Parameters:
         graph (Graph): The graph to find SCCs in.
 
     Returns:
-        List[List[str]]: A list of strongly connected components.
+        Tuple[List[int], List[List[str]]]: The component id of every vertex (in the order of graph.vertices()) and the components
+            indexed by id. Ids are numbered in topological order of the condensation.
 
-    Time complexity: O(V + E)
+    Time complexity: O(V + E) on top of building the adjacency arrays.
+    Space complexity: O(V + E) where V is the number of vertices and E is the number of edges.
+
+    >>> graph = Graph(['A', 'B', 'C'], [('A', 'B'), ('B', 'A'), ('B', 'C')])
+    >>> get_scc_ids(graph)
+    ([0, 0, 1], [['A', 'B'], ['C']])
     """
-    # First pass: Run DFS on the graph and store vertices by finish times
-    _, _, finish_times, _ = dfs_helper(graph, None, None)
-    vertices_by_finish_time = quick_sort(graph.vertices(), comparator=lambda v1, v2: finish_times[v1] > finish_times[v2])
+    vertices, offsets, targets = adjacency_arrays(graph)
+    ids, count = scc_component_ids(len(vertices), offsets, targets)
 
-    # Reverse the graph
-    reversed_graph = graph.get_reversed()
+    sccs = [[] for _ in range(count)]
+    for vertex, scc_id in zip(vertices, ids):
+        sccs[scc_id].append(vertex)
 
-    # Second pass: Run DFS on the reversed graph in order of decreasing finish times
-    visited = {vertex: False for vertex in graph.vertices()}
-    current_scc = []
-    sccs = []
+    return ids, sccs
 
-    def collect_scc(vertex: str, _: Optional[str]):
-        nonlocal current_scc
-        if visited[vertex]:
-            return
-        visited[vertex] = True
-        current_scc.append(vertex)
+def get_strongly_connected_components(graph: Graph) -> List[List[str]]:
+    """
+    Finds strongly connected components in a directed graph using Pearce's single-pass variant of Tarjan's algorithm.
 
-    for vertex in vertices_by_finish_time:
-        if not visited[vertex]:
-            current_scc = []
-            dfs_helper(reversed_graph, vertex, collect_scc)
-            sccs.append(current_scc)
+    Parameters:
+        graph (Graph): The graph to find SCCs in.
 
-    return sccs
+    Returns:
+        List[List[str]]: A list of strongly connected components, in topological order of the condensation.
+
+    Time complexity: O(V + E)
+    """
+    return get_scc_ids(graph)[1]
 
 def get_scc_graph(graph: Graph) -> SCCGraph:
     """
@@ -100,5 +272,253 @@ def get_scc_graph(graph: Graph) -> SCCGraph:
 
     Returns:
         SCCGraph: The SCC graph of the given graph.
+
+    >>> scc_graph = get_scc_graph(Graph(['A', 'B', 'C'], [('A', 'B'), ('B', 'A'), ('A', 'C'), ('B', 'C')]))
+    >>> scc_graph.sizes, scc_graph.edges(), scc_graph.multiplicity(0, 1)
+    ([2, 1], [(0, 1, 1)], 2)
     """
-    return SCCGraph(get_strongly_connected_components(graph), graph)
\ No newline at end of file
+    return SCCGraph(get_strongly_connected_components(graph), graph)
+
+class IncrementalSCC:
+    """
+    Maintains the strongly connected components of a directed graph under edge insertions. Components are merged with a union-find
+    structure, so same_scc and scc_of take near-constant time. The condensation is kept in topological order (Pearce-Kelly): an edge that
+    agrees with the order costs O(1), otherwise only the components between its endpoints are searched, and the components on a newly
+    closed cycle are merged into one. checkpoint() and rollback() undo insertions by replaying a log of the changes they made.
+
+    >>> scc = IncrementalSCC(['A', 'B', 'C'])
+    >>> scc.add_edge('A', 'B')
+    []
+    >>> scc.add_edge('B', 'C')
+    []
+    >>> scc.same_scc('A', 'C')
+    False
+    >>> sorted(scc.add_edge('C', 'A'))
+    ['B', 'C']
+    >>> scc.same_scc('A', 'C')
+    True
+    """
+    def __init__(self, vertices: Optional[List[str]] = None):
+        """
+        Initialize the structure with isolated vertices.
+
+        Parameters:
+            vertices (Optional[List[str]]): The initial vertices. More vertices are added as edges reference them.
+        """
+        self.components = RollbackUnionFind()
+        # The following are keyed by the union-find root of each component
+        self.members: Dict[str, List[str]] = {}
+        self.successors: Dict[str, Set[str]] = {}
+        self.predecessors: Dict[str, Set[str]] = {}
+        self.position: Dict[str, int] = {}
+        self.order: List[Optional[str]] = []
+        # Undo actions for every change since the first open checkpoint, and the length of the trail at every open checkpoint
+        self.trail: List[Callable[[], Any]] = []
+        self.checkpoints: List[int] = []
+
+        for v in vertices or []:
+            self.add_vertex(v)
+
+    def add_vertex(self, v: str) -> None:
+        """
+        Add an isolated vertex, placed at the end of the topological order. Does nothing if the vertex already exists.
+
+        Parameters:
+            v (str): Vertex identifier.
+        """
+        if v in self.components.root:
+            return
+
+        self.components.make_set(v)
+        self._assign(self.members, v, [v])
+        self._assign(self.successors, v, set())
+        self._assign(self.predecessors, v, set())
+        self._assign(self.position, v, len(self.order))
+        self._extend(self.order, [v])
+
+    def add_edge(self, v1: str, v2: str) -> List[str]:
+        """
+        Add an edge and update the components.
+
+        Parameters:
+            v1 (str): The source vertex.
+            v2 (str): The destination vertex.
+
+        Returns:
+            List[str]: The vertices that changed component, i.e., the members of the components absorbed into a merged component.
+                Empty if no components were merged.
+
+        Time complexity: O(1) if the edge agrees with the current order, otherwise O(size of the affected region + its edges).
+        """
+        self.add_vertex(v1)
+        self.add_vertex(v2)
+        source, target = self.components.find(v1), self.components.find(v2)
+        self._add(self.successors[source], [v2])
+        self._add(self.predecessors[target], [v1])
+
+        if source == target or self.position[source] < self.position[target]:
+            return []
+
+        # target comes before source: find the components after target that it reaches and the ones before source that reach it
+        lower, upper = self.position[target], self.position[source]
+        forward = self._search(target, self.successors, lambda position: position <= upper)
+        backward = self._search(source, self.predecessors, lambda position: position >= lower)
+        positions = sorted(self.position[c] for c in set(forward) | set(backward))
+
+        if source not in forward:
+            # No cycle: move the backward region in front of the forward region
+            region = sorted(backward, key=self.position.__getitem__) + sorted(forward, key=self.position.__getitem__)
+            moved = []
+        else:
+            # The components reachable from target that also reach source are now on a cycle through the new edge
+            cycle = [c for c in forward if c in backward]
+            root, moved = self._merge(cycle)
+            before = sorted((c for c in backward if c not in forward), key=self.position.__getitem__)
+            after = sorted((c for c in forward if c not in backward), key=self.position.__getitem__)
+            region = before + [root] + after
+
+            # The region shrank, so free positions right after the merged component: the backward part only moves down and the
+            # forward part only moves up, which keeps every edge to or from outside the region pointing the right way
+            for position in positions[len(before) + 1:len(positions) - len(after)]:
+                self._assign(self.order, position, None)
+            positions = positions[:len(before) + 1] + positions[len(positions) - len(after):]
+
+        for position, component in zip(positions, region):
+            self._assign(self.position, component, position)
+            self._assign(self.order, position, component)
+
+        return moved
+
+    def checkpoint(self) -> None:
+        """
+        Open a checkpoint that rollback() returns to.
+
+        Time complexity: O(1)
+        """
+        self.components.checkpoint()
+        self.checkpoints.append(len(self.trail))
+
+    def rollback(self) -> None:
+        """
+        Undo every vertex and edge insertion since the last open checkpoint and close it. Raises IndexError if there is no open checkpoint.
+
+        Time complexity: O(number of changes undone), which is at most the work done by the insertions being undone.
+        """
+        mark = self.checkpoints.pop()
+        while len(self.trail) > mark:
+            self.trail.pop()()
+        self.components.rollback()
+
+    def same_scc(self, v1: str, v2: str) -> bool:
+        """
+        Check whether two vertices are in the same strongly connected component.
+
+        Time complexity: O(α(n)), where α(n) is the inverse Ackermann function, effectively constant.
+        """
+        return self.components.connected(v1, v2)
+
+    def scc_of(self, v: str) -> str:
+        """
+        Get the representative vertex of the strongly connected component containing v.
+
+        Time complexity: O(α(n)), where α(n) is the inverse Ackermann function, effectively constant.
+        """
+        return self.components.find(v)
+
+    def get_scc_vertices(self, v: str) -> List[str]:
+        """
+        Get the vertices in the strongly connected component containing v.
+        """
+        return self.members[self.components.find(v)]
+
+    def topological_order(self) -> List[str]:
+        """
+        Get the representatives of all components in topological order of the condensation.
+
+        Time complexity: O(V)
+        """
+        return [c for c in self.order if c is not None]
+
+    def _search(self, start: str, adjacency: Dict[str, Set[str]], in_region: Callable[[int], bool]) -> Dict[str, None]:
+        """
+        Find the components reachable from start along adjacency whose position is inside the affected region.
+        """
+        visited = {start: None}
+        stack = [start]
+
+        while stack:
+            component = stack.pop()
+            for vertex in adjacency[component]:
+                neighbor = self.components.find(vertex)
+                if neighbor not in visited and in_region(self.position[neighbor]):
+                    visited[neighbor] = None
+                    stack.append(neighbor)
+
+        return visited
+
+    def _merge(self, cycle: List[str]) -> Tuple[str, List[str]]:
+        """
+        Merge components into one. The member lists and edge sets are merged small-to-large. Returns the new root and the moved vertices.
+        """
+        for component in cycle[1:]:
+            self.components.union(cycle[0], component)
+        root = self.components.find(cycle[0])
+
+        # Keep the largest member list and move the others into it
+        largest = max(cycle, key=lambda c: len(self.members[c]))
+        members = self.members[largest]
+        successors = max((self.successors[c] for c in cycle), key=len)
+        predecessors = max((self.predecessors[c] for c in cycle), key=len)
+        moved = []
+
+        for component in cycle:
+            if component != largest:
+                moved.extend(self.members[component])
+            if self.successors[component] is not successors:
+                self._add(successors, self.successors[component])
+            if self.predecessors[component] is not predecessors:
+                self._add(predecessors, self.predecessors[component])
+            for mapping in (self.members, self.successors, self.predecessors, self.position):
+                self._delete(mapping, component)
+
+        self._extend(members, moved)
+        self._assign(self.members, root, members)
+        self._assign(self.successors, root, successors)
+        self._assign(self.predecessors, root, predecessors)
+
+        return root, moved
+
+    def _assign(self, container: Any, key: Any, value: Any) -> None:
+        """
+        Set container[key] to value, logging how to undo it while a checkpoint is open.
+        """
+        if self.checkpoints:
+            if isinstance(container, dict) and key not in container:
+                self.trail.append(partial(container.pop, key))
+            else:
+                self.trail.append(partial(container.__setitem__, key, container[key]))
+        container[key] = value
+
+    def _delete(self, mapping: Dict[str, Any], key: str) -> None:
+        """
+        Delete mapping[key], logging how to undo it while a checkpoint is open.
+        """
+        if self.checkpoints:
+            self.trail.append(partial(mapping.__setitem__, key, mapping[key]))
+        del mapping[key]
+
+    def _extend(self, items: List[Any], new_items: List[Any]) -> None:
+        """
+        Append new_items to a list, logging how to undo it while a checkpoint is open.
+        """
+        if self.checkpoints:
+            self.trail.append(partial(items.__delitem__, slice(len(items), None)))
+        items.extend(new_items)
+
+    def _add(self, items: Set[str], new_items: Iterable[str]) -> None:
+        """
+        Add new_items to a set, logging how to undo it while a checkpoint is open.
+        """
+        if self.checkpoints:
+            self.trail.append(partial(items.difference_update, [item for item in new_items if item not in items]))
+        items.update(new_items)
@@ -1,14 +1,126 @@
-from graph import Graph
-from strongly_connected_components import get_strongly_connected_components
-from typing import List, Tuple, Dict
+from array import array
+from concurrent.futures import Executor
+from strongly_connected_components import scc_component_ids, IncrementalSCC
+from typing import List, Tuple, Dict, Optional, Iterable
 
-def two_sat(variables: List[str], clauses: List[Tuple[str, str]]) -> bool:
+def literal(variable: int, negated: bool = False) -> int:
     """
-    Identify whether a 2-SAT problem is satisfiable. The clauses must be in implicative normal form.
+    Encode a literal as an integer: variable i has the positive literal 2i and the negative literal 2i + 1, so negation is literal ^ 1.
+
+    Parameters:
+        variable (int): The index of the variable.
+        negated (bool): Whether the literal is the negation of the variable.
+
+    Returns:
+        int: The encoded literal.
+    """
+    return 2 * variable + negated
+
+class ImplicationGraph:
+    """
+    The implication graph of a 2-SAT instance over integer literals (see literal). Edges are stored as two flat integer arrays and only
+    turned into a CSR adjacency structure when the instance is solved.
+    """
+    def __init__(self, num_variables: int = 0):
+        """
+        Initialize an implication graph without clauses.
+
+        Parameters:
+            num_variables (int): The number of variables. It grows as clauses reference more variables.
+        """
+        self.num_variables = num_variables
+        self.sources = array('l')
+        self.targets = array('l')
+
+    def add_implication(self, a: int, b: int) -> None:
+        """
+        Add the implication a => b (and its contrapositive ~b => ~a).
+
+        Parameters:
+            a (int): The premise literal.
+            b (int): The conclusion literal.
+        """
+        self.num_variables = max(self.num_variables, (a >> 1) + 1, (b >> 1) + 1)
+        self.sources.append(a)
+        self.targets.append(b)
+        self.sources.append(b ^ 1)
+        self.targets.append(a ^ 1)
+
+    def add_clause(self, a: int, b: int) -> None:
+        """
+        Add the clause a or b, i.e., the implications ~a => b and ~b => a. A unit clause a can be added as add_clause(a, a).
+
+        Parameters:
+            a (int): The first literal.
+            b (int): The second literal.
+        """
+        self.add_implication(a ^ 1, b)
+
+    def adjacency_arrays(self) -> Tuple[List[int], List[int]]:
+        """
+        Build the CSR adjacency arrays of the implication graph with a counting sort of the edges by source literal.
+
+        Returns:
+            Tuple[List[int], List[int]]: The offsets and targets. The literals implied by literal l are targets[offsets[l]:offsets[l + 1]].
+
+        Time complexity: O(n + m) where n is the number of variables and m is the number of clauses.
+        """
+        num_literals = 2 * self.num_variables
+        offsets = [0] * (num_literals + 1)
+        for source in self.sources:
+            offsets[source + 1] += 1
+        for i in range(num_literals):
+            offsets[i + 1] += offsets[i]
+
+        targets = [0] * len(self.targets)
+        position = offsets[:-1]
+        for source, target in zip(self.sources, self.targets):
+            targets[position[source]] = target
+            position[source] += 1
+
+        return offsets, targets
+
+def solve(graph: ImplicationGraph) -> Optional[List[bool]]:
+    """
+    Solve a 2-SAT instance given as an implication graph.
+
+    Parameters:
+        graph (ImplicationGraph): The implication graph.
+
+    Returns:
+        Optional[List[bool]]: The value of every variable in a satisfying assignment, or None if the instance is unsatisfiable.
+
+    Time complexity: O(n + m) where n is the number of variables and m is the number of clauses.
+
+    >>> graph = ImplicationGraph()
+    >>> graph.add_clause(literal(0), literal(1))
+    >>> graph.add_clause(literal(0, True), literal(1))
+    >>> solve(graph)[1]
+    True
+    """
+    offsets, targets = graph.adjacency_arrays()
+    component, _ = scc_component_ids(2 * graph.num_variables, offsets, targets)
+
+    assignment = []
+    for variable in range(graph.num_variables):
+        positive, negative = component[2 * variable], component[2 * variable + 1]
+        # If a variable and its negation are in the same strongly connected component, the 2-SAT problem is unsatisfiable
+        if positive == negative:
+            return None
+        # Component ids are in topological order. Setting a literal to True when it comes after its negation never implies False.
+        assignment.append(positive > negative)
+
+    return assignment
+
+def two_sat(variables: List[str], clauses: List[Tuple[str, str]], cnf: bool = False) -> bool:
+    """
+    Identify whether a 2-SAT problem is satisfiable.
 
     Parameters:
         variables (List[str]): The variables of the 2-SAT problem.
-        clauses (List[Tuple[str, str]]): The clauses of the 2-SAT problem. Each clause is a tuple of 2 variables where (x, y) means x => y (x implies y), i.e., clauses are in implicative normal form.
+        clauses (List[Tuple[str, str]]): The clauses of the 2-SAT problem as tuples of 2 literals, where '~x' is the negation of x.
+            By default, clauses are in implicative normal form: (x, y) means x => y (x implies y).
+        cnf (bool): If True, clauses are in conjunctive normal form instead: (x, y) means x or y.
 
     Returns:
         bool: True if the 2-SAT problem is satisfiable, False otherwise.
@@ -22,22 +134,234 @@ def two_sat(variables: List[str], clauses: List[Tuple[str, str]]) -> bool:
         True
         >>> two_sat(['x', 'y', 'z'], [('x', 'y'), ('y', 'z'), ('z', '~x'), ('~x', 'y'), ('y', 'x')])
         False
+        >>> two_sat(['x', 'y'], [('x', 'y'), ('~x', 'y'), ('~y', '~y')], cnf=True)
+        False
+    """
+    return two_sat_assignment(variables, clauses, cnf) is not None
+
+def two_sat_assignment(variables: List[str], clauses: List[Tuple[str, str]], cnf: bool = False) -> Optional[Dict[str, bool]]:
+    """
+    Find a satisfying assignment of a 2-SAT problem.
+
+    Parameters:
+        variables (List[str]): The variables of the 2-SAT problem.
+        clauses (List[Tuple[str, str]]): The clauses of the 2-SAT problem (see two_sat).
+        cnf (bool): If True, clauses are in conjunctive normal form instead of implicative normal form.
+
+    Returns:
+        Optional[Dict[str, bool]]: The value of every variable, or None if the 2-SAT problem is unsatisfiable.
+
+    Time complexity: O(n + m) where n is the number of variables and m is the number of clauses.
+
+    >>> two_sat_assignment(['x', 'y'], [('x', '~y'), ('y', 'y')], cnf=True)
+    {'x': True, 'y': True}
+    """
+    index = {variable: i for i, variable in enumerate(variables)}
+
+    def encode(name: str) -> int:
+        return literal(index[name[1:]], True) if name[0] == '~' else literal(index[name])
+
+    graph = ImplicationGraph(len(variables))
+    add = graph.add_clause if cnf else graph.add_implication
+    for a, b in clauses:
+        add(encode(a), encode(b))
+
+    assignment = solve(graph)
+    if assignment is None:
+        return None
+
+    return dict(zip(variables, assignment))
+
+def read_dimacs(lines: Iterable[str]) -> ImplicationGraph:
+    """
+    Read a 2-SAT instance in DIMACS CNF format. Lines are consumed one at a time and every clause is added to the implication graph as
+    soon as its terminating 0 is read, so the file never has to be held in memory. DIMACS variable k becomes variable k - 1.
+
+    Parameters:
+        lines (Iterable[str]): The lines of the file (e.g. an open file object).
+
+    Returns:
+        ImplicationGraph: The implication graph of the instance.
+
+    Raises:
+        ValueError: If a clause has more than 2 literals.
+
+    Time complexity: O(n + m) where n is the number of variables and m is the number of clauses.
+
+    >>> graph = read_dimacs(['c example', 'p cnf 2 2', '1 -2 0', '2 0'])
+    >>> solve(graph)
+    [True, True]
+    """
+    graph = ImplicationGraph()
+    # The literals of the clause being read (a clause may span several lines)
+    first = second = None
+
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] == 'c':
+            continue
+        if line[0] == 'p':
+            graph.num_variables = max(graph.num_variables, int(line.split()[2]))
+            continue
+        if line[0] == '%':
+            # End-of-data marker used by some benchmark files
+            break
+
+        for token in line.split():
+            value = int(token)
+            if value != 0:
+                encoded = literal(value - 1) if value > 0 else literal(-value - 1, True)
+                if first is None:
+                    first = encoded
+                elif second is None:
+                    second = encoded
+                else:
+                    raise ValueError("Clause has more than 2 literals")
+                continue
+
+            if first is None:
+                # The empty clause is unsatisfiable: force some variable to be both True and False
+                graph.add_clause(literal(0), literal(0))
+                graph.add_clause(literal(0, True), literal(0, True))
+            else:
+                # A unit clause a is the clause a or a
+                graph.add_clause(first, first if second is None else second)
+            first = second = None
+
+    if first is not None:
+        # The last clause was not terminated by 0
+        graph.add_clause(first, first if second is None else second)
+
+    return graph
+
+def solve_many(instances: Iterable[ImplicationGraph], executor: Optional[Executor] = None, chunksize: int = 64) -> List[Tuple[bool, Optional[List[bool]]]]:
+    """
+    Solve many independent 2-SAT instances.
+
+    Parameters:
+        instances (Iterable[ImplicationGraph]): The implication graphs of the instances.
+        executor (Optional[Executor]): Optional executor (e.g. a ProcessPoolExecutor) to distribute the instances over. Default is to solve them sequentially.
+        chunksize (int): The number of instances sent to a worker process at once. Ignored by other executors.
+
+    Returns:
+        List[Tuple[bool, Optional[List[bool]]]]: The verdict and satisfying assignment (None if unsatisfiable) of every instance, in input order.
+
+    >>> first, second = ImplicationGraph(), ImplicationGraph()
+    >>> first.add_clause(literal(0), literal(0))
+    >>> second.add_implication(literal(0), literal(0, True))
+    >>> second.add_implication(literal(0, True), literal(0))
+    >>> solve_many([first, second])
+    [(True, [True]), (False, None)]
+    """
+    if executor is None:
+        return list(map(_solve_with_verdict, instances))
+    return list(executor.map(_solve_with_verdict, instances, chunksize=chunksize))
+
+def _solve_with_verdict(graph: ImplicationGraph) -> Tuple[bool, Optional[List[bool]]]:
+    """
+    Solve an instance and pair the assignment with the verdict. Defined at module level so that it can be sent to worker processes.
     """
-    graph = Graph([])
-    for variable in variables:
-        graph.add_vertex(variable)
-        graph.add_vertex(f'~{variable}')
+    assignment = solve(graph)
+    return assignment is not None, assignment
+
+class IncrementalTwoSat:
+    """
+    A 2-SAT instance that clauses can be added to and retracted from. The strongly connected components of the implication graph are
+    maintained incrementally (see IncrementalSCC), so adding a clause only searches the components affected by its implications, and
+    only the literals that changed component need to be checked against their negation. push() records a checkpoint and pop() returns to
+    it by undoing the logged changes to the components (see IncrementalSCC.rollback), so nothing is recomputed after backtracking.
+
+    >>> instance = IncrementalTwoSat()
+    >>> instance.add_clause(literal(0), literal(1))
+    >>> instance.push()
+    >>> instance.add_clause(literal(0, True), literal(0, True))
+    >>> instance.add_clause(literal(1, True), literal(1, True))
+    >>> instance.is_satisfiable()
+    False
+    >>> instance.pop()
+    >>> instance.is_satisfiable()
+    True
+    """
+    def __init__(self, num_variables: int = 0):
+        """
+        Initialize an instance without clauses.
+
+        Parameters:
+            num_variables (int): The number of variables. It grows as clauses reference more variables.
+        """
+        self.graph = ImplicationGraph(num_variables)
+        self.scc = IncrementalSCC()
+        self.satisfiable = True
+        # The number of implication edges and the verdict at every checkpoint
+        self.checkpoints: List[Tuple[int, bool]] = []
+
+    def add_implication(self, a: int, b: int) -> None:
+        """
+        Add the implication a => b (and its contrapositive ~b => ~a).
+
+        Parameters:
+            a (int): The premise literal.
+            b (int): The conclusion literal.
+
+        Time complexity: O(size of the affected components + their edges).
+        """
+        self.graph.add_implication(a, b)
+
+        if not self.satisfiable:
+            # More clauses cannot make the instance satisfiable again. The components are only needed again after a pop, which rolls
+            # them back to a checkpoint taken before the instance became unsatisfiable.
+            return
+
+        for lit in (a, b):
+            self.scc.add_vertex(lit)
+            self.scc.add_vertex(lit ^ 1)
+        moved = self.scc.add_edge(a, b) + self.scc.add_edge(b ^ 1, a ^ 1)
+
+        # A literal can only have joined its negation's component if it changed component (or its negation did, which is checked too)
+        self.satisfiable = not any(self.scc.same_scc(lit, lit ^ 1) for lit in moved)
+
+    def add_clause(self, a: int, b: int) -> None:
+        """
+        Add the clause a or b. A unit clause a can be added as add_clause(a, a).
+
+        Parameters:
+            a (int): The first literal.
+            b (int): The second literal.
+        """
+        self.add_implication(a ^ 1, b)
+
+    def push(self) -> None:
+        """
+        Record a checkpoint that pop() returns to.
+
+        Time complexity: O(1)
+        """
+        self.checkpoints.append((len(self.graph.sources), self.satisfiable))
+        self.scc.checkpoint()
+
+    def pop(self) -> None:
+        """
+        Retract every clause added since the last checkpoint. Raises IndexError if there is no checkpoint.
+
+        Time complexity: O(number of retracted clauses + the changes they made to the components)
+        """
+        num_edges, self.satisfiable = self.checkpoints.pop()
+        del self.graph.sources[num_edges:]
+        del self.graph.targets[num_edges:]
+        self.scc.rollback()
 
-    for clause in clauses:
-        # Example: (x, y) means x => y
-        graph.add_edge(clause[0], clause[1])
+    def is_satisfiable(self) -> bool:
+        """
+        Check whether the current clauses are satisfiable.
 
-    strongly_connected_components = get_strongly_connected_components(graph)
+        Time complexity: O(1)
+        """
+        return self.satisfiable
 
-    for component in strongly_connected_components:
-        for vertex in component:
-            # If a variable and its negation are in the same strongly connected component, the 2-SAT problem is unsatisfiable
-            if vertex[0] == '~' and vertex[1:] in component:
-                return False
+    def assignment(self) -> Optional[List[bool]]:
+        """
+        Find a satisfying assignment of the current clauses (see solve).
 
-    return True
\ No newline at end of file
+        Time complexity: O(n + m) where n is the number of variables and m is the number of clauses.
+        """
+        return solve(self.graph) if self.satisfiable else None
@@ -1,4 +1,4 @@
-from typing import TypeVar, Dict
+from typing import TypeVar, Dict, List, Optional, Tuple
 
 T = TypeVar('T')
 
@@ -83,4 +83,93 @@ class UnionFind:
 
         Time complexity: O(α(n)), where α(n) is the inverse Ackermann function, effectively constant.
         """
-        return self.find(x) == self.find(y)
\ No newline at end of file
+        return self.find(x) == self.find(y)
+
+class RollbackUnionFind(UnionFind):
+    """
+    A union-find structure whose changes can be undone back to a checkpoint. While a checkpoint is open, find does not compress paths
+    (union by rank alone keeps the trees O(log n) deep) and every change is logged, so rollback only replays the log backwards.
+    """
+    def __init__(self):
+        """
+        Initializes the structure without elements or checkpoints.
+
+        Time complexity: O(1)
+        """
+        super().__init__()
+        # The element, its old root (None if the element was created) and its old rank for every change since the first open checkpoint
+        self.history: List[Tuple[T, Optional[T], int]] = []
+        # The length of the history at every open checkpoint
+        self.checkpoints: List[int] = []
+
+    def make_set(self, x: T) -> None:
+        """
+        Creates a new set containing only the specified element x. Does nothing if the element already exists.
+
+        Time complexity: O(1)
+        """
+        if x not in self.root:
+            super().make_set(x)
+            if self.checkpoints:
+                self.history.append((x, None, 0))
+
+    def find(self, x: T) -> T:
+        """
+        Finds the root of the set that the element x is a part of. Raises KeyError if the element is not found.
+
+        Time complexity: O(α(n)) without an open checkpoint, O(log n) otherwise.
+        """
+        if not self.checkpoints:
+            return super().find(x)
+
+        if x not in self.root:
+            raise KeyError("Element not found in the Union-Find structure.")
+
+        while x != self.root[x]:
+            x = self.root[x]
+        return x
+
+    def union(self, x: T, y: T) -> None:
+        """
+        Merges the set that contains x and the set that contains y (if they are different).
+
+        Time complexity: O(α(n)) without an open checkpoint, O(log n) otherwise.
+        """
+        if not self.checkpoints:
+            return super().union(x, y)
+
+        root_x = self.find(x)
+        root_y = self.find(y)
+
+        if root_x != root_y:
+            # Same choice of parent as UnionFind.union
+            if self.rank[root_x] < self.rank[root_y]:
+                root_x, root_y = root_y, root_x
+            self.history.append((root_y, root_y, self.rank[root_y]))
+            self.history.append((root_x, root_x, self.rank[root_x]))
+            self.root[root_y] = root_x
+            if self.rank[root_x] == self.rank[root_y]:
+                self.rank[root_x] += 1
+
+    def checkpoint(self) -> None:
+        """
+        Open a checkpoint that rollback() returns to.
+
+        Time complexity: O(1)
+        """
+        self.checkpoints.append(len(self.history))
+
+    def rollback(self) -> None:
+        """
+        Undo every change since the last open checkpoint and close it. Raises IndexError if there is no open checkpoint.
+
+        Time complexity: O(number of changes undone)
+        """
+        mark = self.checkpoints.pop()
+        while len(self.history) > mark:
+            x, old_root, old_rank = self.history.pop()
+            if old_root is None:
+                del self.root[x], self.rank[x]
+            else:
+                self.root[x] = old_root
+                self.rank[x] = old_rank
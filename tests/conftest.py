@@ -0,0 +1,26 @@
+import random
+import pytest
+from typing import Callable, List, Tuple
+from graph import Graph
+
+def valid_topological_order(graph: Graph, order: List[str]) -> bool:
+    position = {node: idx for idx, node in enumerate(order)}
+    return sorted(order) == sorted(graph.vertices()) and all(position[u] < position[v] for u, v, _ in graph.edges())
+
+@pytest.fixture
+def is_valid_topological_order() -> Callable[[Graph, List[str]], bool]:
+    """
+    Check that an order lists every vertex of a graph once and puts the source of every edge before its destination.
+    """
+    return valid_topological_order
+
+@pytest.fixture(params=range(10))
+def random_network(request) -> Tuple[List[str], List[Tuple[str, str, int]]]:
+    """
+    A random directed graph on the vertices '0'..'7' with an edge of weight (or capacity) 1 to 9 on about a third of the ordered pairs,
+    one for each seed. The random module stays seeded, so tests can keep drawing from it deterministically.
+    """
+    random.seed(request.param)
+    vertices = [str(i) for i in range(8)]
+    edges = [(u, v, random.randint(1, 9)) for u in vertices for v in vertices if u != v and random.random() < 0.35]
+    return vertices, edges
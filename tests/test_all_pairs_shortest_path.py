@@ -1,15 +1,17 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from graph import Graph
 from floyd_warshall import floyd_warshall_apsp
 from breadth_first_search import bfs_apsp
 from dijkstra import dijkstra_apsp
 from dag_shortest_path import dag_apsp
 from johnson import johnson_apsp
+from semiring_matrix import repeated_squaring_apsp
 
-unweighted_apsp_algorithms = [floyd_warshall_apsp, johnson_apsp, bfs_apsp, dijkstra_apsp]
-positive_weight_algorithms = [floyd_warshall_apsp, johnson_apsp, dijkstra_apsp]
-dag_algorithms = [floyd_warshall_apsp, johnson_apsp, dag_apsp]
-negative_weight_algorithms = [floyd_warshall_apsp, johnson_apsp]
+unweighted_apsp_algorithms = [floyd_warshall_apsp, johnson_apsp, bfs_apsp, dijkstra_apsp, repeated_squaring_apsp]
+positive_weight_algorithms = [floyd_warshall_apsp, johnson_apsp, dijkstra_apsp, repeated_squaring_apsp]
+dag_algorithms = [floyd_warshall_apsp, johnson_apsp, dag_apsp, repeated_squaring_apsp]
+negative_weight_algorithms = [floyd_warshall_apsp, johnson_apsp, repeated_squaring_apsp]
 
 unweighted_examples = [
     # Simple unweighted graph
@@ -86,3 +88,21 @@ def test_apsp_negative_cycle(algorithm, vertices, edges):
     graph = Graph(vertices, edges)
     with pytest.raises(ValueError, match='Graph contains a negative-weight cycle'):
         algorithm(graph)
+
+def test_johnson_does_not_modify_graph():
+    # A real vertex named 'S' must not clash with the virtual source
+    graph = Graph(['S', 'A', 'B'], [('S', 'A', 2), ('A', 'B', -1), ('B', 'S', 4)])
+    edges = graph.edges()
+    dist = johnson_apsp(graph)
+    assert dist['S'] == {'S': 0, 'A': 2, 'B': 1}
+    assert dist['B'] == {'S': 4, 'A': 6, 'B': 0}
+    assert graph.vertices() == ['S', 'A', 'B']
+    assert graph.edges() == edges
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+@pytest.mark.parametrize("vertices, edges, expected_dist", negative_weight_positive_cycle_examples)
+@pytest.mark.parametrize("chunksize", [None, 1, 3])
+def test_johnson_with_executor(executor_class, vertices, edges, expected_dist, chunksize):
+    graph = Graph(vertices, edges)
+    with executor_class(max_workers=2) as executor:
+        assert johnson_apsp(graph, executor, chunksize) == expected_dist
@@ -0,0 +1,48 @@
+import random
+import pytest
+from graph import Graph
+from network_flow import NetworkFlow, dinic
+from bipartite_matching import hopcroft_karp, hopcroft_karp_arrays
+
+def max_matching_size(left, right, edges):
+    network = NetworkFlow(['s', 't'] + left + right, [('s', u, 1) for u in left] + [(v, 't', 1) for v in right] + [(u, v, 1) for u, v in edges])
+    return dinic(network, 's', 't')
+
+@pytest.mark.parametrize("seed", range(10))
+def test_hopcroft_karp_matches_max_flow(seed):
+    random.seed(seed)
+    left = [f'l{i}' for i in range(random.randint(1, 10))]
+    right = [f'r{i}' for i in range(random.randint(1, 10))]
+    edges = [(u, v) for u in left for v in right if random.random() < 0.3]
+    graph = Graph(left + right, edges)
+
+    matching, cover = hopcroft_karp(graph, left)
+
+    # The matching is valid and maximum
+    assert all((u, v) in edges for u, v in matching.items())
+    assert len(set(matching.values())) == len(matching)
+    assert len(matching) == max_matching_size(left, right, edges)
+
+    # The cover touches every edge and has the same size as the matching (König's theorem)
+    assert all(u in cover or v in cover for u, v in edges)
+    assert len(cover) == len(matching)
+
+def test_hopcroft_karp_detects_bipartition():
+    # Edges point both ways between the sides, and the left side is not given
+    graph = Graph(['a', 'b', 'c', 'x', 'y'], [('a', 'x'), ('y', 'a'), ('b', 'y'), ('c', 'y')])
+    matching, cover = hopcroft_karp(graph)
+    assert len(matching) == len(cover) == 2
+
+def test_hopcroft_karp_rejects_non_bipartite_graphs():
+    with pytest.raises(ValueError):
+        hopcroft_karp(Graph(['A', 'B', 'C'], [('A', 'B'), ('B', 'C'), ('C', 'A')]))
+    with pytest.raises(ValueError):
+        hopcroft_karp(Graph(['A', 'B', 'C'], [('A', 'B'), ('B', 'C')]), ['A', 'B'])
+
+def test_hopcroft_karp_arrays_large():
+    # Every left vertex i can take right vertex i or i + 1, so the greedy choice of i + 1 has to be undone along long augmenting paths
+    n = 50000
+    adjacency = [[i + 1, i] if i + 1 < n else [i] for i in range(n)]
+    match_left, match_right = hopcroft_karp_arrays(n, adjacency)
+    assert sorted(match_left) == list(range(n))
+    assert all(match_right[v] == u for u, v in enumerate(match_left))
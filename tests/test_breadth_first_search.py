@@ -0,0 +1,83 @@
+import pytest
+import random
+from graph import Graph
+from breadth_first_search import breadth_first_search, bfs_level_sizes, bfs_sssp, direction_optimizing_bfs_sssp, multi_source_bfs, bfs_apsp
+
+def test_breadth_first_search_visits_each_vertex_once():
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')])
+    visits = []
+    parents = breadth_first_search(graph, 'A', lambda vertex, parent: visits.append((vertex, parent)))
+    assert visits == [('A', None), ('B', 'A'), ('C', 'A'), ('D', 'B')]
+    assert parents == {'A': None, 'B': 'A', 'C': 'A', 'D': 'B'}
+
+def test_breadth_first_search_entire_graph():
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('C', 'D')])
+    visits = []
+    breadth_first_search(graph, None, lambda vertex, parent: visits.append(vertex))
+    assert visits == ['A', 'B', 'C', 'D']
+
+@pytest.mark.parametrize("vertices, edges, source, expected_sizes", [
+    # Path
+    (['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'D')], 'A', [1, 1, 1, 1]),
+    # Star
+    (['A', 'B', 'C', 'D'], [('A', 'B'), ('A', 'C'), ('A', 'D')], 'A', [1, 3]),
+    # Multiple sources
+    (['A', 'B', 'C', 'D', 'E'], [('A', 'C'), ('B', 'D'), ('D', 'E')], ['A', 'B'], [2, 2, 1]),
+    # Unreachable vertices are not counted
+    (['A', 'B', 'C'], [('A', 'B')], 'A', [1, 1]),
+])
+def test_bfs_level_sizes(vertices, edges, source, expected_sizes):
+    graph = Graph(vertices, edges)
+    assert bfs_level_sizes(graph, source) == expected_sizes
+
+@pytest.mark.parametrize("alpha, beta", [
+    # Default heuristic
+    (14, 24),
+    # Always bottom-up
+    (float('inf'), 0),
+    # Always top-down
+    (0, float('inf')),
+])
+@pytest.mark.parametrize("undirected", [False, True])
+def test_direction_optimizing_bfs(alpha, beta, undirected):
+    random.seed(161)
+    vertices = [str(i) for i in range(60)]
+    edges = [(u, v) for u in vertices for v in vertices if u != v and random.random() < 0.05]
+    graph = Graph(vertices, edges, undirected=undirected)
+
+    expected_dist, _ = bfs_sssp(graph, ['0', '1'])
+    dist, pred = direction_optimizing_bfs_sssp(graph, ['0', '1'], alpha, beta)
+
+    assert dist == expected_dist
+    for vertex in vertices:
+        if pred[vertex] is None:
+            # Only the sources and unreachable vertices have no predecessor
+            assert vertex in ['0', '1'] or dist[vertex] == float('inf')
+        else:
+            # Predecessors may differ from top-down BFS, but must be in the previous level and have an edge to the vertex
+            assert vertex in dict(graph.neighbors(pred[vertex]))
+            assert dist[pred[vertex]] == dist[vertex] - 1
+
+@pytest.mark.parametrize("undirected", [False, True])
+def test_multi_source_bfs(undirected):
+    random.seed(161)
+    vertices = [str(i) for i in range(80)]
+    edges = [(u, v) for u in vertices for v in vertices if u != v and random.random() < 0.03]
+    graph = Graph(vertices, edges, undirected=undirected)
+
+    # More sources than fit in a 64-bit word
+    dist = multi_source_bfs(graph, vertices + ['0'])
+    assert list(dist) == vertices
+    for source in vertices:
+        assert dist[source] == bfs_sssp(graph, source)[0]
+
+@pytest.mark.parametrize("batch_size", [None, 1, 3, 64])
+def test_bfs_apsp_batches(batch_size):
+    graph = Graph(['A', 'B', 'C', 'D', 'E'], [('A', 'B'), ('B', 'C'), ('C', 'A'), ('D', 'E')])
+    expected = {source: bfs_sssp(graph, source)[0] for source in graph.vertices()}
+
+    assert bfs_apsp(graph, batch_size) == expected
+
+    rows = bfs_apsp(graph, batch_size, stream=True)
+    assert not isinstance(rows, dict)
+    assert list(rows) == list(expected.items())
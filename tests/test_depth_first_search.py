@@ -1,7 +1,6 @@
 import pytest
-from typing import List
 from graph import Graph
-from depth_first_search import depth_first_search, depth_first_search_entire_graph, topological_sort, get_bridge_edges
+from depth_first_search import depth_first_search, depth_first_search_entire_graph, topological_sort, get_bridge_edges, dfs_events, DISCOVER, FINISH, kahn_topological_sort, cached_topological_sort, CycleError
 
 def test_depth_first_search():
     graph = Graph(['u', 'v', 'w', 'x', 'y', 'z'], [('u', 'v'), ('u', 'x'), ('v', 'y'), ('w', 'y'), ('w', 'z'), ('x', 'v'), ('y', 'x')])
@@ -21,10 +20,6 @@ def test_depth_first_search_entire_graph():
     assert result['w'][2] == result['z'][2]
     assert result['u'][2] != result['w'][2]
 
-def is_valid_topological_order(graph: Graph, order: List[str]):
-    position = {node: idx for idx, node in enumerate(order)}
-    return all(position[u] < position[v] for u, v, _ in graph.edges())
-
 @pytest.mark.parametrize("vertices, edges", [
     # Simple linear DAG
     (['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'D')]),
@@ -37,10 +32,44 @@ def is_valid_topological_order(graph: Graph, order: List[str]):
     # Single node graph
     (['A'], []),
 ])
-def test_topological_sort(vertices, edges):
+def test_topological_sort(vertices, edges, is_valid_topological_order):
     graph = Graph(vertices, edges)
     order = topological_sort(graph)
     assert is_valid_topological_order(graph, order)
+    assert sorted(order) == sorted(vertices)
+
+    order = list(kahn_topological_sort(graph))
+    assert is_valid_topological_order(graph, order)
+    assert sorted(order) == sorted(vertices)
+
+@pytest.mark.parametrize("vertices, edges, expected_prefix, expected_cycle", [
+    # Simple cycle
+    (['A', 'B', 'C'], [('A', 'B'), ('B', 'C'), ('C', 'A')], [], ['A', 'B', 'C']),
+    # Cycle behind a DAG prefix, with a vertex downstream of the cycle
+    (['A', 'B', 'C', 'D', 'E'], [('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'B'), ('D', 'E')], ['A'], ['B', 'C', 'D']),
+])
+def test_kahn_topological_sort_cycle(vertices, edges, expected_prefix, expected_cycle):
+    graph = Graph(vertices, edges)
+    produced = []
+    with pytest.raises(CycleError) as error:
+        for vertex in kahn_topological_sort(graph):
+            produced.append(vertex)
+
+    assert produced == expected_prefix
+    cycle = error.value.cycle
+    assert sorted(cycle) == expected_cycle
+    assert all(graph.edge_weight(u, v) != graph.default_weight for u, v in zip(cycle, cycle[1:] + cycle[:1]))
+
+def test_cached_topological_sort(is_valid_topological_order):
+    graph = Graph(['A', 'B', 'C'], [('B', 'C')])
+    order = cached_topological_sort(graph)
+    assert cached_topological_sort(graph) is order
+
+    # Modifying the graph invalidates the cached order
+    graph.add_edge('C', 'A')
+    new_order = cached_topological_sort(graph)
+    assert new_order is not order
+    assert is_valid_topological_order(graph, new_order)
 
 @pytest.mark.parametrize("vertices, edges, expected_bridges", [
     # Acyclic graph with two bridges
@@ -63,4 +92,30 @@ def test_get_bridge_edges(vertices, edges, expected_bridges):
     bridges_sorted = sorted(bridges, key=lambda x: (min(x), max(x)))
     expected_sorted = sorted(expected_bridges, key=lambda x: (min(x), max(x)))
 
-    assert bridges_sorted == expected_sorted
\ No newline at end of file
+    assert bridges_sorted == expected_sorted
+
+def test_dfs_events():
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('A', 'C')])
+    assert list(dfs_events(graph)) == [
+        (DISCOVER, 'A', None), (DISCOVER, 'B', 'A'), (DISCOVER, 'C', 'B'), (FINISH, 'C', 'B'), (FINISH, 'B', 'A'), (FINISH, 'A', None),
+        (DISCOVER, 'D', None), (FINISH, 'D', None),
+    ]
+    assert list(dfs_events(graph, 'B')) == [(DISCOVER, 'B', None), (DISCOVER, 'C', 'B'), (FINISH, 'C', 'B'), (FINISH, 'B', None)]
+
+# Longer than Python's default recursion limit
+chain_length = 2000
+
+@pytest.fixture(scope="module")
+def chain_vertices():
+    return [str(i) for i in range(chain_length)]
+
+def test_dfs_deep_chain(chain_vertices):
+    graph = Graph(chain_vertices, list(zip(chain_vertices, chain_vertices[1:])))
+    result = depth_first_search(graph, '0')
+    assert result['0'] == (1, 2 * chain_length)
+    assert result[chain_vertices[-1]] == (chain_length, chain_length + 1)
+    assert topological_sort(graph) == chain_vertices
+
+def test_bridges_deep_chain(chain_vertices):
+    graph = Graph(chain_vertices, list(zip(chain_vertices, chain_vertices[1:])), undirected=True)
+    assert len(get_bridge_edges(graph)) == chain_length - 1
@@ -0,0 +1,81 @@
+import random
+import pytest
+from graph import Graph
+from dynamic_topological_sort import DynamicDAG
+from depth_first_search import CycleError
+from dag_shortest_path import dag_sssp
+
+@pytest.mark.parametrize("vertices, edges", [
+    # Edges inserted against the initial order
+    (['A', 'B', 'C', 'D'], [('D', 'C'), ('C', 'B'), ('B', 'A')]),
+    # Diamond inserted bottom-up
+    (['A', 'B', 'C', 'D'], [('C', 'D'), ('B', 'D'), ('A', 'C'), ('A', 'B')]),
+    # Disconnected pieces
+    (['A', 'B', 'C', 'D', 'E'], [('E', 'A'), ('D', 'B'), ('B', 'A')]),
+])
+def test_order_after_every_insertion(vertices, edges, is_valid_topological_order):
+    dag = DynamicDAG(vertices)
+    for v1, v2 in edges:
+        dag.add_edge(v1, v2)
+        assert is_valid_topological_order(dag, dag.topological_order())
+
+def test_random_insertions_match_reachability(is_valid_topological_order):
+    random.seed(7)
+    vertices = [str(i) for i in range(30)]
+    dag = DynamicDAG(vertices)
+    for _ in range(300):
+        v1, v2 = random.sample(vertices, 2)
+        try:
+            dag.add_edge(v1, v2)
+        except CycleError as error:
+            # The rejected edge closes the reported cycle, and the rest of the cycle is already in the graph
+            cycle = error.cycle
+            assert cycle[0] == v1 and cycle[1] == v2
+            assert all(dag.edge_weight(cycle[i], cycle[i + 1]) != float('inf') for i in range(1, len(cycle) - 1))
+            assert dag.edge_weight(cycle[-1], v1) != float('inf')
+        assert is_valid_topological_order(dag, dag.topological_order())
+
+def test_rejected_edge_leaves_graph_unchanged():
+    dag = DynamicDAG(['A', 'B', 'C'], [('A', 'B'), ('B', 'C')])
+    order = dag.topological_order()
+    with pytest.raises(CycleError):
+        dag.add_edge('C', 'A')
+    with pytest.raises(CycleError):
+        dag.add_edge('A', 'A')
+    assert dag.edge_weight('C', 'A') == float('inf')
+    assert dag.topological_order() == order
+
+def test_vertex_and_edge_removal(is_valid_topological_order):
+    dag = DynamicDAG(['A', 'B', 'C'], [('B', 'A'), ('C', 'B')])
+    dag.add_vertex('D')
+    dag.add_edge('D', 'C')
+    dag.remove_vertex('B')
+    dag.add_edge('A', 'C')
+    assert is_valid_topological_order(dag, dag.topological_order())
+    dag.remove_edge('A', 'C')
+    dag.add_edge('C', 'A')
+    assert is_valid_topological_order(dag, dag.topological_order())
+
+def test_order_is_compacted_after_removals(is_valid_topological_order):
+    dag = DynamicDAG(['A', 'B'], [('B', 'A')])
+    for i in range(100):
+        dag.add_vertex(f'v{i}')
+        dag.add_edge('B', f'v{i}')
+        dag.add_edge(f'v{i}', 'A')
+        dag.remove_vertex(f'v{i}')
+        # Removed vertices leave at most as many empty positions as there are vertices
+        assert len(dag.order) <= 2 * len(dag.vertices())
+    assert dag.topological_order() == ['B', 'A']
+    dag.add_vertex('C')
+    dag.add_edge('C', 'B')
+    assert is_valid_topological_order(dag, dag.topological_order())
+
+def test_dag_sssp_with_maintained_order():
+    dag = DynamicDAG(['A', 'B', 'C', 'D'])
+    dag.add_edge('C', 'D', 1)
+    dag.add_edge('B', 'C', 2)
+    dag.add_edge('A', 'B', 3)
+    dag.add_edge('A', 'C', 6)
+    dist, pred = dag_sssp(dag, 'A', dag.topological_order())
+    assert dist == {'A': 0, 'B': 3, 'C': 5, 'D': 6}
+    assert pred['C'] == 'B'
@@ -87,3 +87,30 @@ def test_sssp_negative_cycle(algorithm, vertices, edges):
     graph = Graph(vertices, edges)
     with pytest.raises(ValueError, match='Graph contains a negative-weight cycle'):
         algorithm(graph, vertices[0])
+
+all_algorithms = [bfs_mssp, dijkstra_mssp, dag_mssp, bellman_ford_mssp]
+
+@pytest.mark.parametrize("algorithm", all_algorithms)
+def test_mssp_does_not_modify_graph(algorithm):
+    # A real vertex named 'multi' must not clash with the search
+    graph = Graph(['multi', 'A', 'B', 'C'], [('multi', 'A'), ('A', 'B'), ('C', 'B')])
+    edges = graph.edges()
+    dist, pred = algorithm(graph, ['multi', 'C'])
+    assert dist == {'multi': 0, 'A': 1, 'B': 1, 'C': 0}
+    assert pred == {'multi': None, 'A': 'multi', 'B': 'C', 'C': None}
+    assert graph.vertices() == ['multi', 'A', 'B', 'C']
+    assert graph.edges() == edges
+
+@pytest.mark.parametrize("algorithm", all_algorithms)
+def test_mssp_source_assignment(algorithm):
+    graph = Graph(['A', 'B', 'C', 'D', 'E', 'F'], [('A', 'B'), ('B', 'C'), ('D', 'C'), ('D', 'E')])
+    _, _, source = algorithm(graph, ['A', 'D'], return_sources=True)
+    assert source == {'A': 'A', 'B': 'A', 'C': 'D', 'D': 'D', 'E': 'D', 'F': None}
+
+@pytest.mark.parametrize("algorithm", all_algorithms)
+def test_mssp_source_offsets(algorithm):
+    graph = Graph(['A', 'B', 'C', 'D', 'E'], [('A', 'B'), ('B', 'C'), ('C', 'D'), ('E', 'D'), ('E', 'C')])
+    dist, pred, source = algorithm(graph, {'A': 0, 'E': 2}, return_sources=True)
+    assert dist == {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'E': 2}
+    assert source['C'] == 'A'
+    assert source['E'] == 'E'
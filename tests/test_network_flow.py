@@ -1,5 +1,8 @@
 import pytest
-from network_flow import NetworkFlow, edmonds_karp
+import random
+from graph import Graph
+from network_flow import NetworkFlow, edmonds_karp, ford_fulkerson, find_path_bfs, dinic, push_relabel, capacity_scaling, max_flow_min_cut, min_cost_max_flow, CostResidualGraph
+from bellman_ford import find_negative_cycle
 
 # Residual graph test data
 residual_graph_test_data = [
@@ -77,4 +80,161 @@ def test_max_flow(vertices, capacities, source, sink, expected_max_flow):
     max_flow = edmonds_karp(network, source, sink)
 
     # Check if the max flow matches the expected max flow
-    assert max_flow == expected_max_flow
\ No newline at end of file
+    assert max_flow == expected_max_flow
+
+@pytest.mark.parametrize("vertices, capacities, source, sink, expected_max_flow", max_flow_test_data)
+def test_ford_fulkerson_uses_maintained_residual_graph(vertices, capacities, source, sink, expected_max_flow):
+    network = NetworkFlow(vertices, capacities)
+    searched = []
+
+    def find_path(residual_graph, source, sink):
+        searched.append(residual_graph)
+        return find_path_bfs(residual_graph, source, sink)
+
+    assert ford_fulkerson(network, source, sink, find_path) == expected_max_flow
+
+    # Every search ran on the residual graph kept by the network, and it matches one rebuilt from the final flows
+    assert all(residual_graph is network.residual_graph for residual_graph in searched)
+    assert sorted(network.residual_graph.edges()) == sorted(network.get_residual_graph().edges())
+
+    # The sparse residual edges the searches use agree with the adjacency matrix
+    for v in vertices:
+        assert sorted(network.residual_graph.neighbors(v)) == sorted(Graph.neighbors(network.residual_graph, v))
+
+def check_flow_conservation(network, source, sink, value):
+    for v in network.vertices():
+        outflow = sum(network.get_flow(v, u) for u in network.vertices() if u != v)
+        assert outflow == (value if v == source else -value if v == sink else 0)
+
+@pytest.mark.parametrize("algorithm", [dinic, push_relabel, lambda network, source, sink: push_relabel(network, source, sink, highest_label=False)])
+@pytest.mark.parametrize("vertices, capacities, source, sink, expected_max_flow", max_flow_test_data)
+def test_array_max_flow(algorithm, vertices, capacities, source, sink, expected_max_flow):
+    network = NetworkFlow(vertices, capacities)
+    assert algorithm(network, source, sink) == expected_max_flow
+    check_flow_conservation(network, source, sink, expected_max_flow)
+    assert sorted(network.residual_graph.edges()) == sorted(network.get_residual_graph().edges())
+
+@pytest.mark.parametrize("algorithm", [dinic, push_relabel, lambda network, source, sink: push_relabel(network, source, sink, highest_label=False), capacity_scaling])
+def test_array_max_flow_matches_edmonds_karp(algorithm, random_network):
+    vertices, capacities = random_network
+    expected = edmonds_karp(NetworkFlow(vertices, capacities), '0', '7')
+
+    network = NetworkFlow(vertices, capacities)
+    assert algorithm(network, '0', '7') == expected
+    check_flow_conservation(network, '0', '7', expected)
+
+    # The algorithm continues from the flow already in the network
+    network = NetworkFlow(vertices, capacities)
+    path = find_path_bfs(network.residual_graph, '0', '7')
+    if path:
+        network.add_flow_path(path, 1)
+        assert algorithm(network, '0', '7') == expected - 1
+
+@pytest.mark.parametrize("algorithm", [dinic, push_relabel])
+def test_unit_capacity_matching(algorithm):
+    # Perfect matching between 200 left and 200 right vertices, with every left vertex joined to 3 right vertices
+    n = 200
+    edges = [('s', f'l{i}', 1) for i in range(n)] + [(f'r{i}', 't', 1) for i in range(n)]
+    edges += [(f'l{i}', f'r{(i + k) % n}', 1) for i in range(n) for k in range(3)]
+    network = NetworkFlow(['s', 't'] + [f'l{i}' for i in range(n)] + [f'r{i}' for i in range(n)], edges)
+    assert algorithm(network, 's', 't') == n
+
+def test_add_flow_cancels_reverse_flow():
+    network = NetworkFlow(["A", "B"], [("B", "A", 5)])
+    network.add_flow("B", "A", 3)
+    network.add_flow("A", "B", 3)
+    assert network.get_flow("B", "A") == 0
+    assert sorted(network.residual_graph.edges()) == [("B", "A", 5)]
+
+@pytest.mark.parametrize("flow", [0, 1, -1])
+def test_add_flow_nonexistent_edge(flow):
+    network = NetworkFlow(["A", "B", "C"], [("A", "B", 5)])
+    with pytest.raises(ValueError, match="nonexistent edge"):
+        network.add_flow("A", "C", flow)
+
+@pytest.mark.parametrize("vertices, capacities, source, sink, expected_max_flow", max_flow_test_data + [
+    # Capacities spanning several orders of magnitude
+    (["s", "a", "b", "t"], [("s", "a", 10 ** 6), ("s", "b", 10 ** 6), ("a", "b", 1), ("a", "t", 10 ** 6), ("b", "t", 10 ** 6)], "s", "t", 2 * 10 ** 6),
+    # Non-integer capacities
+    (["s", "a", "t"], [("s", "a", 2.5), ("a", "t", 1.75)], "s", "t", 1.75),
+])
+def test_capacity_scaling(vertices, capacities, source, sink, expected_max_flow):
+    network = NetworkFlow(vertices, capacities)
+    assert capacity_scaling(network, source, sink) == expected_max_flow
+    check_flow_conservation(network, source, sink, expected_max_flow)
+
+@pytest.mark.parametrize("algorithm", [edmonds_karp, dinic, push_relabel])
+def test_max_flow_min_cut(algorithm, random_network):
+    vertices, capacities = random_network
+    expected = edmonds_karp(NetworkFlow(vertices, capacities), '0', '7')
+
+    network = NetworkFlow(vertices, capacities)
+    result = max_flow_min_cut(network, '0', '7', algorithm)
+
+    assert result.value == expected
+    assert '0' in result.source_side and '7' not in result.source_side
+    assert sorted(result.cut_edges) == sorted((u, v, c) for u, v, c in capacities if u in result.source_side and v not in result.source_side)
+
+    # The flows are sparse, within capacity, and list every edge that carries flow in the network
+    capacity = {(u, v): c for u, v, c in capacities}
+    assert all(0 < flow <= capacity[edge] for edge, flow in result.flows.items())
+    assert result.flows == {(u, v): network.get_flow(u, v) for u, v, _ in capacities if network.get_flow(u, v) > 0}
+    assert sum(flow for (u, _), flow in result.flows.items() if u == '0') - sum(flow for (_, v), flow in result.flows.items() if v == '0') == expected
+
+def test_update_capacity_matches_recomputation(random_network):
+    vertices, edges = random_network
+    capacities = {(u, v): c for u, v, c in edges}
+    network = NetworkFlow(vertices, [(u, v, c) for (u, v), c in capacities.items()])
+    edmonds_karp(network, '0', '7')
+
+    for _ in range(15):
+        u, v = random.choice(list(capacities)) if random.random() < 0.8 else random.sample(vertices, 2)
+        capacities[(u, v)] = random.randint(0, 9)
+        value = network.update_capacity(u, v, capacities[(u, v)], '0', '7')
+
+        expected = edmonds_karp(NetworkFlow(vertices, [(a, b, c) for (a, b), c in capacities.items() if c > 0]), '0', '7')
+        assert value == expected
+        check_flow_conservation(network, '0', '7', expected)
+        assert all(flow <= capacities[edge] for edge, flow in network.edge_flows().items())
+        assert sorted(network.residual_graph.edges()) == sorted(network.get_residual_graph().edges())
+
+def test_min_cost_max_flow(random_network):
+    vertices, capacities = random_network
+    # Negative costs only leave the source, whose incoming edges are dropped, so there is no negative-cost cycle
+    edges = [(u, v, c, random.randint(-3 if u == '0' else 0, 9)) for u, v, c in capacities if v != '0']
+    expected = edmonds_karp(NetworkFlow(vertices, [edge[:3] for edge in edges]), '0', '7')
+
+    network = NetworkFlow(vertices, edges)
+    flow, cost, flows = min_cost_max_flow(network, '0', '7')
+
+    assert flow == expected
+    check_flow_conservation(network, '0', '7', expected)
+    capacity = {(u, v): c for u, v, c, _ in edges}
+    assert all(0 < f <= capacity[edge] for edge, f in flows.items())
+    assert cost == sum(f * network.cost[edge] for edge, f in flows.items())
+
+    # A flow has minimum cost exactly when its residual graph has no negative-cost cycle
+    residual = CostResidualGraph(network)
+    for i, edge in enumerate(residual.edge_list):
+        residual.capacity[2 * i] -= flows.get(edge, 0)
+        residual.capacity[2 * i + 1] += flows.get(edge, 0)
+    assert find_negative_cycle(residual) is None
+
+def test_min_cost_max_flow_on_incrementally_built_network(random_network):
+    vertices, capacities = random_network
+    edges = [(u, v, c, random.randint(0, 9)) for u, v, c in capacities]
+
+    network = NetworkFlow(['0', '7'])
+    for u, v, c, cost in edges:
+        network.add_vertex(u)
+        network.add_vertex(v)
+        network.add_edge(u, v, c, cost=cost)
+
+    assert network.cost == {(u, v): cost for u, v, _, cost in edges}
+    assert sorted(network.residual_graph.edges()) == sorted(network.get_residual_graph().edges())
+    assert min_cost_max_flow(network, '0', '7')[:2] == min_cost_max_flow(NetworkFlow(vertices, edges), '0', '7')[:2]
+
+    # Changing a capacity keeps the cost of the edge
+    u, v, c, cost = edges[0]
+    network.update_capacity(u, v, c + 1, '0', '7')
+    assert network.cost[(u, v)] == cost
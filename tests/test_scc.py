@@ -1,6 +1,10 @@
+import copy
+import random
 import pytest
 from graph import Graph
-from strongly_connected_components import get_strongly_connected_components, get_scc_graph
+from strongly_connected_components import get_strongly_connected_components, get_scc_graph, get_scc_ids, scc_component_ids, IncrementalSCC
+from semiring_matrix import transitive_closure
+from dag_shortest_path import dag_sssp
 
 @pytest.mark.parametrize("vertices, edges, expected_sccs, expected_scc_edges", [
     # Linear SCCs
@@ -40,3 +44,108 @@ def test_get_strongly_connected_components(vertices, edges, expected_sccs, expec
         expected_scc_edgeset.add((tuple(sorted(expected_sccs[u])), tuple(sorted(expected_sccs[v]))))
 
     assert actual_scc_edges == expected_scc_edgeset
+
+def test_scc_ids_match_mutual_reachability():
+    random.seed(3)
+    vertices = [str(i) for i in range(25)]
+    graph = Graph(vertices, [tuple(random.sample(vertices, 2)) for _ in range(40)])
+    ids, sccs = get_scc_ids(graph)
+    reachable = transitive_closure(graph)
+
+    for i, u in enumerate(vertices):
+        assert u in sccs[ids[i]]
+        for j, v in enumerate(vertices):
+            assert (ids[i] == ids[j]) == (reachable[u][v] and reachable[v][u])
+            # Ids are in topological order of the condensation
+            if reachable[u][v]:
+                assert ids[i] <= ids[j]
+
+def test_scc_component_ids_deep_graph():
+    # A cycle through 100000 vertices leading into a 100000-vertex chain would overflow a recursive DFS
+    n = 200000
+    half = n // 2
+    adjacency = [[v + 1] for v in range(n - 1)] + [[]]
+    adjacency[half - 1].append(0)
+    offsets, targets = [0], []
+    for neighbors in adjacency:
+        targets.extend(neighbors)
+        offsets.append(len(targets))
+    ids, count = scc_component_ids(n, offsets, targets)
+    assert count == half + 1
+    assert set(ids[:half]) == {0}
+    assert ids[half:] == list(range(1, half + 1))
+
+def test_scc_graph_is_sparse_and_deduplicated():
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'A'), ('A', 'C'), ('B', 'C'), ('C', 'D'), ('A', 'D')])
+    scc_graph = get_scc_graph(graph)
+    ab, c, d = (scc_graph.get_scc_of_vertex(v) for v in ['A', 'C', 'D'])
+
+    assert scc_graph.sizes[ab] == 2 and scc_graph.sizes[c] == scc_graph.sizes[d] == 1
+    assert sorted(scc_graph.edges()) == sorted([(ab, c, 1), (ab, d, 1), (c, d, 1)])
+    assert [scc_graph.multiplicity(ab, c), scc_graph.multiplicity(ab, d), scc_graph.multiplicity(c, d), scc_graph.multiplicity(d, c)] == [2, 1, 1, 0]
+    assert all(isinstance(neighbor, int) for neighbor, _ in scc_graph.neighbors(ab))
+
+    # The ids are a topological order, so the condensation can be fed to DAG algorithms directly
+    position = {scc: i for i, scc in enumerate(scc_graph.topological_order())}
+    assert all(position[u] < position[v] for u, v, _ in scc_graph.edges())
+    dist, _ = dag_sssp(scc_graph, [ab], scc_graph.topological_order())
+    assert dist[d] == 1
+
+def test_dag_sssp_on_scc_graph():
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'A'), ('A', 'C'), ('B', 'C'), ('C', 'D')])
+    scc_graph = get_scc_graph(graph)
+    ab, c, d = (scc_graph.get_scc_of_vertex(v) for v in ['A', 'C', 'D'])
+
+    # The default (cached) order and a single integer source
+    dist, pred = dag_sssp(scc_graph, ab)
+    assert dist == {ab: 0, c: 1, d: 2}
+    assert pred == {ab: None, c: ab, d: c}
+
+def test_incremental_scc_matches_recomputation(random_network):
+    vertices, edges = random_network
+    graph = Graph(vertices)
+    scc = IncrementalSCC(vertices)
+
+    for v1, v2, _ in edges:
+        before = {frozenset(scc.get_scc_vertices(v)) for v in vertices}
+        moved = scc.add_edge(v1, v2)
+        graph.add_edge(v1, v2)
+
+        # The merged component is one of the previous components plus the reported vertices
+        if moved:
+            merged = set(scc.get_scc_vertices(moved[0]))
+            assert set(moved) <= merged and frozenset(merged - set(moved)) in before
+
+        expected = {frozenset(component) for component in get_strongly_connected_components(graph)}
+        assert {frozenset(scc.get_scc_vertices(v)) for v in vertices} == expected
+        assert all(scc.same_scc(u, v) == (frozenset(scc.get_scc_vertices(u)) == frozenset(scc.get_scc_vertices(v))) for u in vertices for v in vertices)
+
+        # The maintained order is a topological order of the condensation
+        position = {c: i for i, c in enumerate(scc.topological_order())}
+        assert len(position) == len(expected)
+        assert all(position[scc.scc_of(u)] <= position[scc.scc_of(v)] for u, v, _ in graph.edges())
+
+def incremental_scc_state(scc):
+    return copy.deepcopy((scc.components.root, scc.components.rank, scc.members, scc.successors, scc.predecessors, scc.position, scc.order))
+
+def test_incremental_scc_rollback(random_network):
+    vertices, edges = random_network
+    # The remaining vertices are added by the edges that reference them
+    scc = IncrementalSCC(vertices[:4])
+    states = []
+
+    for v1, v2, _ in edges:
+        action = random.random()
+        if action < 0.2:
+            states.append(incremental_scc_state(scc))
+            scc.checkpoint()
+        elif action < 0.35 and states:
+            scc.rollback()
+            assert incremental_scc_state(scc) == states.pop()
+        scc.add_edge(v1, v2)
+
+    while states:
+        scc.rollback()
+        assert incremental_scc_state(scc) == states.pop()
+    assert not scc.trail
+
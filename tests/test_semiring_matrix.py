@@ -0,0 +1,66 @@
+import pytest
+from graph import Graph
+from semiring_matrix import semiring_multiply, semiring_power, transitive_closure, hop_limited_apsp, graph_to_matrix, Semiring, MIN_PLUS, MAX_PLUS, BOOLEAN
+
+inf = float('inf')
+
+@pytest.mark.parametrize("A, B, semiring, expected", [
+    # Min-plus
+    ([[0, 1], [inf, 0]], [[0, 2], [3, 0]], MIN_PLUS, [[0, 1], [3, 0]]),
+    # Max-plus
+    ([[0, 1], [-inf, 0]], [[0, 2], [3, 0]], MAX_PLUS, [[4, 2], [3, 0]]),
+    # Boolean
+    ([[False, True], [False, False]], [[False, True], [True, False]], BOOLEAN, [[True, False], [False, False]]),
+    # Non-square
+    ([[1, 2, 3]], [[1], [1], [1]], MIN_PLUS, [[2]]),
+])
+def test_semiring_multiply(A, B, semiring, expected):
+    assert semiring_multiply(A, B, semiring) == expected
+
+def test_semiring_multiply_non_square():
+    A = [[(i * j) % 7 for j in range(70)] for i in range(3)]
+    B = [[(i + j) % 5 for j in range(150)] for i in range(70)]
+    expected = [[min(A[i][k] + B[k][j] for k in range(70)) for j in range(150)] for i in range(3)]
+    assert semiring_multiply(A, B) == expected
+
+def test_semiring_multiply_dimension_mismatch():
+    with pytest.raises(ValueError):
+        semiring_multiply([[1, 2]], [[1, 2]])
+
+def test_semiring_power():
+    A = [[inf, 1, inf], [inf, inf, 1], [1, inf, inf]]
+    assert semiring_power(A, 0) == [[0, inf, inf], [inf, 0, inf], [inf, inf, 0]]
+    assert semiring_power(A, 3) == [[3, inf, inf], [inf, 3, inf], [inf, inf, 3]]
+    assert semiring_power(A, 4) == semiring_multiply(A, semiring_power(A, 3))
+
+    with pytest.raises(ValueError):
+        semiring_power(A, -1)
+
+def test_transitive_closure():
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B'), ('B', 'C'), ('C', 'A')])
+    reachable = transitive_closure(graph)
+    assert all(reachable[u][v] for u in 'ABC' for v in 'ABC')
+    assert not any(reachable[u]['D'] for u in 'ABC')
+    assert reachable['D'] == {'A': False, 'B': False, 'C': False, 'D': True}
+
+@pytest.mark.parametrize("k, exact, expected", [
+    (0, False, {'A': 0, 'B': inf, 'C': inf, 'D': inf}),
+    (1, False, {'A': 0, 'B': 1, 'C': 10, 'D': inf}),
+    (2, False, {'A': 0, 'B': 1, 'C': 2, 'D': 11}),
+    (3, False, {'A': 0, 'B': 1, 'C': 2, 'D': 3}),
+    (2, True, {'A': inf, 'B': inf, 'C': 2, 'D': 11}),
+])
+def test_hop_limited_apsp(k, exact, expected):
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', 1), ('B', 'C', 1), ('A', 'C', 10), ('C', 'D', 1)])
+    assert hop_limited_apsp(graph, k, exact)['A'] == expected
+
+def test_hop_limited_longest_walks():
+    graph = Graph(['A', 'B', 'C'], [('A', 'B', 1), ('B', 'C', 1), ('A', 'C', 5)])
+    assert hop_limited_apsp(graph, 2, semiring=MAX_PLUS)['A']['C'] == 5
+
+def test_graph_to_matrix_edge_value():
+    # An equivalent boolean semiring built by the caller maps edges through its own edge_value
+    boolean = Semiring(lambda x, y: x or y, lambda x, y: x and y, False, True, edge_value=lambda weight: True)
+    graph = Graph(['A', 'B'], [('A', 'B', 0)])
+    assert graph_to_matrix(graph, boolean, include_identity=False) == [[False, True], [False, False]]
+    assert graph_to_matrix(graph, BOOLEAN) == [[True, True], [False, True]]
@@ -1,14 +1,15 @@
 import pytest
+import bellman_ford
 from graph import Graph
-from bellman_ford import bellman_ford_sssp
-from breadth_first_search import bfs_sssp
+from bellman_ford import bellman_ford_sssp, spfa_sssp, bellman_ford_edge_array_sssp, find_negative_cycle, NegativeCycleError
+from breadth_first_search import bfs_sssp, direction_optimizing_bfs_sssp
 from dijkstra import dijkstra_sssp
 from dag_shortest_path import dag_sssp
 
-unweighted_algorithms = [bellman_ford_sssp, bfs_sssp, dijkstra_sssp]
-positive_weight_algorithms = [bellman_ford_sssp, dijkstra_sssp]
-dag_algorithms = [bellman_ford_sssp, dag_sssp]
-negative_weight_sssp_algorithms = [bellman_ford_sssp]
+unweighted_algorithms = [bellman_ford_sssp, spfa_sssp, bellman_ford_edge_array_sssp, bfs_sssp, direction_optimizing_bfs_sssp, dijkstra_sssp]
+positive_weight_algorithms = [bellman_ford_sssp, spfa_sssp, bellman_ford_edge_array_sssp, dijkstra_sssp]
+dag_algorithms = [bellman_ford_sssp, spfa_sssp, bellman_ford_edge_array_sssp, dag_sssp]
+negative_weight_sssp_algorithms = [bellman_ford_sssp, spfa_sssp, bellman_ford_edge_array_sssp]
 
 unweighted_examples = [
     # Simple unweighted graph
@@ -90,3 +91,54 @@ def test_sssp_negative_cycle(algorithm, vertices, edges):
     graph = Graph(vertices, edges)
     with pytest.raises(ValueError, match='Graph contains a negative-weight cycle'):
         algorithm(graph, vertices[0])
+
+@pytest.fixture(params=['numpy', 'python'])
+def edge_array_kernel(request, monkeypatch):
+    """
+    Run bellman_ford_edge_array_sssp with the vectorised NumPy rounds and with the pure-Python fallback.
+    """
+    if request.param == 'python':
+        monkeypatch.setattr(bellman_ford, 'np', None)
+    return request.param
+
+def test_bellman_ford_edge_array_matches_bellman_ford(random_network, edge_array_kernel):
+    vertices, edges = random_network
+    # Only edges from lower to higher vertices, so negative weights cannot form a cycle
+    graph = Graph(vertices, [(u, v, w - 4) for u, v, w in edges if u < v])
+    dist, pred = bellman_ford_edge_array_sssp(graph, '0')
+    assert dist == bellman_ford_sssp(graph, '0')[0]
+    assert all(type(d) is int for d in dist.values() if d != float('inf'))
+    assert all(pred[v] is None or dist[pred[v]] + graph.edge_weight(pred[v], v) == dist[v] for v in vertices)
+
+@pytest.mark.parametrize("edges, source, expected_dist", [
+    # Undirected edges are relaxed in both directions
+    ([('A', 'B', 1)], 'B', {'A': 1, 'B': 0}),
+    # Float weights
+    ([('A', 'B', 0.5), ('B', 'C', 0.25)], 'C', {'A': 0.75, 'B': 0.25, 'C': 0}),
+])
+def test_bellman_ford_edge_array_undirected(edge_array_kernel, edges, source, expected_dist):
+    graph = Graph(sorted(expected_dist), edges, undirected=True)
+    dist, _ = bellman_ford_edge_array_sssp(graph, source)
+    assert dist == expected_dist
+
+def is_negative_cycle(graph, cycle):
+    edges = list(zip(cycle, cycle[1:] + cycle[:1]))
+    return len(set(cycle)) == len(cycle) and sum(graph.edge_weight(u, v) for u, v in edges) < 0
+
+@pytest.mark.parametrize("algorithm", negative_weight_sssp_algorithms)
+@pytest.mark.parametrize("vertices, edges", negative_weight_negative_cycle_examples)
+def test_sssp_negative_cycle_extraction(algorithm, vertices, edges):
+    graph = Graph(vertices, edges)
+    with pytest.raises(NegativeCycleError) as error:
+        algorithm(graph, vertices[0])
+    assert is_negative_cycle(graph, error.value.cycle)
+
+def test_find_negative_cycle():
+    # The negative cycle is not reachable from 'A'
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', 1), ('C', 'D', -3), ('D', 'C', 1)])
+    assert bellman_ford_sssp(graph, 'A')[0]['B'] == 1
+    assert sorted(find_negative_cycle(graph)) == ['C', 'D']
+    assert is_negative_cycle(graph, find_negative_cycle(graph))
+
+    graph = Graph(['A', 'B', 'C', 'D'], [('A', 'B', -1), ('B', 'C', -2), ('C', 'D', -3), ('D', 'A', 10)])
+    assert find_negative_cycle(graph) is None
@@ -1,5 +1,8 @@
+import itertools
+import random
 import pytest
-from two_sat import two_sat
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from two_sat import two_sat, two_sat_assignment, ImplicationGraph, literal, solve, read_dimacs, solve_many, IncrementalTwoSat
 
 @pytest.mark.parametrize("variables,clauses,is_satisfiable", [
     (['x', 'y', 'z'], [('x', 'y'), ('y', 'z'), ('z', '~x')], True),
@@ -7,4 +10,96 @@ from two_sat import two_sat
     # Add more test cases here
 ])
 def test_two_sat(variables, clauses, is_satisfiable):
-    assert is_satisfiable == two_sat(variables, clauses)
\ No newline at end of file
+    assert is_satisfiable == two_sat(variables, clauses)
+
+def satisfies(assignment, clauses):
+    value = lambda name: not assignment[name[1:]] if name[0] == '~' else assignment[name]
+    return all(value(a) or value(b) for a, b in clauses)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_two_sat_assignment_matches_brute_force(seed):
+    random.seed(seed)
+    variables = ['a', 'b', 'c', 'd', 'e']
+    names = variables + ['~' + v for v in variables]
+    clauses = [(random.choice(names), random.choice(names)) for _ in range(random.randint(1, 12))]
+
+    assignment = two_sat_assignment(variables, clauses, cnf=True)
+    expected = any(satisfies(dict(zip(variables, values)), clauses) for values in itertools.product([False, True], repeat=len(variables)))
+
+    assert (assignment is not None) == expected
+    if assignment is not None:
+        assert satisfies(assignment, clauses)
+
+def test_implicative_form_includes_contrapositive():
+    # x => y together with ~y forces ~x
+    assignment = two_sat_assignment(['x', 'y'], [('x', 'y'), ('y', '~y')])
+    assert assignment == {'x': False, 'y': False}
+
+def test_solve_large_chain():
+    # x0 => x1 => ... => x(n-1) with x0 forced true and x(n-1) forced false is unsatisfiable, and satisfiable without the last unit clause
+    n = 100000
+    graph = ImplicationGraph()
+    for i in range(n - 1):
+        graph.add_implication(literal(i), literal(i + 1))
+    graph.add_clause(literal(0), literal(0))
+    assert solve(graph) == [True] * n
+
+    graph.add_clause(literal(n - 1, True), literal(n - 1, True))
+    assert solve(graph) is None
+
+def test_read_dimacs():
+    lines = ['c comment', 'p cnf 3 4', '1 2 0', '2', '3 0', '-1 0', '-3 0', '%', '0']
+    assert solve(read_dimacs(lines)) == [False, True, False]
+
+    # The same clauses plus 2 false is unsatisfiable
+    assert solve(read_dimacs(lines[:-2] + ['-2 0'])) is None
+
+    with pytest.raises(ValueError):
+        read_dimacs(['p cnf 3 1', '1 2 3 0'])
+
+@pytest.mark.parametrize("executor_class", [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_solve_many_keeps_input_order(executor_class):
+    random.seed(1)
+    instances, expected = [], []
+    for _ in range(30):
+        clauses = [' '.join(str(random.choice([-1, 1]) * random.randint(1, 4)) for _ in range(2)) + ' 0' for _ in range(8)]
+        instances.append(read_dimacs(['p cnf 4 8'] + clauses))
+        expected.append(solve(instances[-1]))
+
+    if executor_class is None:
+        results = solve_many(instances)
+    else:
+        with executor_class(max_workers=2) as executor:
+            results = solve_many(instances, executor, chunksize=4)
+
+    assert results == [(assignment is not None, assignment) for assignment in expected]
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_two_sat_matches_static_solver(seed):
+    random.seed(seed)
+    instance = IncrementalTwoSat(6)
+    clauses = []
+    saved = []
+
+    for _ in range(60):
+        action = random.random()
+        if action < 0.15:
+            instance.push()
+            saved.append(len(clauses))
+        elif action < 0.3 and saved:
+            instance.pop()
+            del clauses[saved.pop():]
+        else:
+            a, b = random.randrange(12), random.randrange(12)
+            instance.add_clause(a, b)
+            clauses.append((a, b))
+
+        graph = ImplicationGraph(6)
+        for a, b in clauses:
+            graph.add_clause(a, b)
+        expected = solve(graph)
+
+        assert instance.is_satisfiable() == (expected is not None)
+        assignment = instance.assignment()
+        if assignment is not None:
+            assert all(assignment[a >> 1] != bool(a & 1) or assignment[b >> 1] != bool(b & 1) for a, b in clauses)
@@ -1,5 +1,5 @@
 import pytest
-from union_find import UnionFind
+from union_find import UnionFind, RollbackUnionFind
 
 def test_make_set_and_find():
     uf = UnionFind()
@@ -67,3 +67,28 @@ def test_large_tree():
     for i in range(1, num_nodes):
         assert uf.find(elements[i]) == first_element_root
 
+def test_rollback_union_find():
+    uf = RollbackUnionFind()
+    for x in "abcd":
+        uf.make_set(x)
+    uf.union("a", "b")
+    state = (dict(uf.root), dict(uf.rank))
+
+    uf.checkpoint()
+    uf.union("c", "d")
+    uf.checkpoint()
+    uf.make_set("e")
+    uf.union("a", "c")
+    uf.union("e", "d")
+    assert uf.connected("b", "e")
+
+    uf.rollback()
+    assert uf.connected("c", "d") and not uf.connected("a", "c")
+    assert "e" not in uf.root
+
+    uf.rollback()
+    assert (uf.root, uf.rank) == state
+
+    with pytest.raises(IndexError):
+        uf.rollback()
+